@@ -0,0 +1,203 @@
+import datetime
+import logging
+import re
+import threading
+import time
+
+class DeadlineExceededError(Exception):
+    """O prazo da execução terminou antes de a loja ser concluída; ela deve ser adiada."""
+
+def parse_deadline(value, now=None):
+    """
+    Converte o prazo informado na linha de comando em um instante (segundos desde a época).
+
+    Aceita uma duração ('90m', '2h', '1h30m', '45s' ou só segundos, '3600') ou
+    um horário ('06:30'), que se refere à próxima ocorrência: '06:30' às 22h
+    é a manhã seguinte.
+
+    Args:
+        value (str): Prazo
+        now (datetime): Instante de referência (padrão: agora, horário local)
+
+    Returns:
+        float: Instante do prazo (time.time())
+
+    Raises:
+        ValueError: Se o formato não for reconhecido
+    """
+    value = value.strip().lower()
+    now = now or datetime.datetime.now()
+
+    clock = re.fullmatch(r"(\d{1,2}):(\d{2})", value)
+    if clock:
+        target = now.replace(hour=int(clock.group(1)), minute=int(clock.group(2)), second=0, microsecond=0)
+        if target <= now:
+            target += datetime.timedelta(days=1)
+        return target.timestamp()
+
+    if re.fullmatch(r"\d+(\.\d+)?", value):
+        return now.timestamp() + float(value)
+
+    parts = re.fullmatch(r"(?:(\d+)h)?(?:(\d+)m)?(?:(\d+)s)?", value)
+    if not parts or not any(parts.groups()):
+        raise ValueError(f"Prazo inválido: '{value}' (use, por exemplo, '90m', '2h', '3600' ou '06:30')")
+    hours, minutes, seconds = (int(group or 0) for group in parts.groups())
+    return now.timestamp() + hours * 3600 + minutes * 60 + seconds
+
+class StageLatencyTracker:
+    """
+    Médias móveis (EWMA) do custo de cada etapa do scraping, atualizadas a cada medição.
+
+    Etapas registradas pelo ScrapingService: 'search' (uma pesquisa), 'fetch'
+    (uma página), 'extract' (extração de uma página), 'pages' (páginas buscadas
+    por loja) e 'store' (tempo total de uma loja). Antes da primeira medição
+    vale a estimativa a priori.
+    """
+
+    PRIORS = {"search": 1.0, "fetch": 2.0, "extract": 0.2, "pages": 2.0, "store": 5.0}
+
+    def __init__(self, smoothing=0.3, priors=None):
+        """
+        Args:
+            smoothing (float): Peso de cada nova medição
+            priors (dict): Estimativas iniciais por etapa (substituem PRIORS)
+        """
+        self.smoothing = smoothing
+        self.priors = dict(self.PRIORS, **(priors or {}))
+        self._means = {}
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage, value):
+        with self._lock:
+            mean = self._means.get(stage)
+            self._means[stage] = value if mean is None else mean + self.smoothing * (value - mean)
+            self._counts[stage] = self._counts.get(stage, 0) + 1
+
+    def estimate(self, stage):
+        with self._lock:
+            return self._means.get(stage, self.priors.get(stage, 0.0))
+
+    def snapshot(self):
+        """Médias atuais (em ms para as etapas de tempo) e número de medições."""
+        with self._lock:
+            return {
+                stage: {
+                    "mean": round(mean, 2) if stage == "pages" else round(mean * 1000),
+                    "samples": self._counts[stage]
+                }
+                for stage, mean in self._means.items()
+            }
+
+class DeadlineScheduler:
+    """
+    Escolhe, em rodadas, as lojas que ainda cabem até o prazo da execução.
+
+    O custo de uma loja é estimado pelas médias do StageLatencyTracker:
+    pesquisas necessárias x latência da pesquisa + páginas por loja x (busca +
+    extração). O paralelismo efetivo (soma dos custos estimados / tempo real da
+    rodada) é medido a cada rodada, de forma que a estimativa vale tanto para a
+    execução sequencial quanto para o pipeline.
+
+    Enquanto o trabalho restante cabe no tempo, a ordem recebida (rendimento
+    esperado) é mantida. Quando não cabe mais, as lojas passam a ser escolhidas
+    pela razão rendimento / custo: as baratas e promissoras primeiro. Lojas que
+    sozinhas já não terminariam antes do prazo são descartadas (adiadas). Uma
+    margem de segurança fica reservada para gravar a saída.
+    """
+
+    def __init__(self, deadline, latency, safety_margin=60.0, smoothing=0.3):
+        """
+        Args:
+            deadline (float): Instante do prazo (time.time())
+            latency (StageLatencyTracker): Médias de latência das etapas
+            safety_margin (float): Segundos reservados antes do prazo para gravar os resultados
+            smoothing (float): Peso de cada rodada na média do paralelismo efetivo
+        """
+        self.deadline = deadline
+        self.latency = latency
+        self.safety_margin = safety_margin
+        self.smoothing = smoothing
+        self.speedup = 1.0
+        self.logger = logging.getLogger(__name__)
+        self.stats = {"rounds": 0, "tight_rounds": 0, "skipped": 0}
+
+    def remaining(self):
+        """Segundos disponíveis para processar lojas (descontada a margem de segurança)."""
+        return self.deadline - time.time() - self.safety_margin
+
+    def estimate(self, searches=1):
+        """
+        Estima o tempo de uma loja.
+
+        Args:
+            searches (int): Pesquisas que a loja ainda consome (0 se a pesquisa está em cache)
+
+        Returns:
+            float: Segundos estimados
+        """
+        per_page = self.latency.estimate("fetch") + self.latency.estimate("extract")
+        return searches * self.latency.estimate("search") + self.latency.estimate("pages") * per_page
+
+    def next_round(self, pending, scores, costs, limit):
+        """
+        Seleciona as lojas da próxima rodada.
+
+        Args:
+            pending (list): Pares (nome, link) ainda não processados, em ordem de rendimento esperado
+            scores (dict): Nome -> rendimento esperado (0 a 1)
+            costs (dict): Nome -> pesquisas necessárias
+            limit (int): Máximo de lojas na rodada
+
+        Returns:
+            tuple: (lojas da rodada, lojas descartadas por não caberem no prazo)
+        """
+        budget = self.remaining()
+        if budget <= 0:
+            return [], list(pending)
+
+        estimates = {name: self.estimate(costs.get(name, 1)) for name, _ in pending}
+        skipped = [store for store in pending if estimates[store[0]] > budget]
+        feasible = [store for store in pending if estimates[store[0]] <= budget]
+
+        self.stats["rounds"] += 1
+        self.stats["skipped"] += len(skipped)
+        if sum(estimates[name] for name, _ in feasible) / self.speedup <= budget:
+            return feasible[:limit], skipped
+
+        # Prazo apertado: maior rendimento por segundo primeiro, até preencher o tempo restante
+        self.stats["tight_rounds"] += 1
+        feasible.sort(key=lambda store: (-scores.get(store[0], 0.0) / max(estimates[store[0]], 1e-3),
+                                         estimates[store[0]]))
+        selected, planned = [], 0.0
+        for store in feasible:
+            if len(selected) >= limit:
+                break
+            cost = estimates[store[0]] / self.speedup
+            if planned + cost > budget:
+                continue
+            selected.append(store)
+            planned += cost
+
+        self.logger.info(
+            f"Prazo apertado ({budget:.0f}s restantes): {len(selected)} lojas escolhidas por rendimento/custo"
+        )
+        return selected, skipped
+
+    def record_round(self, stores, costs, elapsed):
+        """
+        Atualiza o paralelismo efetivo com o resultado de uma rodada.
+
+        Args:
+            stores (list): Nomes das lojas processadas na rodada
+            costs (dict): Nome -> pesquisas necessárias
+            elapsed (float): Duração real da rodada em segundos
+        """
+        if not stores or elapsed <= 0:
+            return
+        estimated = sum(self.estimate(costs.get(name, 1)) for name in stores)
+        observed = max(1.0, estimated / elapsed)
+        self.speedup += self.smoothing * (observed - self.speedup)
+
+    def snapshot(self):
+        return dict(self.stats, speedup=round(self.speedup, 2), remaining_seconds=round(self.remaining(), 1))
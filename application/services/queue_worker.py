@@ -0,0 +1,136 @@
+import logging
+import threading
+import time
+from infrastructure.search.quota_scheduler import QuotaExceededError
+from application.services.deadline_scheduler import DeadlineExceededError
+
+class QueueWorker:
+    """
+    Worker que retira lojas de uma WorkQueue e as processa com um ScrapingService.
+
+    As lojas são concedidas em grupos de `batch_size`, preparados de uma vez
+    (ScrapingService.prepare_batch). Enquanto o grupo é processado, uma thread
+    renova as concessões a cada `heartbeat_seconds`; uma concessão perdida
+    (vencida e repassada a outro worker) não é processada nem concluída aqui.
+    """
+
+    def __init__(self, scraping_service, work_queue, worker_id, batch_size=10, heartbeat_seconds=60,
+                 poll_seconds=0, on_result=None):
+        """
+        Args:
+            scraping_service (ScrapingService): Serviço de scraping
+            work_queue (WorkQueue): Fila compartilhada de lojas
+            worker_id (str): Identificador do worker nas concessões
+            batch_size (int): Lojas concedidas por vez
+            heartbeat_seconds (float): Intervalo entre renovações das concessões
+            poll_seconds (float): Se > 0, espera por lojas ainda concedidas a outros
+                                  workers (ou aguardando nova tentativa) em vez de encerrar
+            on_result (callable): Chamado com o resultado de cada loja concluída
+        """
+        self.scraping_service = scraping_service
+        self.work_queue = work_queue
+        self.worker_id = worker_id
+        self.batch_size = max(1, batch_size)
+        self.heartbeat_seconds = heartbeat_seconds
+        self.poll_seconds = poll_seconds
+        self.on_result = on_result
+        self.logger = logging.getLogger(__name__)
+
+        self._held = {}
+        self._held_lock = threading.Lock()
+        self.stats = {"completed": 0, "failed": 0, "lost": 0, "released": 0}
+
+    def run(self):
+        """
+        Processa lojas até a fila esvaziar ou a cota de pesquisas (ou o prazo da execução) acabar.
+
+        Returns:
+            dict: Estatísticas do worker ('completed', 'failed', 'lost', 'released')
+        """
+        stop = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat_loop, args=(stop,), name=f"heartbeat-{self.worker_id}", daemon=True)
+        heartbeat.start()
+
+        try:
+            while True:
+                leases = self.work_queue.lease(self.worker_id, limit=self.batch_size)
+                if not leases:
+                    if self.poll_seconds > 0 and self._has_outstanding_work():
+                        time.sleep(self.poll_seconds)
+                        continue
+                    break
+
+                if not self._process(leases):
+                    break
+        finally:
+            stop.set()
+            heartbeat.join()
+
+        self.logger.info(f"Worker '{self.worker_id}' encerrado: {self.stats}")
+        return dict(self.stats)
+
+    def _process(self, leases):
+        """Processa um grupo de concessões; retorna False se a cota de pesquisas ou o prazo acabou."""
+        with self._held_lock:
+            self._held = {lease.store_name: lease for lease in leases}
+
+        self.scraping_service.prepare_batch([(lease.store_name, lease.link) for lease in leases])
+
+        for i, lease in enumerate(leases):
+            if not self._is_held(lease):
+                self.stats["lost"] += 1
+                continue
+
+            try:
+                result = self.scraping_service.scrape_store(lease.store_name)
+            except (QuotaExceededError, DeadlineExceededError) as e:
+                self.logger.warning(f"{str(e)}. Devolvendo {len(leases) - i} lojas à fila")
+                for pending in leases[i:]:
+                    if self._drop(pending) and self.work_queue.release(pending):
+                        self.stats["released"] += 1
+                return False
+            except Exception as e:
+                self.logger.error(f"Erro ao processar '{lease.store_name}': {str(e)}")
+                if self._drop(lease) and self.work_queue.fail(lease, e):
+                    self.stats["failed"] += 1
+                continue
+
+            if self._drop(lease) and self.work_queue.complete(lease, result):
+                self.stats["completed"] += 1
+                if self.on_result is not None:
+                    self.on_result(result)
+            else:
+                self.stats["lost"] += 1
+
+        return True
+
+    def _is_held(self, lease):
+        with self._held_lock:
+            return lease.store_name in self._held
+
+    def _drop(self, lease):
+        """Para de renovar a concessão; retorna False se ela já tinha sido perdida."""
+        with self._held_lock:
+            return self._held.pop(lease.store_name, None) is not None
+
+    def _heartbeat_loop(self, stop):
+        while not stop.wait(self.heartbeat_seconds):
+            with self._held_lock:
+                held = list(self._held.values())
+            if not held:
+                continue
+
+            try:
+                renewed = {lease.store_name for lease in self.work_queue.heartbeat(held)}
+            except Exception as e:
+                self.logger.warning(f"Erro ao renovar concessões: {str(e)}")
+                continue
+
+            with self._held_lock:
+                for lease in held:
+                    if lease.store_name not in renewed:
+                        self._held.pop(lease.store_name, None)
+
+    def _has_outstanding_work(self):
+        counts = self.work_queue.counts()
+        return counts["pending"] + counts["leased"] > 0
@@ -0,0 +1,378 @@
+import logging
+import queue
+import threading
+import time
+from application.services.store_job import StoreJob
+from infrastructure.search.quota_scheduler import QuotaExceededError
+
+_STOP = object()
+
+class PipelineStage:
+    """
+    Etapa do pipeline: uma fila limitada e um grupo de workers dedicado.
+
+    Registra a profundidade da fila a cada entrada, o número de itens
+    processados e o tempo ocupado dos workers.
+    """
+
+    def __init__(self, name, workers, handler, capacity):
+        """
+        Args:
+            name (str): Nome da etapa (usado nas threads e métricas)
+            workers (int): Número de workers
+            handler (callable): Função chamada com cada item da fila
+            capacity (int): Capacidade da fila
+        """
+        self.name = name
+        self.workers = max(1, workers)
+        self.handler = handler
+        self.queue = queue.Queue(maxsize=capacity)
+        self.logger = logging.getLogger(__name__)
+
+        self._threads = []
+        self._lock = threading.Lock()
+        self._processed = 0
+        self._busy_seconds = 0.0
+        self._max_depth = 0
+        self._depth_total = 0
+        self._depth_samples = 0
+
+    def start(self):
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"pipeline-{self.name}-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def put(self, item):
+        """Enfileira um item, bloqueando enquanto a fila estiver cheia."""
+        self.queue.put(item)
+        depth = self.queue.qsize()
+        with self._lock:
+            self._max_depth = max(self._max_depth, depth)
+            self._depth_total += depth
+            self._depth_samples += 1
+
+    def stop(self, timeout=None):
+        """
+        Encerra os workers depois que a fila esvaziar.
+
+        Args:
+            timeout (float): Espera máxima por worker; workers presos em lojas
+                abandonadas pelo watchdog não impedem o fim do pipeline
+        """
+        for _ in self._threads:
+            self.queue.put(_STOP)
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def _work(self):
+        while True:
+            item = self.queue.get()
+            if item is _STOP:
+                return
+
+            started = time.monotonic()
+            try:
+                self.handler(item)
+            except Exception as e:
+                self.logger.error(f"Erro inesperado na etapa '{self.name}': {str(e)}")
+            finally:
+                with self._lock:
+                    self._processed += 1
+                    self._busy_seconds += time.monotonic() - started
+
+    def metrics(self, elapsed):
+        """
+        Retorna as métricas da etapa.
+
+        Args:
+            elapsed (float): Duração total do pipeline, para calcular a utilização
+        """
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "processed": self._processed,
+                "busy_seconds": round(self._busy_seconds, 2),
+                "utilization": round(self._busy_seconds / (self.workers * elapsed), 3) if elapsed else 0.0,
+                "max_queue_depth": self._max_depth,
+                "mean_queue_depth": round(self._depth_total / self._depth_samples, 2) if self._depth_samples else 0.0
+            }
+
+class ScrapingPipeline:
+    """
+    Orquestra o scraping em etapas ligadas por filas limitadas:
+    pesquisa → busca → extração (parse + contatos) → persistência.
+
+    Cada etapa tem seu próprio grupo de workers, dimensionado para o recurso
+    que usa (API de pesquisa, rede, CPU, disco), e as lojas de etapas
+    diferentes avançam ao mesmo tempo. As páginas de uma mesma loja continuam
+    sendo buscadas uma de cada vez, para respeitar a política de suficiência;
+    quantas buscas ficam em andamento ao mesmo tempo é decidido pelo controle
+    de concorrência do HtmlFetcher.
+
+    O número de lojas em andamento é limitado por `max_in_flight`: a admissão
+    de novas lojas bloqueia quando o limite é atingido (contrapressão sobre o
+    produtor). Como nenhuma fila tem capacidade menor que esse limite, os
+    retornos entre etapas (extração → busca da próxima página, sites sem
+    contatos → pesquisa) nunca bloqueiam e o pipeline não entra em impasse.
+
+    Com o watchdog do ScrapingService, as lojas em andamento são vigiadas desde
+    o início: uma loja que passa do tempo limite (presa em um worker ou em uma
+    fila) é registrada como falha por tempo esgotado; o que ainda estiver em
+    andamento para ela é descartado ao chegar à persistência. Até lá, a loja
+    abandonada continua ocupando lugar nas filas. Por isso as filas comportam
+    também `max_abandoned` lojas abandonadas, cuja vaga é liberada no abandono
+    para que novas lojas sejam admitidas; além desse número, a vaga só é liberada
+    quando a loja abandonada sai do pipeline.
+    """
+
+    def __init__(self, scraping_service, config, on_result=None):
+        """
+        Args:
+            scraping_service (ScrapingService): Serviço cujos passos implementam as etapas
+            config (Settings): Configurações (seção 'pipeline')
+            on_result (callable): Chamado na etapa de persistência com cada resultado
+        """
+        self.service = scraping_service
+        self.config = config
+        self.on_result = on_result
+        self.logger = logging.getLogger(__name__)
+
+        self.max_in_flight = max(1, config.get("pipeline.max_in_flight", 16))
+        self.max_abandoned = 0
+        if scraping_service.watchdog is not None:
+            self.max_abandoned = max(0, config.get("pipeline.max_abandoned", self.max_in_flight))
+        capacity = self.max_in_flight + self.max_abandoned
+
+        self.stages = {
+            "search": PipelineStage("search", config.get("pipeline.search_workers", 2), self._search, capacity),
+            "fetch": PipelineStage("fetch", config.get("pipeline.fetch_workers", 8), self._fetch, capacity),
+            "extract": PipelineStage("extract", config.get("pipeline.extract_workers", 2), self._extract, capacity),
+            "persist": PipelineStage("persist", config.get("pipeline.persist_workers", 1), self._persist, capacity)
+        }
+
+        self._in_flight = threading.BoundedSemaphore(self.max_in_flight)
+        self._quota_exhausted = threading.Event()
+        self._results = {}
+        self._deferred = []
+        # Jobs abandonados ainda no pipeline -> se a vaga já foi liberada
+        self._abandoned = {}
+        self._lock = threading.Lock()
+        self._admission_wait = 0.0
+        self._elapsed = 0.0
+
+    def run(self, stores, batch_size=10):
+        """
+        Processa as lojas pelo pipeline.
+
+        Antes de admitir cada grupo de `batch_size` lojas, obtém seus sites sem
+        pesquisa e antecipa as pesquisas restantes (ScrapingService.prepare_batch).
+
+        Args:
+            stores (list): Pares (nome da loja, link da loja no Mercado Livre)
+            batch_size (int): Tamanho dos grupos preparados de uma vez
+
+        Returns:
+            tuple: (resultados na ordem das lojas, nomes das lojas adiadas por falta de cota)
+        """
+        started = time.monotonic()
+        watchdog = self.service.watchdog
+        if watchdog is not None:
+            watchdog.start(self._abandon)
+        for stage in self.stages.values():
+            stage.start()
+
+        admitted = []
+        for start in range(0, len(stores), batch_size):
+            if self._quota_exhausted.is_set():
+                break
+
+            group = stores[start:start + batch_size]
+            self.service.prepare_batch(group)
+
+            for name, _ in group:
+                if self._quota_exhausted.is_set():
+                    break
+
+                wait_started = time.monotonic()
+                self._in_flight.acquire()
+                self._admission_wait += time.monotonic() - wait_started
+
+                admitted.append(name)
+                self.stages["search"].put(name)
+
+        # Aguardar as lojas em andamento; lojas abandonadas que ainda ocupam vaga
+        # (presas em um worker) não seguram o fim do pipeline
+        acquired = 0
+        while acquired < self.max_in_flight:
+            if self._in_flight.acquire(timeout=watchdog.interval if watchdog is not None else None):
+                acquired += 1
+                continue
+            with self._lock:
+                held = sum(1 for released in self._abandoned.values() if not released)
+            if held >= self.max_in_flight - acquired:
+                break
+
+        for name in ("search", "fetch", "extract", "persist"):
+            self.stages[name].stop(watchdog.grace if watchdog is not None else None)
+        if watchdog is not None:
+            watchdog.stop()
+        self._elapsed = time.monotonic() - started
+
+        # Resultados e lojas adiadas na ordem de entrada, independente da ordem de conclusão
+        admitted_set = set(admitted)
+        deferred_set = set(self._deferred)
+        deferred = [name for name, _ in stores if name in deferred_set or name not in admitted_set]
+        results = [self._results[name] for name in admitted if name not in deferred_set and name in self._results]
+
+        self.logger.info(
+            f"Pipeline concluído em {self._elapsed:.1f}s: {len(results)} lojas processadas, {len(deferred)} adiadas"
+        )
+        return results, deferred
+
+    def get_metrics(self):
+        """Retorna as métricas por etapa e o tempo de espera na admissão."""
+        return {
+            "elapsed_seconds": round(self._elapsed, 2),
+            "admission_wait_seconds": round(self._admission_wait, 2),
+            "stages": {name: stage.metrics(self._elapsed) for name, stage in self.stages.items()}
+        }
+
+    def _route(self, job):
+        """Encaminha a loja para a etapa correspondente ao seu estado."""
+        if job.done:
+            self.stages["persist"].put(job)
+        elif job.needs_search:
+            self.stages["search"].put(job)
+        else:
+            self.stages["fetch"].put(job)
+
+    def _fail(self, job, error):
+        self.logger.error(f"Erro ao processar '{job.store_name}': {str(error)}")
+        job.fail(str(error))
+        self.stages["persist"].put(job)
+
+    def _search(self, item):
+        # Lojas novas chegam pelo nome; lojas que esgotaram os sites voltam como StoreJob
+        job = item
+        if isinstance(item, str):
+            # Se a loja não chega a começar, um job mínimo leva a falha à persistência
+            # (diário e saídas), como qualquer outra loja concluída com erro
+            job = StoreJob(item)
+            try:
+                job = self.service.begin_store(item, job)
+                if self.service.watchdog is not None:
+                    self.service.watchdog.watch(job, job.started_at)
+            except Exception as e:
+                self._fail(job, e)
+                return
+
+        if job.needs_search:
+            if self._quota_exhausted.is_set():
+                job.deferred = True
+                job.phase = "done"
+            else:
+                try:
+                    self.service.run_search(job)
+                except QuotaExceededError as e:
+                    self.logger.warning(f"{str(e)}. Adiando '{job.store_name}' e as lojas ainda não admitidas")
+                    self._quota_exhausted.set()
+                    job.deferred = True
+                    job.phase = "done"
+                except Exception as e:
+                    self._fail(job, e)
+                    return
+
+        try:
+            self._route(job)
+        except Exception as e:
+            self._fail(job, e)
+
+    def _fetch(self, job):
+        # Toda falha precisa levar a loja à persistência: uma exceção que escapasse
+        # seria descartada pelo worker e a vaga da loja nunca seria liberada
+        try:
+            url = self.service.next_fetch(job)
+            if url is None:
+                self._route(job)
+                return
+
+            html_content, contacts = self.service.fetch_page(job, url)
+            if html_content is None:
+                self.service.record_page(job, contacts)
+                self._route(job)
+            else:
+                self.stages["extract"].put((job, url, html_content))
+        except Exception as e:
+            self._fail(job, e)
+
+    def _extract(self, item):
+        job, url, html_content = item
+        try:
+            contacts = self.service.extract_page(job, url, html_content)
+            self.service.record_page(job, contacts)
+            self._route(job)
+        except Exception as e:
+            self._fail(job, e)
+
+    def _settle(self, job):
+        """Reserva a conclusão da loja; False se ela já foi concluída (ex.: abandonada pelo watchdog)."""
+        with self._lock:
+            if job.settled:
+                return False
+            job.settled = True
+        if self.service.watchdog is not None:
+            self.service.watchdog.unwatch(job)
+        return True
+
+    def _abandon(self, job):
+        """
+        Conclui como falha por tempo esgotado a loja que passou do limite do watchdog.
+
+        A vaga da loja é liberada enquanto houver lugar nas filas para as lojas
+        abandonadas que ainda não saíram do pipeline; caso contrário, fica com a
+        loja até ela chegar à persistência (`_leave`).
+        """
+        if not self._settle(job):
+            return
+        self.logger.error(f"'{job.store_name}' passou do tempo limite; abandonada pelo watchdog")
+        with self._lock:
+            released = sum(1 for value in self._abandoned.values() if value) < self.max_abandoned
+            self._abandoned[job] = released
+        try:
+            result = self.service.abandon_store(job)
+            with self._lock:
+                self._results[job.store_name] = result
+            if self.on_result is not None:
+                self.on_result(result)
+        finally:
+            if released:
+                self._in_flight.release()
+
+    def _leave(self, job):
+        """Registra a saída de uma loja abandonada do pipeline, liberando a vaga que ela ainda ocupava."""
+        with self._lock:
+            released = self._abandoned.pop(job, True)
+        if not released:
+            self._in_flight.release()
+
+    def _persist(self, job):
+        if not self._settle(job):
+            self._leave(job)
+            return
+        try:
+            if job.deferred:
+                with self._lock:
+                    self._deferred.append(job.store_name)
+                return
+
+            result = self.service.finish_store(job)
+            with self._lock:
+                self._results[job.store_name] = result
+
+            if self.on_result is not None:
+                self.on_result(result)
+        except Exception as e:
+            self.logger.error(f"Erro ao persistir '{job.store_name}': {str(e)}")
+        finally:
+            self._in_flight.release()
@@ -1,42 +1,25 @@
-<<<<<<< HEAD
-# Importação das bibliotecas necessárias
-# logging: Para registrar informações e erros durante a execução
-# time: Para adicionar delays entre as requisições
-# random: Para gerar números aleatórios usados nos delays
-=======
->>>>>>> origin/main
 import logging
 import time
-import random
+import datetime
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit
+from application.services.store_job import StoreJob
+from application.services.deadline_scheduler import StageLatencyTracker, DeadlineExceededError
+from domain.services.relevance_scoring import RelevanceScorer
+from domain.services.sufficiency_policy import SufficiencyPolicy
+from infrastructure.index.domain_trie import DomainTrie, DEFAULT_DOMAIN_CLASSES, default_domain_trie
+from infrastructure.index.simhash_index import SimHashIndex, html_fingerprint
+from infrastructure.web.url_result_cache import UrlResultCache
+from infrastructure.search.quota_scheduler import QuotaExceededError
 
 class ScrapingService:
-<<<<<<< HEAD
-    """
-    Serviço principal que coordena todo o processo de scraping (extração de dados)
-    
-    Esta classe é responsável por:
-    1. Coordenar a busca de lojas no Google
-    2. Extrair informações de contato das páginas
-    3. Gerenciar delays adaptativos para evitar bloqueios
-    4. Armazenar os resultados encontrados
-    """
-    
-    def __init__(self, search_service, html_fetcher, contact_extractor, store_repository, config):
-        """
-        Inicializa o serviço com todas as dependências necessárias
-        
-        Parâmetros:
-        - search_service: Serviço para fazer buscas no Google
-        - html_fetcher: Serviço para baixar e processar páginas HTML
-        - contact_extractor: Serviço para extrair contatos do texto
-        - store_repository: Repositório para salvar dados das lojas
-        - config: Configurações do sistema
-        """
-=======
     """Serviço que coordena o processo de scraping."""
     
-    def __init__(self, search_service, html_fetcher, contact_extractor, store_repository, config):
->>>>>>> origin/main
+    def __init__(self, search_service, html_fetcher, contact_extractor, store_repository, config,
+                 url_index=None, page_index=None, url_cache=None, domain_resolver=None, store_page_miner=None,
+                 relevance_scorer=None, sufficiency_policy=None, watchdog=None):
         self.search_service = search_service
         self.html_fetcher = html_fetcher
         self.contact_extractor = contact_extractor
@@ -44,220 +27,766 @@ class ScrapingService:
         self.config = config
         self.logger = logging.getLogger(__name__)
         
-<<<<<<< HEAD
-        # Contadores para ajustar os delays de forma inteligente
-        # Quanto mais sucessos, menor o delay; quanto mais erros, maior o delay
-        self.success_count = 0  # Conta quantas extrações foram bem-sucedidas
-        self.error_count = 0    # Conta quantos erros ocorreram
-    
-    def scrape_store(self, store_name):
-        """
-        Executa o processo completo de scraping para uma loja específica
+        # Índice de URLs já visitadas (URL normalizada -> loja que a visitou primeiro)
+        self.url_index = url_index if url_index is not None else {}
         
-        O processo inclui:
-        1. Buscar a loja no Google
-        2. Processar os primeiros resultados encontrados
-        3. Extrair contatos de cada página
-        4. Combinar todos os contatos encontrados
+        # Índice SimHash de páginas já extraídas, para detectar quase duplicatas
+        self.page_index = page_index if page_index is not None else SimHashIndex(
+            max_distance=config.get("dedup.max_distance", 3)
+        )
+        self.near_duplicate_policy = config.get("dedup.near_duplicate_policy", "skip")
         
-        Parâmetros:
-            store_name (str): Nome da loja para buscar
-            
-        Retorna:
-            dict: Dicionário com os resultados do scraping:
-                - success: True/False indicando se teve sucesso
-                - nome_loja: Nome da loja processada
-                - contacts: Contatos encontrados (se success=True)
-                - error: Mensagem de erro (se success=False)
-=======
-        # Contador para ajuste adaptativo de delays
-        self.success_count = 0
-        self.error_count = 0
+        # Cache de resultados por URL da execução (compartilhado entre lojas)
+        self.url_cache = url_cache if url_cache is not None else UrlResultCache()
+        
+        # Pontuação de relevância dos resultados de pesquisa, calculada antes de qualquer busca
+        if relevance_scorer is None and config.get("relevance.enabled", True):
+            relevance_scorer = RelevanceScorer(threshold=config.get("relevance.threshold", 0.3))
+        self.relevance_scorer = relevance_scorer
+        
+        # Política de suficiência: para de buscar páginas da loja quando os contatos já bastam
+        if sufficiency_policy is None and config.get("sufficiency.enabled", True):
+            sufficiency_policy = SufficiencyPolicy(
+                require=config.get("sufficiency.require", ["emails", "phones"]),
+                min_social_profiles=config.get("sufficiency.min_social_profiles", 1)
+            )
+        self.sufficiency_policy = sufficiency_policy
+        
+        # Classificação de domínios conhecidos (marketplaces, redes sociais,
+        # portais de notícia, sites de avaliação) e política por classe
+        self.domain_trie = self._build_domain_trie(config) if config.get("domain_classes.enabled", True) else None
+        self.domain_policies = config.get("domain_classes.policies", {})
+        
+        # Resultados de pesquisa antecipados por search_many (loja -> resultados)
+        self._prefetched_search = {}
+        
+        # Sites da loja obtidos sem pesquisa: links da página da loja no Mercado
+        # Livre ou domínio adivinhado pelo slug (loja -> {'source', 'urls', 'social'})
+        self.store_page_miner = store_page_miner
+        self.domain_resolver = domain_resolver
+        self._seed_sites = {}
+        
+        # Estatísticas da execução
+        self.stats = {
+            "repeated_urls": 0,
+            "near_duplicates_reused": 0,
+            "near_duplicates_skipped": 0,
+            "shared_urls_skipped": 0,
+            "store_pages_used": 0,
+            "guessed_sites_used": 0,
+            "searches_skipped": 0,
+            "irrelevant_results_skipped": 0,
+            "domain_classes": {},
+            "early_stops": 0,
+            "fetches_saved": 0,
+            "seconds_saved": 0.0,
+            "deadline_partial": 0,
+            "deadline_deferred": 0,
+            "store_timeouts": 0,
+            "store_timeouts_partial": 0
+        }
+        
+        # Tempo total das buscas de página, para estimar o tempo economizado
+        self._fetch_seconds = 0.0
+        self._fetch_count = 0
+        self._stats_lock = threading.Lock()
+        
+        # Latência média de cada etapa (usada para estimar o custo das lojas até o prazo)
+        # e instante (time.time()) a partir do qual nenhuma loja começa etapas novas: o prazo
+        # da execução menos a margem reservada para gravar os resultados
+        self.latency = StageLatencyTracker(smoothing=config.get("deadline.smoothing", 0.3))
+        self.deadline = None
+        if config.get("deadline.at") is not None:
+            self.deadline = config.get("deadline.at") - config.get("deadline.safety_margin_seconds", 60)
+        
+        # Tempo limite de cada loja, respeitado pela pesquisa e pela busca de páginas; o
+        # watchdog abandona as lojas presas além dele (ex.: uma chamada que não retorna)
+        self.store_timeout = config.get("scraping.store_timeout", 90)
+        self.watchdog = watchdog
     
     def scrape_store(self, store_name):
         """
         Executa o processo completo de scraping para uma loja.
         
+        Com watchdog, a loja é executada sob sua vigilância: se ficar presa além
+        do tempo limite, é abandonada e registrada como falha por tempo esgotado.
+        
         Args:
             store_name (str): Nome da loja
             
         Returns:
             dict: Resultados do scraping
->>>>>>> origin/main
+            
+        Raises:
+            QuotaExceededError: Se a cota de pesquisas acabou; a loja deve ser
+                adiada para a próxima janela em vez de registrada como falha
+            DeadlineExceededError: Se o prazo da execução terminou antes de a
+                loja reunir algum contato; a loja também deve ser adiada
         """
+        job = StoreJob(store_name)
+        if self.watchdog is None:
+            return self._scrape_store(job)
+        return self.watchdog.call(
+            store_name, lambda: self._scrape_store(job), lambda: self.abandon_store(job)
+        )
+    
+    def _scrape_store(self, job):
+        store_name = job.store_name
         try:
-            self.logger.info(f"Iniciando scraping da loja: {store_name}")
-            
-<<<<<<< HEAD
-            # Primeiro passo: Pesquisar a loja no Google
-            # Isso retorna uma lista de URLs relacionadas à loja
-            search_results = self.search_service.search_store_contacts(store_name)
-            
-            # Se não encontrou nenhum resultado, registra o erro
-=======
-            # Pesquisar loja no Google
-            search_results = self.search_service.search_store_contacts(store_name)
-            
->>>>>>> origin/main
-            if not search_results:
-                self.logger.warning(f"Nenhum resultado encontrado para '{store_name}'")
-                self.error_count += 1
-                return {
-                    'success': False,
-                    'nome_loja': store_name,
-                    'error': "Nenhum resultado de pesquisa encontrado"
-                }
+            job = self.begin_store(store_name, job)
             
-<<<<<<< HEAD
-            # Lista para armazenar todos os contatos encontrados
-            # em diferentes páginas
-            all_contacts = []
-            
-            # Processa apenas os 2 primeiros resultados do Google
-            # para não sobrecarregar os servidores
-            for i, result in enumerate(search_results[:2]):
-                # Adiciona um delay entre as requisições para evitar bloqueios
-                if i > 0:
-=======
-            # Processar os primeiros resultados
-            all_contacts = []
-            
-            for i, result in enumerate(search_results[:2]):  # Processar os 2 primeiros resultados
-                if i > 0:
-                    # Adicionar delay entre requisições
->>>>>>> origin/main
-                    delay = self._get_adaptive_delay()
-                    self.logger.info(f"Aguardando {delay:.2f}s antes de processar próximo resultado...")
-                    time.sleep(delay)
-                
-<<<<<<< HEAD
-                # Pega a URL do resultado
-=======
->>>>>>> origin/main
-                url = result.get('link')
-                if not url:
+            while not job.done:
+                if job.needs_search:
+                    self.run_search(job)
                     continue
                 
-                self.logger.info(f"Processando resultado {i+1}: {url}")
-                
-<<<<<<< HEAD
-                # Baixa o conteúdo da página
-=======
-                # Buscar conteúdo HTML
->>>>>>> origin/main
-                html_content = self.html_fetcher.fetch(url)
-                
-                if not html_content:
+                url = self.next_fetch(job)
+                if url is None:
                     continue
                 
-<<<<<<< HEAD
-                # Extrai apenas o texto útil do HTML
-                # removendo códigos e scripts
-                html_text = self.html_fetcher.extract_text(html_content)
-                
-                # Procura por contatos no texto extraído
-                contacts = self.contact_extractor.execute(html_text, url, store_name)
-                all_contacts.append(contacts)
+                contacts = self._process_url(url, store_name, job.deadline)
+                self.record_page(job, contacts)
             
-            # Se não conseguiu encontrar nenhum contato
-            # em nenhuma das páginas, registra o erro
-=======
-                # Extrair texto do HTML
-                html_text = self.html_fetcher.extract_text(html_content)
-                
-                # Extrair contatos
-                contacts = self.contact_extractor.execute(html_text, url, store_name)
-                all_contacts.append(contacts)
+            if job.deferred:
+                raise DeadlineExceededError(f"Prazo da execução esgotado antes de concluir '{store_name}'")
+            return self.finish_store(job)
             
-            # Se não encontrou contatos
->>>>>>> origin/main
-            if not all_contacts:
-                self.error_count += 1
-                return {
-                    'success': False,
-                    'nome_loja': store_name,
-                    'error': "Não foi possível extrair contatos"
-                }
-            
-<<<<<<< HEAD
-            # Combina todos os contatos encontrados em diferentes páginas
-            # removendo duplicatas e organizando as informações
-=======
-            # Mesclar contatos encontrados em diferentes resultados
->>>>>>> origin/main
-            final_contacts = all_contacts[0]
-            for contact in all_contacts[1:]:
-                final_contacts.merge(contact)
-            
-<<<<<<< HEAD
-            # Atualiza os contadores de sucesso/erro
-            # Isso ajuda a ajustar os delays futuros
-            self.success_count += 1
-            self.error_count = max(0, self.error_count - 0.5)  # Reduz gradualmente os erros com sucessos
+        except (QuotaExceededError, DeadlineExceededError):
+            raise
             
-            # Retorna os resultados encontrados
-=======
-            self.success_count += 1
-            self.error_count = max(0, self.error_count - 0.5)  # Reduz gradualmente os erros com sucessos
+        except Exception as e:
+            self.logger.error(f"Erro ao processar '{store_name}': {str(e)}")
             
->>>>>>> origin/main
             return {
-                'success': True,
+                'success': False,
                 'nome_loja': store_name,
-                'contacts': final_contacts
+                'error': str(e),
+                'scrapingTime': datetime.datetime.now().isoformat()
             }
+    
+    def abandon_store(self, job):
+        """
+        Registra a loja abandonada pelo watchdog; o trabalho que ainda estiver em
+        andamento para ela é encerrado na próxima etapa, sem produzir resultado.
+        
+        A marca fica no StoreJob abandonado, e não no nome da loja: uma nova
+        tentativa da mesma loja (retentativa da fila, reenfileiramento,
+        passada incremental) começa com outro job e é processada normalmente.
+        
+        Args:
+            job (StoreJob): Estado da loja abandonada
+        
+        Returns:
+            dict: Resultado de falha por tempo esgotado
+        """
+        job.abandoned = True
+        with self._stats_lock:
+            self.stats["store_timeouts"] += 1
+        return {
+            'success': False,
+            'nome_loja': job.store_name,
+            'error': "Loja abandonada pelo watchdog (tempo limite esgotado)",
+            'timedOut': True,
+            'scrapingTime': datetime.datetime.now().isoformat()
+        }
+    
+    def begin_store(self, store_name, job=None):
+        """
+        Inicia o scraping de uma loja, começando pelos sites obtidos sem pesquisa, se houver.
+        
+        Args:
+            store_name (str): Nome da loja
+            job (StoreJob): Estado já criado pelo chamador (ex.: para o watchdog); se None, cria um novo
+        
+        Returns:
+            StoreJob: Estado da loja
+        """
+        self.logger.info(f"Iniciando scraping da loja: {store_name}")
+        if job is None:
+            job = StoreJob(store_name)
+        if self.store_timeout:
+            job.deadline = job.started_at + self.store_timeout
+        
+        seed = self._seed_sites.pop(store_name, None)
+        if seed:
+            job.seed = seed
+            if seed["social"]:
+                job.seed_social = self.contact_extractor.execute(" ".join(seed["social"]), seed["page"], store_name)
+            if seed["urls"]:
+                job.start_phase("seed", [{'link': url} for url in seed["urls"]])
+        
+        return job
+    
+    def run_search(self, job):
+        """
+        Pesquisa a loja (ou usa a pesquisa antecipada em lote) e prepara os resultados relevantes.
+        
+        Raises:
+            QuotaExceededError: Se a cota de pesquisas acabou
+        """
+        if self._stop_at_deadline(job):
+            return
+        
+        store_name = job.store_name
+        if store_name in self._prefetched_search:
+            search_results = self._prefetched_search.pop(store_name)
+        else:
+            started = time.monotonic()
+            search_results = self.search_service.search_store_contacts(store_name, deadline=job.deadline)
+            self.latency.observe("search", time.monotonic() - started)
+            if self._stop_at_deadline(job):
+                return
+        
+        has_seed_social = job.seed_social is not None and job.seed_social.has_contacts()
+        if not search_results and not has_seed_social:
+            self.logger.warning(f"Nenhum resultado encontrado para '{store_name}'")
+            job.fail("Nenhum resultado de pesquisa encontrado")
+            return
+        
+        # Descartar resultados que não pertencem à loja e buscar os mais relevantes primeiro
+        search_results = search_results or []
+        if self.relevance_scorer is not None and search_results:
+            search_results, skipped = self.relevance_scorer.rank(store_name, search_results)
+            if skipped:
+                self._count("irrelevant_results_skipped", skipped)
+                self.logger.info(f"{skipped} resultados irrelevantes ignorados para '{store_name}'")
+        
+        # Processar os 2 primeiros resultados que levam a páginas buscáveis
+        job.start_phase("search", search_results, max_fetches=2)
+    
+    def next_fetch(self, job):
+        """
+        Avança pelos resultados da fase atual até a próxima página a buscar.
+        
+        Resultados de domínios ignorados e perfis sociais (usados sem buscar a
+        página) são tratados aqui mesmo. Ao fim dos resultados, a fase é encerrada.
+        
+        Returns:
+            str: URL da próxima página a buscar ou None se a fase terminou
+        """
+        if self._stop_at_deadline(job):
+            return None
+        
+        while job.index < len(job.candidates):
+            if job.max_fetches is not None and job.fetches >= job.max_fetches:
+                break
             
-        except Exception as e:
-<<<<<<< HEAD
-            # Se ocorrer qualquer erro durante o processo
-            # registra no log e atualiza os contadores
-=======
->>>>>>> origin/main
-            self.logger.error(f"Erro ao processar '{store_name}': {str(e)}")
-            self.error_count += 1
-            self.success_count = max(0, self.success_count - 1)
+            position = job.index
+            job.index += 1
+            
+            url = job.candidates[position].get('link')
+            if not url:
+                continue
+            
+            policy = self._domain_policy(url)
+            if policy == "skip":
+                self.logger.info(f"Resultado {position+1} ignorado (domínio agregador): {url}")
+                continue
             
+            self.logger.info(f"Processando resultado {position+1}: {url}")
+            self._register_url(url, job.store_name)
+            
+            if policy != "social_only":
+                return url
+            
+            # O próprio link já identifica o perfil; a página não é buscada
+            contacts = self.contact_extractor.execute(url, url, job.store_name)
+            if contacts.has_contacts():
+                job.contacts.append(contacts)
+            if self._should_stop(job):
+                break
+        
+        self._end_phase(job)
+        return None
+    
+    def _stop_at_deadline(self, job):
+        """
+        Encerra a loja se o prazo da execução ou o tempo limite da loja terminou.
+        
+        Com contatos já reunidos, a loja é concluída com eles. Sem contatos, é
+        adiada se o prazo da execução terminou (para ser processada em uma
+        próxima execução) ou registrada como falha por tempo esgotado. Lojas
+        abandonadas pelo watchdog são só encerradas: o resultado já foi registrado.
+        
+        Returns:
+            bool: True se a loja foi encerrada
+        """
+        if job.abandoned:
+            job.fail("Loja abandonada pelo watchdog (tempo limite esgotado)")
+            return True
+        
+        run_expired = self.deadline is not None and time.time() >= self.deadline
+        store_expired = job.deadline is not None and time.monotonic() >= job.deadline
+        if not run_expired and not store_expired:
+            return False
+        
+        has_contacts = any(contacts.has_contacts() for contacts in job.contacts) or (
+            job.seed_social is not None and job.seed_social.has_contacts()
+        )
+        if run_expired:
+            if has_contacts:
+                job.contacts = [contacts for contacts in job.contacts if contacts.has_contacts()]
+                self._count("deadline_partial")
+                self.logger.info(f"Prazo esgotado; concluindo '{job.store_name}' com os contatos já reunidos")
+            else:
+                job.deferred = True
+                self._count("deadline_deferred")
+                self.logger.info(f"Prazo esgotado; adiando '{job.store_name}'")
+            job.phase = "done"
+            return True
+        
+        job.timed_out = True
+        if has_contacts:
+            job.contacts = [contacts for contacts in job.contacts if contacts.has_contacts()]
+            self._count("store_timeouts_partial")
+            self.logger.warning(
+                f"Tempo limite de {self.store_timeout}s esgotado; concluindo '{job.store_name}' com os contatos já reunidos"
+            )
+            job.phase = "done"
+        else:
+            self._count("store_timeouts")
+            self.logger.warning(f"Tempo limite de {self.store_timeout}s esgotado para '{job.store_name}'")
+            job.fail(f"Tempo limite da loja esgotado ({self.store_timeout}s)")
+        return True
+    
+    def record_page(self, job, contacts):
+        """Registra os contatos de uma página buscada e aplica a política de suficiência."""
+        job.fetches += 1
+        job.pages += 1
+        if contacts is not None:
+            job.contacts.append(contacts)
+        
+        if self._should_stop(job):
+            job.index = len(job.candidates)
+    
+    def _end_phase(self, job):
+        """Encerra a fase atual; sites sem contatos levam à pesquisa."""
+        if job.phase != "seed":
+            job.phase = "done"
+            return
+        
+        job.contacts = [contacts for contacts in job.contacts if contacts.has_contacts()]
+        if job.contacts:
+            self._count("store_pages_used" if job.seed["source"] == "store_page" else "guessed_sites_used")
+            self._count("searches_skipped")
+            self._prefetched_search.pop(job.store_name, None)
+            job.phase = "done"
+        else:
+            self.logger.info(f"Sites da loja sem contatos para '{job.store_name}'; recorrendo à pesquisa")
+            job.start_phase("search")
+    
+    def finish_store(self, job):
+        """
+        Monta o resultado da loja a partir dos contatos reunidos.
+        
+        Lojas encerradas pelo tempo limite levam 'timedOut' no resultado.
+        
+        Returns:
+            dict: Resultados do scraping
+        """
+        result = self._store_result(job)
+        if job.timed_out:
+            result['timedOut'] = True
+        return result
+    
+    def _store_result(self, job):
+        store_name = job.store_name
+        scraped_at = datetime.datetime.now().isoformat()
+        self.latency.observe("pages", job.pages)
+        self.latency.observe("store", time.monotonic() - job.started_at)
+        if job.error:
             return {
                 'success': False,
                 'nome_loja': store_name,
-                'error': str(e)
+                'error': job.error,
+                'scrapingTime': scraped_at
             }
+        
+        # Redes sociais listadas na página da loja no Mercado Livre
+        all_contacts = list(job.contacts)
+        if job.seed_social is not None and job.seed_social.has_contacts():
+            all_contacts.append(job.seed_social)
+        
+        # Se não encontrou contatos
+        if not all_contacts:
+            return {
+                'success': False,
+                'nome_loja': store_name,
+                'error': "Não foi possível extrair contatos",
+                'scrapingTime': scraped_at
+            }
+        
+        # Mesclar contatos encontrados em diferentes resultados
+        final_contacts = all_contacts[0]
+        for contact in all_contacts[1:]:
+            final_contacts.merge(contact)
+        
+        return {
+            'success': True,
+            'nome_loja': store_name,
+            'contacts': final_contacts,
+            'scrapingTime': scraped_at
+        }
     
-    def _get_adaptive_delay(self):
+    def _should_stop(self, job):
         """
-<<<<<<< HEAD
-        Calcula o tempo de espera entre requisições de forma inteligente
+        Aplica a política de suficiência aos contatos reunidos na fase atual.
         
-        O delay é ajustado com base em:
-        1. Quantidade de erros recentes (aumenta o delay)
-        2. Quantidade de sucessos recentes (diminui o delay)
-        3. Valor aleatório para evitar padrões detectáveis
+        Quando os contatos já bastam e ainda havia páginas a buscar, registra
+        quantas buscas e quantos segundos (pelo tempo médio de busca) foram
+        economizados.
         
-        Retorna:
-            float: Tempo de espera em segundos
+        Returns:
+            bool: True se os resultados restantes devem ser ignorados
         """
-        # Pega o delay base das configurações (padrão: 5 segundos)
-        base_delay = self.config.get("scraping.base_delay", 5)
+        remaining = len(job.candidates) - job.index
+        if job.max_fetches is not None:
+            remaining = min(remaining, job.max_fetches - job.fetches)
+        
+        if self.sufficiency_policy is None or remaining <= 0 or not job.contacts:
+            return False
+        if not self.sufficiency_policy.is_sufficient(job.contacts):
+            return False
         
-        # Se houver erros recentes, aumenta bastante o delay
-        # para dar tempo dos servidores "esfriarem"
-        if self.error_count > 0:
-            return base_delay + (self.error_count * 5) + random.uniform(1, 3)
+        with self._stats_lock:
+            average_fetch = self._fetch_seconds / self._fetch_count if self._fetch_count else 0.0
+        seconds_saved = remaining * average_fetch
         
-        # Para requisições normais, usa um delay moderado
-        # que vai diminuindo conforme temos mais sucessos
-=======
-        Calcula delay adaptativo baseado em sucessos e falhas.
+        with self._stats_lock:
+            self.stats["early_stops"] += 1
+            self.stats["fetches_saved"] += remaining
+            self.stats["seconds_saved"] = round(self.stats["seconds_saved"] + seconds_saved, 2)
+        self.logger.info(
+            f"Contatos suficientes para '{job.store_name}'; {remaining} buscas dispensadas (~{seconds_saved:.1f}s)"
+        )
+        return True
+    
+    def _count(self, key, amount=1):
+        """Incrementa uma estatística da execução (seguro entre threads)."""
+        with self._stats_lock:
+            self.stats[key] += amount
+    
+    @staticmethod
+    def _build_domain_trie(config):
+        """Usa a trie pré-computada, acrescida dos domínios extras configurados."""
+        extra = config.get("domain_classes.extra", {})
+        if not extra:
+            return default_domain_trie()
+        
+        domain_classes = {name: list(domains) for name, domains in DEFAULT_DOMAIN_CLASSES.items()}
+        for name, domains in extra.items():
+            domain_classes.setdefault(name, []).extend(domains)
+        return DomainTrie(domain_classes)
+    
+    def _domain_policy(self, url):
+        """
+        Classifica o domínio da URL e retorna a política da classe.
         
         Returns:
-            float: Tempo de delay em segundos
+            str: 'skip', 'social_only' ou None (processar normalmente)
+        """
+        if self.domain_trie is None:
+            return None
+        
+        domain_class = self.domain_trie.classify(urlsplit(url).hostname or "")
+        if domain_class is None:
+            return None
+        
+        with self._stats_lock:
+            self.stats["domain_classes"][domain_class] = self.stats["domain_classes"].get(domain_class, 0) + 1
+        return self.domain_policies.get(domain_class)
+    
+    def prepare_batch(self, stores):
+        """
+        Prepara um grupo de lojas antes do scraping: obtém seus sites sem pesquisa
+        (página da loja no Mercado Livre, depois slug) e antecipa as pesquisas
+        das lojas restantes.
+        
+        Args:
+            stores (list): Pares (nome da loja, link da loja no Mercado Livre)
+        """
+        self.mine_store_pages(stores)
+        self.resolve_official_sites(stores)
+        self.prefetch_searches([name for name, _ in stores])
+    
+    def resolve_official_sites(self, stores):
+        """
+        Adivinha, em paralelo, o site oficial de um grupo de lojas pelo slug do Mercado Livre.
+        
+        Lojas resolvidas tentam o site adivinhado antes de qualquer pesquisa.
+        
+        Args:
+            stores (list): Pares (nome da loja, link da loja no Mercado Livre)
+        """
+        if self.domain_resolver is None:
+            return
+        
+        links = {
+            name: link for name, link in stores
+            if link and not self._seed_sites.get(name, {}).get("urls")
+        }
+        if not links:
+            return
+        
+        resolved = self.domain_resolver.resolve_many(list(links.values()))
+        for name, link in links.items():
+            if link in resolved:
+                seed = self._seed_sites.setdefault(name, {"source": "domain_guess", "page": link, "social": []})
+                seed["source"] = "domain_guess"
+                seed["urls"] = [resolved[link]]
+    
+    def mine_store_pages(self, stores):
         """
-        base_delay = self.config.get("scraping.base_delay", 5)
+        Busca, em paralelo, as páginas das lojas no Mercado Livre e extrai seus links externos.
+        
+        Os links de site viram o ponto de partida da extração de contatos da
+        loja; os de redes sociais entram diretamente no resultado.
+        
+        Args:
+            stores (list): Pares (nome da loja, link da loja no Mercado Livre)
+        """
+        if self.store_page_miner is None:
+            return
+        
+        pending = [(name, link) for name, link in stores if link and name not in self._seed_sites]
+        if not pending:
+            return
+        
+        max_workers = self.config.get("store_pages.max_workers", 4)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="store-page") as executor:
+            mined = list(executor.map(lambda store: self.store_page_miner.mine(store[1], store[0]), pending))
         
-        # Aumentar delay substancialmente se houver erros
-        if self.error_count > 0:
-            return base_delay + (self.error_count * 5) + random.uniform(1, 3)
+        for (name, link), links in zip(pending, mined):
+            if links["sites"] or links["social"]:
+                self._seed_sites[name] = {
+                    "source": "store_page",
+                    "page": link,
+                    "urls": links["sites"],
+                    "social": links["social"]
+                }
+    
+    def prefetch_searches(self, store_names):
+        """
+        Antecipa as pesquisas de um grupo de lojas em uma única rodada agrupada.
+        
+        Lojas sem resultado antecipado (ex.: falha ou cota esgotada) voltam a
+        ser pesquisadas individualmente em scrape_store.
+        
+        Args:
+            store_names (list): Nomes das lojas do próximo grupo
+        """
+        pending = [
+            name for name in store_names
+            if name not in self._prefetched_search and not self._seed_sites.get(name, {}).get("urls")
+        ]
+        if not pending or not hasattr(self.search_service, "search_many"):
+            return
+        
+        started = time.monotonic()
+        self._prefetched_search.update(self.search_service.search_many(
+            pending,
+            max_results=3,
+            batch_size=self.config.get("search.batch_size", 10),
+            max_workers=self.config.get("search.max_workers", 4)
+        ))
+        # Custo de pesquisa por loja, já com o ganho das pesquisas em lote
+        self.latency.observe("search", (time.monotonic() - started) / len(pending))
+    
+    def _process_url(self, url, store_name, deadline=None):
+        """
+        Obtém os contatos de uma URL pelo cache da execução, buscando-a só uma vez.
+        
+        Args:
+            deadline (float): Instante limite (time.monotonic()) para buscar a página
         
-        # Delay moderado para requisições bem-sucedidas
->>>>>>> origin/main
-        return base_delay + random.uniform(1, 3) - min(2, self.success_count * 0.1)
+        Returns:
+            ContactInfo: Contatos da URL ou None se não houver contatos aproveitáveis
+        """
+        key = self._normalize_url(url)
+        result, origin = self.url_cache.get_or_load(
+            key, lambda: self._fetch_and_extract(url, store_name, deadline)
+        )
+        return self._contacts_from_result(result, origin, url, store_name)
+    
+    def _contacts_from_result(self, result, origin, url, store_name):
+        """
+        Aplica a política de reaproveitamento a um resultado do cache de URLs.
+        
+        Resultados obtidos para outra loja seguem a mesma política das páginas
+        quase duplicadas: são ignorados, a menos que a política seja 'reuse'.
+        """
+        if origin == "miss" or result["contacts"] is None:
+            return result["contacts"]
+        
+        if result["store_name"] != store_name and self.near_duplicate_policy != "reuse":
+            self._count("shared_urls_skipped")
+            self.logger.info(f"URL já processada para a loja '{result['store_name']}'; ignorada: {url}")
+            return None
+        
+        self.logger.info(f"Reutilizando resultado em cache para {url}")
+        return copy.deepcopy(result["contacts"])
+    
+    def _fetch_and_extract(self, url, store_name, deadline=None):
+        """
+        Busca a URL e extrai seus contatos.
+        
+        Returns:
+            dict: Resultado com status ('ok', 'fetch_failed' ou 'skipped'),
+                  loja que originou a busca e contatos
+        """
+        html_content = self._fetch_html(url, deadline)
+        if not html_content:
+            return self._page_result(store_name, None, "fetch_failed")
+        
+        started = time.monotonic()
+        contacts = self._extract_page_contacts(html_content, url, store_name)
+        self.latency.observe("extract", time.monotonic() - started)
+        return self._page_result(store_name, contacts)
+    
+    def fetch_page(self, job, url):
+        """
+        Etapa de busca de uma página, separada da extração (usada pelo pipeline).
+        
+        URLs já resolvidas no cache da execução não são buscadas de novo. Se a
+        página precisa ser buscada, a URL fica reservada no cache até
+        `extract_page` concluir a extração.
+        
+        Returns:
+            tuple: (HTML a extrair, None) ou (None, contatos já resolvidos ou None)
+        """
+        key = self._normalize_url(url)
+        origin, value = self.url_cache.claim(key)
+        if origin == "hit":
+            return None, self._contacts_from_result(value, origin, url, job.store_name)
+        if origin == "coalesced":
+            return None, self._contacts_from_result(value.result(), origin, url, job.store_name)
+        
+        try:
+            html_content = self._fetch_html(url, job.deadline)
+        except BaseException as e:
+            self.url_cache.fail(key, e)
+            raise
+        
+        if not html_content:
+            self.url_cache.complete(key, self._page_result(job.store_name, None, "fetch_failed"))
+            return None, None
+        return html_content, None
+    
+    def extract_page(self, job, url, html_content):
+        """
+        Etapa de extração de uma página buscada por `fetch_page` (usada pelo pipeline).
+        
+        Returns:
+            ContactInfo: Contatos da página ou None se foi ignorada
+        """
+        key = self._normalize_url(url)
+        started = time.monotonic()
+        try:
+            contacts = self._extract_page_contacts(html_content, url, job.store_name)
+            self.latency.observe("extract", time.monotonic() - started)
+        except BaseException as e:
+            self.url_cache.fail(key, e)
+            raise
+        
+        self.url_cache.complete(key, self._page_result(job.store_name, contacts))
+        return contacts
+    
+    def _fetch_html(self, url, deadline=None):
+        """Busca o HTML da URL até o instante limite, acumulando o tempo gasto nas buscas."""
+        started = time.monotonic()
+        html_content = self.html_fetcher.fetch(url, deadline=deadline)
+        elapsed = time.monotonic() - started
+        with self._stats_lock:
+            self._fetch_seconds += elapsed
+            self._fetch_count += 1
+        self.latency.observe("fetch", elapsed)
+        return html_content
+    
+    @staticmethod
+    def _page_result(store_name, contacts, status=None):
+        """Monta o resultado de uma URL guardado no cache da execução."""
+        if status is None:
+            status = "ok" if contacts is not None else "skipped"
+        return {"status": status, "store_name": store_name, "contacts": contacts}
+    
+    def _extract_page_contacts(self, html_content, url, store_name):
+        """
+        Extrai contatos de uma página, reaproveitando o resultado de páginas quase idênticas.
+        
+        Se a página é quase duplicata de outra já extraída para a mesma loja, o
+        resultado anterior é reutilizado. Se a original pertence a outra loja, a
+        página é tratada como conteúdo genérico (marketplace, rede social, portal)
+        e ignorada, a menos que a política 'reuse' esteja configurada.
+        
+        Returns:
+            ContactInfo: Contatos extraídos ou None se a página foi ignorada
+        """
+        fingerprint = html_fingerprint(html_content)
+        
+        if fingerprint:
+            cached, distance = self.page_index.find(fingerprint)
+            if cached is not None:
+                if cached["store_name"] == store_name or self.near_duplicate_policy == "reuse":
+                    self._count("near_duplicates_reused")
+                    self.logger.info(f"Página quase idêntica a {cached['url']} (distância {distance}); reutilizando extração")
+                    return copy.deepcopy(cached["contacts"])
+                
+                self._count("near_duplicates_skipped")
+                self.logger.info(
+                    f"Página quase idêntica a {cached['url']} da loja '{cached['store_name']}' "
+                    f"(distância {distance}); ignorada como página genérica"
+                )
+                return None
+        
+        # Extrair texto do HTML
+        html_text = self.html_fetcher.extract_text(html_content)
+        
+        # Extrair contatos
+        contacts = self.contact_extractor.execute(html_text, url, store_name)
+        
+        if fingerprint:
+            self.page_index.add(fingerprint, {
+                "url": url,
+                "store_name": store_name,
+                "contacts": copy.deepcopy(contacts)
+            })
+        
+        return contacts
+    
+    def get_run_report(self):
+        """Retorna as estatísticas acumuladas da execução."""
+        with self._stats_lock:
+            report = dict(self.stats)
+            report["domain_classes"] = dict(self.stats["domain_classes"])
+        report["indexed_pages"] = len(self.page_index)
+        report["url_cache"] = self.url_cache.get_stats()
+        if self.store_page_miner is not None:
+            report["store_pages"] = self.store_page_miner.cache.get_stats()
+        if self.domain_resolver is not None:
+            report["domain_guess"] = dict(self.domain_resolver.stats)
+        report["stage_latency"] = self.latency.snapshot()
+        controller = getattr(self.html_fetcher, "controller", None)
+        if controller is not None:
+            report["concurrency"] = controller.snapshot()
+        if self.watchdog is not None:
+            report["watchdog"] = dict(self.watchdog.stats)
+        return report
+    
+    def _register_url(self, url, store_name):
+        """Registra a URL no índice de URLs vistas, contabilizando repetições entre lojas."""
+        key = self._normalize_url(url)
+        
+        if key in self.url_index:
+            self._count("repeated_urls")
+            self.logger.info(f"URL já visitada anteriormente (loja '{self.url_index.get(key)}'): {url}")
+            return False
+        
+        self.url_index[key] = store_name
+        return True
+    
+    @staticmethod
+    def _normalize_url(url):
+        """Normaliza a URL para comparação (esquema/host minúsculos, sem fragmento e sem barra final)."""
+        parts = urlsplit(url.strip())
+        path = parts.path.rstrip('/') or '/'
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ''))
@@ -0,0 +1,190 @@
+import logging
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from domain.services.contact_extraction_core import normalize_phone
+
+def shard_of(store_name, shards):
+    """
+    Retorna o shard de uma loja pelo hash estável (CRC32) do nome.
+
+    O hash não depende da semente de `hash()` do Python, então uma loja cai
+    sempre no mesmo shard, em qualquer processo ou execução.
+    """
+    return zlib.crc32(store_name.encode("utf-8")) % shards
+
+def partition_stores(stores, shards, strategy="hash"):
+    """
+    Divide a lista de lojas entre os shards.
+
+    Args:
+        stores (list): Pares (nome da loja, link da loja no Mercado Livre)
+        shards (int): Número de shards
+        strategy (str): "hash" (CRC32 do nome) ou "range" (fatias contíguas da lista)
+
+    Returns:
+        list: Uma lista de lojas por shard, preservando a ordem de entrada
+    """
+    if strategy not in ("hash", "range"):
+        raise ValueError(f"Estratégia de particionamento desconhecida: {strategy}")
+
+    partitions = [[] for _ in range(shards)]
+    if strategy == "hash":
+        for store in stores:
+            partitions[shard_of(store[0], shards)].append(store)
+    else:
+        size, extra = divmod(len(stores), shards)
+        start = 0
+        for i in range(shards):
+            end = start + size + (1 if i < extra else 0)
+            partitions[i] = list(stores[start:end])
+            start = end
+    return partitions
+
+def merge_counters(target, source):
+    """Soma recursivamente os contadores numéricos de dois relatórios (taxas e médias, '*_rate' e '*_ms', são ignoradas)."""
+    for key, value in source.items():
+        if key.endswith(("_rate", "_ms")):
+            continue
+        if isinstance(value, dict):
+            merge_counters(target.setdefault(key, {}), value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            target[key] = round(target.get(key, 0) + value, 2)
+    return target
+
+class ShardedRunner:
+    """
+    Executa o scraping em vários processos, cada um com um ScrapingService independente.
+
+    As lojas são particionadas por hash do nome ou por faixas da lista e cada
+    shard roda `worker(shard, lojas, *worker_args)` em um processo próprio. O
+    worker devolve um dicionário com 'results', 'deferred', 'phones' (telefones
+    novos -> loja), 'urls' (URLs novas -> loja), 'report' e 'searches_used'.
+
+    Como cada processo tem seu próprio registro de telefones, um mesmo telefone
+    pode ser atribuído a lojas de shards diferentes. Na junção, o conflito é
+    resolvido de forma determinística: o telefone fica com a loja que aparece
+    primeiro na lista de entrada (a mesma que o reivindicaria numa execução
+    sequencial) e é removido das demais.
+    """
+
+    def __init__(self, worker, shards=None, strategy="hash"):
+        """
+        Args:
+            worker (callable): Função de nível de módulo (serializável) executada em cada processo
+            shards (int): Número de processos; se None ou 0, usa o número de CPUs
+            strategy (str): Particionamento "hash" ou "range"
+        """
+        self.worker = worker
+        self.shards = shards or os.cpu_count() or 1
+        self.strategy = strategy
+        self.logger = logging.getLogger(__name__)
+
+    def run(self, stores, worker_args=()):
+        """
+        Processa as lojas nos shards e junta as saídas.
+
+        Args:
+            stores (list): Pares (nome da loja, link da loja no Mercado Livre)
+            worker_args (tuple): Argumentos extras repassados ao worker
+
+        Returns:
+            dict: 'results' e 'deferred' na ordem de entrada, 'phones' e 'urls'
+                  já sem conflitos, 'report' somado, 'searches_used' e 'phone_conflicts'
+        """
+        partitions = partition_stores(stores, self.shards, self.strategy)
+        jobs = [(shard, part) for shard, part in enumerate(partitions) if part]
+        self.logger.info(
+            f"Executando {len(stores)} lojas em {len(jobs)} shards ({self.strategy}): "
+            f"{[len(part) for _, part in jobs]}"
+        )
+
+        outputs = []
+        with ProcessPoolExecutor(max_workers=max(1, len(jobs))) as executor:
+            futures = [(shard, part, executor.submit(self.worker, shard, part, *worker_args)) for shard, part in jobs]
+            for shard, part, future in futures:
+                try:
+                    outputs.append(future.result())
+                except Exception as e:
+                    # As lojas de um shard que falhou ficam para a próxima execução
+                    self.logger.error(f"Shard {shard} falhou: {str(e)}. Adiando suas {len(part)} lojas")
+                    outputs.append({"results": [], "deferred": [name for name, _ in part]})
+
+        return self.merge(stores, outputs)
+
+    def merge(self, stores, outputs):
+        """
+        Junta as saídas dos shards de forma determinística.
+
+        Args:
+            stores (list): Pares (nome da loja, link) na ordem de entrada
+            outputs (list): Saídas dos workers, em qualquer ordem
+
+        Returns:
+            dict: Saída combinada (ver `run`)
+        """
+        position = {name: i for i, (name, _) in enumerate(stores)}
+
+        def rank(store_name):
+            return (position.get(store_name, len(position)), store_name or "")
+
+        # Registros: cada item fica com a loja que aparece primeiro na entrada
+        phones, urls = {}, {}
+        claims = {}
+        for output in outputs:
+            for phone, store_name in output.get("phones", {}).items():
+                claims.setdefault(phone, set()).add(store_name)
+                if phone not in phones or rank(store_name) < rank(phones[phone]):
+                    phones[phone] = store_name
+            for url, store_name in output.get("urls", {}).items():
+                if url not in urls or rank(store_name) < rank(urls[url]):
+                    urls[url] = store_name
+
+        conflicts = sum(1 for owners in claims.values() if len(owners) > 1)
+        results = sorted(
+            (result for output in outputs for result in output.get("results", [])),
+            key=lambda result: rank(result.get("nome_loja"))
+        )
+        if conflicts:
+            results = [self._drop_foreign_phones(result, phones) for result in results]
+            self.logger.info(f"{conflicts} telefones encontrados em lojas de shards diferentes; mantidos na primeira loja")
+
+        deferred = {name for output in outputs for name in output.get("deferred", [])}
+        report = {}
+        for output in outputs:
+            merge_counters(report, output.get("report", {}))
+        url_cache = report.get("url_cache")
+        if url_cache and url_cache.get("lookups"):
+            url_cache["hit_rate"] = round((url_cache["hits"] + url_cache["coalesced"]) / url_cache["lookups"], 4)
+
+        return {
+            "results": results,
+            "deferred": sorted(deferred, key=rank),
+            "phones": phones,
+            "urls": urls,
+            "report": report,
+            "searches_used": sum(output.get("searches_used", 0) for output in outputs),
+            "phone_conflicts": conflicts
+        }
+
+    @staticmethod
+    def _drop_foreign_phones(result, phones):
+        """Remove do resultado os telefones que ficaram com outra loja."""
+        contacts = result.get("contacts")
+        if not result.get("success") or contacts is None:
+            return result
+
+        store_name = result.get("nome_loja")
+        contacts.phones = [
+            phone for phone in contacts.phones
+            if phones.get(normalize_phone(phone), store_name) == store_name
+        ]
+        if contacts.has_contacts():
+            return result
+
+        return {
+            'success': False,
+            'nome_loja': store_name,
+            'error': "Não foi possível extrair contatos",
+            'scrapingTime': result.get('scrapingTime')
+        }
@@ -0,0 +1,68 @@
+import time
+
+class StoreJob:
+    """
+    Estado do scraping de uma loja entre os passos do ScrapingService.
+
+    Permite que as fases (pesquisa, busca das páginas, extração) sejam executadas
+    em sequência por `scrape_store` ou em etapas separadas por um pipeline.
+
+    Fases:
+    - 'seed': processando os sites obtidos sem pesquisa (página da loja ou slug)
+    - 'search': processando os resultados da pesquisa (candidates None = pesquisa pendente)
+    - 'done': concluída; o resultado é montado por `finish_store`
+    """
+
+    def __init__(self, store_name):
+        self.store_name = store_name
+        self.phase = "search"
+        self.seed = None
+        self.seed_social = None
+
+        # Resultados a processar na fase atual e posição do próximo
+        self.candidates = None
+        self.index = 0
+        self.max_fetches = None
+        self.fetches = 0
+
+        # Páginas buscadas em todas as fases
+        self.pages = 0
+
+        # Contatos da fase atual
+        self.contacts = []
+
+        self.error = None
+        self.deferred = False
+        self.started_at = time.monotonic()
+
+        # Instante (time.monotonic()) em que o tempo limite da loja acaba e se ele foi atingido
+        self.deadline = None
+        self.timed_out = False
+
+        # Abandonada pelo watchdog: o resultado já foi registrado e o trabalho restante é descartado
+        self.abandoned = False
+
+        # Conclusão já reservada pelo pipeline (persistência ou abandono)
+        self.settled = False
+
+    @property
+    def done(self):
+        return self.phase == "done"
+
+    @property
+    def needs_search(self):
+        return self.phase == "search" and self.candidates is None
+
+    def start_phase(self, phase, candidates=None, max_fetches=None):
+        """Inicia uma nova fase com a lista de candidatos informada."""
+        self.phase = phase
+        self.candidates = candidates
+        self.index = 0
+        self.max_fetches = max_fetches
+        self.fetches = 0
+        self.contacts = []
+
+    def fail(self, error):
+        """Encerra a loja com erro."""
+        self.error = error
+        self.phase = "done"
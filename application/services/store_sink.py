@@ -0,0 +1,57 @@
+class StoreSink:
+    """
+    Interface de um destino de resultados gravados à medida que cada loja é concluída.
+
+    Um sink recebe uma loja por vez (`Store` ou o dicionário de `to_dict`) e
+    não mantém os resultados em memória. `close` conclui a saída (fecha o
+    arquivo, grava o rodapé) e deve ser chamado mesmo se o processamento for
+    interrompido, para que o que já foi recebido fique em um arquivo válido.
+    Pode ser usado como gerenciador de contexto.
+    """
+
+    def write(self, store):
+        """
+        Grava o resultado de uma loja.
+
+        Args:
+            store (Store | dict): Loja processada
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Conclui a saída; chamadas repetidas não têm efeito."""
+        raise NotImplementedError
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+def store_record(store):
+    """Retorna o dicionário de uma loja recebida por um sink."""
+    return store.to_dict() if hasattr(store, "to_dict") else store
+
+class CompositeStoreSink(StoreSink):
+    """Repassa cada loja a vários sinks (ex.: JSON, CSV e HTML ao mesmo tempo)."""
+
+    def __init__(self, sinks):
+        self.sinks = list(sinks)
+        self.count = 0
+
+    def write(self, store):
+        record = store_record(store)
+        for sink in self.sinks:
+            sink.write(record)
+        self.count += 1
+
+    def close(self):
+        errors = []
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            raise errors[0]
@@ -0,0 +1,152 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+class StoreWatchdog:
+    """
+    Vigia as lojas em andamento e abandona as que passam do tempo limite.
+
+    Cada loja tem `budget` segundos, respeitados pelas camadas de pesquisa e
+    busca de páginas; o watchdog só age depois de mais `grace` segundos, para
+    o trabalho que ficou preso onde esses limites não alcançam (resolução DNS,
+    uma extração patológica, uma chamada que não retorna).
+
+    Há duas formas de uso:
+    - `call`: executa a loja em uma thread de trabalho (uma por thread que
+      chama) e espera até o limite; se ela não terminar, a thread é abandonada
+      (segue em segundo plano, sem que o resultado seja usado) e uma nova
+      thread atende as próximas lojas
+    - `watch`/`unwatch`: uma thread de monitoramento chama `on_timeout` para as
+      lojas vigiadas há mais tempo que o limite (usado pelo pipeline, cujos
+      workers já são threads próprias)
+    """
+
+    def __init__(self, budget, grace=15.0, interval=1.0):
+        """
+        Args:
+            budget (float): Tempo limite de uma loja em segundos
+            grace (float): Tolerância além do tempo limite antes de abandonar a loja
+            interval (float): Intervalo entre verificações da thread de monitoramento
+        """
+        self.budget = budget
+        self.grace = grace
+        self.interval = interval
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._watched = {}
+        self._monitor = None
+        self._stop = threading.Event()
+        self._on_timeout = None
+
+        # Fila de tarefas da thread de trabalho de cada thread que chama `call`
+        self._local = threading.local()
+        self._queues = set()
+        self.stats = {"abandoned": 0}
+
+    @property
+    def limit(self):
+        """Tempo, desde o início da loja, a partir do qual ela é abandonada."""
+        return self.budget + self.grace
+
+    def call(self, key, function, on_timeout):
+        """
+        Executa `function()` em uma thread de trabalho, esperando no máximo `limit` segundos.
+
+        Exceções de `function` são repassadas a quem chamou.
+
+        Args:
+            key (str): Identificação do trabalho (nome da loja), usada no log
+            function (callable): Trabalho a executar
+            on_timeout (callable): Chamado se o limite passar; seu retorno substitui o resultado
+
+        Returns:
+            O retorno de `function` ou, se a loja foi abandonada, o de `on_timeout`
+        """
+        future = Future()
+        tasks = getattr(self._local, "tasks", None)
+        if tasks is None:
+            tasks = self._local.tasks = queue.Queue()
+            with self._lock:
+                self._queues.add(tasks)
+            threading.Thread(target=self._work, args=(tasks,), name="store-watchdog-worker", daemon=True).start()
+        tasks.put((future, function))
+
+        try:
+            return future.result(timeout=self.limit)
+        except FutureTimeoutError:
+            pass
+
+        # A thread presa é abandonada: ela encerra sozinha quando (e se) o trabalho retornar
+        tasks.put(None)
+        self._local.tasks = None
+        with self._lock:
+            self._queues.discard(tasks)
+            self.stats["abandoned"] += 1
+        self.logger.error(f"'{key}' excedeu {self.limit:g}s; abandonada pelo watchdog")
+        return on_timeout()
+
+    @staticmethod
+    def _work(tasks):
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            future, function = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(function())
+            except BaseException as e:
+                future.set_exception(e)
+
+    def start(self, on_timeout):
+        """
+        Inicia a thread de monitoramento.
+
+        Args:
+            on_timeout (callable): Chamado com cada item vigiado que passar do limite
+        """
+        self._on_timeout = on_timeout
+        self._stop.clear()
+        self._monitor = threading.Thread(target=self._monitor_loop, name="store-watchdog", daemon=True)
+        self._monitor.start()
+
+    def watch(self, item, started=None):
+        """Passa a vigiar o item (ex.: StoreJob) a partir de `started` (time.monotonic(); padrão: agora)."""
+        with self._lock:
+            self._watched[id(item)] = (item, started if started is not None else time.monotonic())
+
+    def unwatch(self, item):
+        with self._lock:
+            self._watched.pop(id(item), None)
+
+    def stop(self):
+        """Encerra a thread de monitoramento e as threads de trabalho."""
+        self._stop.set()
+        if self._monitor is not None:
+            self._monitor.join()
+            self._monitor = None
+        with self._lock:
+            self._watched.clear()
+            for tasks in self._queues:
+                tasks.put(None)
+            self._queues.clear()
+        self._local = threading.local()
+
+    def _monitor_loop(self):
+        while not self._stop.wait(self.interval):
+            now = time.monotonic()
+            with self._lock:
+                expired = [item for item, started in self._watched.values() if now - started > self.limit]
+                for item in expired:
+                    del self._watched[id(item)]
+                self.stats["abandoned"] += len(expired)
+
+            for item in expired:
+                try:
+                    self._on_timeout(item)
+                except Exception as e:
+                    self.logger.error(f"Erro ao abandonar item vencido: {str(e)}")
@@ -0,0 +1,85 @@
+class WorkLease:
+    """Concessão temporária de uma loja da fila a um worker."""
+
+    def __init__(self, store_name, link, token, worker_id, attempts, expires_at):
+        self.store_name = store_name
+        self.link = link
+        self.token = token
+        self.worker_id = worker_id
+        self.attempts = attempts
+        self.expires_at = expires_at
+
+    def __repr__(self):
+        return f"WorkLease({self.store_name!r}, worker={self.worker_id!r}, tentativa={self.attempts})"
+
+class WorkQueue:
+    """
+    Interface de uma fila de lojas compartilhada entre workers (processos ou máquinas).
+
+    Estados de um item:
+    - 'pending': aguardando um worker (a partir de `available_at`)
+    - 'leased': concedido a um worker até o fim da concessão; se o worker
+      morrer e a concessão vencer sem heartbeat, o item volta a ser concedido
+    - 'done': concluído, com o resultado gravado
+    - 'dead': desistência após `max_attempts` concessões sem conclusão
+
+    Todas as operações sobre uma concessão recebem o `WorkLease` devolvido por
+    `lease` e falham (retornam False) se ela já venceu e foi repassada a outro worker.
+    """
+
+    def enqueue(self, stores):
+        """
+        Adiciona lojas à fila; lojas já presentes (em qualquer estado) são ignoradas.
+
+        Args:
+            stores (list): Pares (nome da loja, link da loja no Mercado Livre)
+
+        Returns:
+            int: Número de lojas adicionadas
+        """
+        raise NotImplementedError
+
+    def lease(self, worker_id, limit=1):
+        """
+        Concede até `limit` lojas disponíveis ao worker.
+
+        Returns:
+            list: Concessões (WorkLease), possivelmente vazia
+        """
+        raise NotImplementedError
+
+    def heartbeat(self, leases):
+        """
+        Renova as concessões ainda ativas.
+
+        Returns:
+            list: Concessões renovadas (as perdidas ficam de fora)
+        """
+        raise NotImplementedError
+
+    def complete(self, lease, result):
+        """Marca a loja como concluída e grava seu resultado."""
+        raise NotImplementedError
+
+    def fail(self, lease, error):
+        """Registra uma falha; a loja volta à fila após um intervalo ou vai para 'dead'."""
+        raise NotImplementedError
+
+    def release(self, lease):
+        """Devolve a loja à fila sem contar a tentativa (ex.: cota de pesquisas esgotada)."""
+        raise NotImplementedError
+
+    def counts(self):
+        """Retorna o número de itens por estado."""
+        raise NotImplementedError
+
+    def results(self):
+        """Retorna os resultados das lojas concluídas, na ordem de entrada na fila."""
+        raise NotImplementedError
+
+    def dead_letters(self):
+        """Retorna as lojas em 'dead' com o último erro registrado."""
+        raise NotImplementedError
+
+    def close(self):
+        """Libera os recursos da fila."""
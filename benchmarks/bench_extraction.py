@@ -0,0 +1,244 @@
+"""
+Teste diferencial e benchmark do núcleo de extração de contatos.
+
+Executa a implementação de referência (cópia fiel da lógica anterior à
+unificação) e o `ContactExtractionCore` sobre todos os arquivos de
+`resultados/`, compara as saídas e mede o tempo de cada um. CNPJs, CEPs e
+o mascaramento desses trechos antes da busca de telefones também têm uma
+cópia de referência própria, independente do núcleo, e entram na comparação.
+
+Cada documento usa um nome de loja próprio: a referência descarta qualquer
+telefone já registrado, enquanto o núcleo só descarta os registrados para
+outra loja, e as duas regras só coincidem quando nenhuma loja se repete.
+A mudança tem teste próprio em tests/test_contact_extraction_core.py.
+
+Uso:
+    python benchmarks/bench_extraction.py [--repeat N] [--corpus DIR]
+
+Sai com código 1 se alguma saída divergir.
+"""
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from domain.services.contact_extraction_core import ContactExtractionCore
+from domain.usecases.extract_contacts_usecase import ExtractContactsUseCase
+from utils.contact_extractor import extract_contact_info
+
+def legacy_normalize_phone(phone):
+    return ''.join(filter(str.isdigit, phone))
+
+def legacy_valid_cnpj(cnpj):
+    """Validação escalar do CNPJ pelos dois dígitos verificadores (módulo 11)."""
+    digits = [int(d) for d in cnpj]
+    if len(set(digits)) == 1:
+        return False
+    
+    for size, weights in ((12, (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)),
+                          (13, (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2))):
+        remainder = sum(d * w for d, w in zip(digits[:size], weights)) % 11
+        if digits[size] != (0 if remainder < 2 else 11 - remainder):
+            return False
+    return True
+
+def legacy_mask(text, spans):
+    for start, end in spans:
+        text = text[:start] + ' ' * (end - start) + text[end:]
+    return text
+
+def legacy_extract_documents(text):
+    """Referência da extração de CNPJs e CEPs: devolve (CNPJs, CEPs, texto mascarado para os telefones)."""
+    cnpj_pattern = r'(?<![0-9./-])[0-9]{2}\.?[0-9]{3}\.?[0-9]{3}/?[0-9]{4}-?[0-9]{2}(?![0-9/-])'
+    cnpjs, spans = [], []
+    for match in re.finditer(cnpj_pattern, text):
+        digits = legacy_normalize_phone(match.group())
+        if legacy_valid_cnpj(digits):
+            formatted = f"{digits[:2]}.{digits[2:5]}.{digits[5:8]}/{digits[8:12]}-{digits[12:]}"
+            if formatted not in cnpjs:
+                cnpjs.append(formatted)
+            spans.append(match.span())
+    text = legacy_mask(text, spans)
+    
+    cep_pattern = r'(?<![0-9./-])[0-9]{2}\.?[0-9]{3}-[0-9]{3}(?![0-9/-])|\b[cC][eE][pP]\W{0,3}([0-9]{8})(?![0-9])'
+    ceps, spans = [], []
+    for match in re.finditer(cep_pattern, text):
+        group = 1 if match.group(1) else 0
+        digits = legacy_normalize_phone(match.group(group))
+        if len(digits) == 8 and digits != '00000000':
+            formatted = f"{digits[:5]}-{digits[5:]}"
+            if formatted not in ceps:
+                ceps.append(formatted)
+            spans.append(match.span(group))
+    return cnpjs, ceps, legacy_mask(text, spans)
+
+def legacy_extract_contact_info(text, store_name=None, global_phone_registry=None):
+    """Implementação de referência, idêntica à lógica duplicada antes da unificação, mais CNPJ e CEP."""
+    results = {
+        'emails': [],
+        'phones': [],
+        'whatsapp': {'links': [], 'numbers': []},
+        'socialMedia': {'facebook': [], 'instagram': [], 'twitter': [], 'linkedin': [], 'youtube': []}
+    }
+    
+    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+    results['emails'] = list(set(re.findall(email_pattern, text)))
+    
+    # CNPJs e CEPs são mascarados antes da busca de telefones
+    results['cnpjs'], results['ceps'], phone_text = legacy_extract_documents(text)
+    
+    phone_pattern = r'(?:\+?\d{1,3}[-.\s]?)?\(?\d{2,3}\)?[-.\s]?\d{4,5}[-.\s]?\d{4}'
+    phones = re.findall(phone_pattern, phone_text)
+    
+    if global_phone_registry is None:
+        global_phone_registry = {}
+    
+    unique_phones = []
+    normalized_phones = []
+    prioritized_phones = []
+    regular_phones = []
+    
+    for phone in phones:
+        norm_phone = legacy_normalize_phone(phone)
+        if norm_phone in global_phone_registry:
+            continue
+        if norm_phone in normalized_phones:
+            continue
+        if len(norm_phone) < 8:
+            continue
+        if '+' in phone or phone.startswith('00'):
+            prioritized_phones.append((phone, norm_phone))
+        else:
+            regular_phones.append((phone, norm_phone))
+    
+    for phone, norm_phone in prioritized_phones + regular_phones:
+        if len(unique_phones) >= 5:
+            break
+        unique_phones.append(phone)
+        normalized_phones.append(norm_phone)
+        if store_name:
+            global_phone_registry[norm_phone] = store_name
+    
+    results['phones'] = unique_phones
+    
+    whatsapp_pattern = r'(?:https?://)?(?:api\.whatsapp\.com|wa\.me|whatsapp\.com)/(?:send\?phone=)?(\d+)'
+    whatsapp_links = re.findall(whatsapp_pattern, text)
+    results['whatsapp']['links'] = [f"https://wa.me/{num}" for num in whatsapp_links]
+    results['whatsapp']['numbers'] = whatsapp_links
+    
+    social_patterns = {
+        'facebook': r'(?:https?://)?(?:www\.)?facebook\.com/[a-zA-Z0-9.]+',
+        'instagram': r'(?:https?://)?(?:www\.)?instagram\.com/[a-zA-Z0-9_.]+',
+        'twitter': r'(?:https?://)?(?:www\.)?twitter\.com/[a-zA-Z0-9_]+',
+        'linkedin': r'(?:https?://)?(?:www\.)?linkedin\.com/(?:company|in)/[a-zA-Z0-9_-]+',
+        'youtube': r'(?:https?://)?(?:www\.)?youtube\.com/(?:user|channel|c)/[a-zA-Z0-9_-]+'
+    }
+    for platform, pattern in social_patterns.items():
+        results['socialMedia'][platform] = list(set(re.findall(pattern, text)))
+    
+    return results
+
+def canonical(result):
+    """Normaliza a saída para comparação (campos deduplicados via set não têm ordem definida)."""
+    return {
+        'emails': sorted(result['emails']),
+        'phones': result['phones'],
+        'cnpjs': result['cnpjs'],
+        'ceps': result['ceps'],
+        'whatsapp': result['whatsapp'],
+        'socialMedia': {k: sorted(v) for k, v in result['socialMedia'].items()}
+    }
+
+# Documentos fixos com CEPs e CNPJs em vários formatos, somados ao corpus (que
+# pode não ter CEPs) para que o mascaramento antes dos telefones seja sempre exercitado
+SYNTHETIC_DOCUMENTS = [
+    ("sintetico#cep", "Loja Centro - Rua das Flores, 120 - CEP 01310-100 - São Paulo/SP. Tel: (11) 3456-7890"),
+    ("sintetico#cep-sem-traco", "Endereço: Av. Brasil, 500, cep: 20040020 Rio de Janeiro. WhatsApp +55 21 99876-5432"),
+    ("sintetico#cep-pontuado", "Atendimento 0800 123 4567 | Sede 30.130-010 Belo Horizonte | contato@loja.com.br"),
+    ("sintetico#cep-colado", "Florianópolis/SC CEP: 88015-600 4004-1234 (central de atendimento)"),
+    ("sintetico#cnpj", "Loja Exemplo LTDA CNPJ 11.222.333/0001-81 - 11222333000181 - SAC (41) 3333-4444"),
+    ("sintetico#cnpj-invalido", "CNPJ 11.222.333/0001-82 e 00000000000000 não são válidos; fone 11 98765-4321"),
+    ("sintetico#digitos-unicode", "CNPJ ١١.٢٢٢.٣٣٣/٠٠٠١-٨١, CEP ０１３１０-１００ e 11.222.333/0001-81 - CEP 01310-100"),
+]
+
+def load_corpus(corpus_dir):
+    """Carrega os documentos do corpus; arquivos HTML também geram a versão em texto."""
+    documents = []
+    for path in sorted(glob.glob(os.path.join(corpus_dir, '*'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            raw = f.read()
+        documents.append((os.path.basename(path), raw))
+        
+        if path.endswith('.html'):
+            soup = BeautifulSoup(raw, 'html.parser')
+            text = soup.get_text(separator=' ', strip=True)
+            hrefs = [a.get('href') for a in soup.find_all('a') if a.get('href')]
+            documents.append((f"{os.path.basename(path)}#texto", f"{text} {' '.join(hrefs)}"))
+    return documents + SYNTHETIC_DOCUMENTS
+
+def run_legacy(documents):
+    registry = {}
+    return [canonical(legacy_extract_contact_info(text, name, registry)) for name, text in documents]
+
+def run_core(documents):
+    core = ContactExtractionCore({})
+    return [canonical(core.extract(text, name).to_dict()) for name, text in documents]
+
+def run_usecase(documents):
+    usecase = ExtractContactsUseCase({})
+    return [canonical(usecase.execute(text, name, name).to_dict()) for name, text in documents]
+
+def run_utils(documents):
+    registry = {}
+    return [canonical(extract_contact_info(text, name, name, registry)) for name, text in documents]
+
+def timed(fn, documents, repeat):
+    best = float('inf')
+    output = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = fn(documents)
+        best = min(best, time.perf_counter() - start)
+    return output, best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', default='resultados')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    
+    documents = load_corpus(args.corpus)
+    total_mb = sum(len(text) for _, text in documents) / 1e6
+    print(f"Corpus: {len(documents)} documentos, {total_mb:.1f} MB de texto")
+    
+    legacy_output, legacy_time = timed(run_legacy, documents, args.repeat)
+    print(f"Referência:             {legacy_time:.3f}s")
+    
+    failed = False
+    for label, fn in (("Núcleo", run_core),
+                      ("ExtractContactsUseCase", run_usecase),
+                      ("extract_contact_info", run_utils)):
+        output, elapsed = timed(fn, documents, args.repeat)
+        print(f"{label + ':':<23} {elapsed:.3f}s ({legacy_time / elapsed:.2f}x)")
+        
+        mismatches = [
+            name for (name, _), expected, actual in zip(documents, legacy_output, output)
+            if expected != actual
+        ]
+        if mismatches:
+            print(f"  DIVERGÊNCIAS em {len(mismatches)} documentos: {', '.join(mismatches[:10])}")
+            failed = True
+    
+    if failed:
+        return 1
+    
+    print("Saídas idênticas em todo o corpus.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""
+Benchmark do pipeline de pesquisa e scraping contra o servidor local da Custom Search API.
+
+Sobe um `FakeSearchServer` e mede, sem rede nem cota:
+- pesquisa: consultas sequenciais vs. `search_many` em lote vs. `search_many`
+  paralelo (com o endpoint de lote desligado)
+- retentativas: consultas com taxa de erros configurável (backoff real)
+- pipeline: `ScrapingService.scrape_store` em sequência vs. `ScrapingPipeline`
+  em etapas, buscando as páginas geradas pelo próprio servidor
+
+Os sorteios do servidor e do backoff usam uma semente fixa, de forma que
+execuções com os mesmos parâmetros são reproduzíveis.
+
+Uso:
+    python benchmarks/bench_pipeline.py [--stores N] [--latency 0.1]
+        [--error-rate 0.1] [--max-concurrency 32] [--skip-pipeline]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_search_server import FakeSearchServer
+from config.settings import Settings
+from application.services.scraping_service import ScrapingService
+from application.services.scraping_pipeline import ScrapingPipeline
+from domain.usecases.extract_contacts_usecase import ExtractContactsUseCase
+from infrastructure.repositories.store_repository import StoreRepository
+from infrastructure.search.google_search_service import GoogleSearchService
+from infrastructure.web.html_fetcher import HtmlFetcher
+from infrastructure.web.concurrency_controller import AimdConcurrencyController
+
+def report(label, elapsed, count, server):
+    rate = count / elapsed if elapsed else float('inf')
+    print(f"{label:<28} {elapsed:7.2f}s  {rate:7.1f} lojas/s  servidor: {server.stats}")
+
+def bench_search(args, stores):
+    print("== Pesquisa ==")
+    server = FakeSearchServer(latency=args.latency, seed=args.seed)
+    root_url = server.start()
+
+    service = GoogleSearchService("chave", "motor", root_url=root_url)
+    start = time.perf_counter()
+    for store in stores:
+        service.search_store_contacts(store)
+    report("Sequencial", time.perf_counter() - start, len(stores), server)
+
+    server.reset_stats()
+    service = GoogleSearchService("chave", "motor", root_url=root_url)
+    start = time.perf_counter()
+    results = service.search_many(stores, batch_size=args.batch_size)
+    report("search_many (lote)", time.perf_counter() - start, len(results), server)
+
+    server.batch_enabled = False
+    server.reset_stats()
+    service = GoogleSearchService("chave", "motor", root_url=root_url)
+    start = time.perf_counter()
+    results = service.search_many(stores, batch_size=args.batch_size, max_workers=args.workers)
+    report("search_many (paralelo)", time.perf_counter() - start, len(results), server)
+    server.stop()
+
+def bench_retries(args, stores):
+    print(f"== Retentativas (taxa de erros {args.error_rate:.0%}) ==")
+    server = FakeSearchServer(latency=args.latency, error_rate=args.error_rate, seed=args.seed)
+    root_url = server.start()
+    random.seed(args.seed)
+
+    service = GoogleSearchService("chave", "motor", root_url=root_url)
+    failed = 0
+    start = time.perf_counter()
+    for store in stores:
+        if not service.search_store_contacts(store):
+            failed += 1
+    report("Sequencial com erros", time.perf_counter() - start, len(stores), server)
+    print(f"Consultas sem resultado após retentativas: {failed}")
+    server.stop()
+
+def build_scraping_service(args, root_url):
+    settings = Settings()
+    settings.set("concurrency.max_limit", args.max_concurrency)
+    settings.set("pipeline.fetch_workers", args.workers * 2)
+    controller = AimdConcurrencyController(
+        initial_limit=settings.get("concurrency.initial_limit"),
+        max_limit=settings.get("concurrency.max_limit"),
+        initial_host_limit=settings.get("concurrency.initial_host_limit"),
+        max_host_limit=settings.get("concurrency.max_host_limit")
+    )
+    return ScrapingService(
+        search_service=GoogleSearchService("chave", "motor", root_url=root_url),
+        html_fetcher=HtmlFetcher(settings.config.get("scraping", {}), controller=controller),
+        contact_extractor=ExtractContactsUseCase({}),
+        store_repository=StoreRepository(),
+        config=settings
+    )
+
+def bench_pipeline(args, stores):
+    print(f"== Pipeline completo (concurrency.max_limit={args.max_concurrency}) ==")
+    server = FakeSearchServer(latency=args.latency, seed=args.seed)
+    root_url = server.start()
+    pairs = [(store, None) for store in stores]
+
+    random.seed(args.seed)
+    scraping_service = build_scraping_service(args, root_url)
+    successes = 0
+    start = time.perf_counter()
+    for i, store in enumerate(stores):
+        if i % args.batch_size == 0:
+            scraping_service.prepare_batch(pairs[i:i + args.batch_size])
+        if scraping_service.scrape_store(store).get('success'):
+            successes += 1
+    report("scrape_store sequencial", time.perf_counter() - start, len(stores), server)
+    print(f"Lojas com contatos: {successes}/{len(stores)}")
+    print(f"Relatório: {scraping_service.get_run_report()}")
+
+    server.reset_stats()
+    random.seed(args.seed)
+    scraping_service = build_scraping_service(args, root_url)
+    pipeline = ScrapingPipeline(scraping_service, scraping_service.config)
+    start = time.perf_counter()
+    results, _ = pipeline.run(pairs, batch_size=args.batch_size)
+    report("ScrapingPipeline", time.perf_counter() - start, len(stores), server)
+    print(f"Lojas com contatos: {sum(1 for r in results if r.get('success'))}/{len(stores)}")
+    for name, metrics in pipeline.get_metrics()["stages"].items():
+        print(f"  {name:<8} {metrics}")
+    print(f"Concorrência: {scraping_service.html_fetcher.controller.snapshot()}")
+    server.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--stores', type=int, default=30)
+    parser.add_argument('--latency', type=float, default=0.1, help="Latência do servidor por requisição (s)")
+    parser.add_argument('--error-rate', type=float, default=0.1)
+    parser.add_argument('--batch-size', type=int, default=10)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--max-concurrency', type=int, default=32, help="concurrency.max_limit do pipeline")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--skip-pipeline', action='store_true')
+    args = parser.parse_args()
+
+    stores = [f"Loja Exemplo {i}" for i in range(args.stores)]
+    bench_search(args, stores)
+    bench_retries(args, stores)
+    if not args.skip_pipeline:
+        bench_pipeline(args, stores)
+
+if __name__ == '__main__':
+    logging.disable(logging.WARNING)
+    main()
@@ -0,0 +1,70 @@
+"""
+Microbenchmark do custo por consulta do cliente da Custom Search API.
+
+Compara o caminho antigo (`build("customsearch", "v1", ...)` a cada consulta)
+com o cliente reutilizável do `GoogleSearchService`. O transporte HTTP é
+substituído por uma resposta fixa em memória, de forma que o tempo medido é
+apenas o overhead local (montagem do cliente, requisição e parsing).
+
+Uso:
+    python benchmarks/bench_search_client.py [--queries N]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httplib2
+from googleapiclient.discovery import build
+from infrastructure.search.google_search_service import GoogleSearchService
+
+CANNED_RESPONSE = json.dumps({
+    "items": [
+        {"title": f"Resultado {i}", "link": f"https://exemplo{i}.com.br/contato", "snippet": "Fale conosco"}
+        for i in range(3)
+    ]
+}).encode('utf-8')
+
+class CannedHttp:
+    """Transporte compatível com httplib2.Http que responde sempre o mesmo JSON."""
+
+    def request(self, uri, method="GET", body=None, headers=None, redirections=5, connection_type=None):
+        return httplib2.Response({"status": "200", "content-type": "application/json"}), CANNED_RESPONSE
+
+def legacy_search(query, http):
+    service = build("customsearch", "v1", developerKey="chave", http=http)
+    return service.cse().list(q=query, cx="motor", num=3).execute().get("items", [])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--queries', type=int, default=200)
+    args = parser.parse_args()
+
+    queries = [f"Loja {i} contato telefone email whatsapp site oficial" for i in range(args.queries)]
+    http = CannedHttp()
+
+    start = time.perf_counter()
+    for query in queries:
+        legacy_search(query, http)
+    legacy_time = time.perf_counter() - start
+
+    service = GoogleSearchService("chave", "motor", http_factory=CannedHttp)
+    start = time.perf_counter()
+    for query in queries:
+        service.search(query, max_results=3)
+    reusable_time = time.perf_counter() - start
+
+    per_query_legacy = legacy_time / len(queries) * 1000
+    per_query_reusable = reusable_time / len(queries) * 1000
+    print(f"Consultas: {len(queries)}")
+    print(f"build() por consulta:  {per_query_legacy:.3f} ms/consulta")
+    print(f"Cliente reutilizável:  {per_query_reusable:.3f} ms/consulta "
+          f"({per_query_legacy / per_query_reusable:.1f}x)")
+
+if __name__ == '__main__':
+    logging.disable(logging.INFO)
+    main()
@@ -0,0 +1,280 @@
+"""
+Servidor local que imita a Custom Search JSON API, para testes offline e benchmarks.
+
+Atende às mesmas rotas usadas pela biblioteca cliente:
+- GET  /customsearch/v1?q=...&num=...  pesquisa individual
+- POST /batch                          requisições em lote (multipart/mixed)
+- GET  /sites/<slug>/<pagina>          páginas HTML geradas com contatos da loja,
+                                       para que o pipeline completo rode sem rede
+
+Os resultados vêm de um arquivo JSON fixo (consulta -> itens) ou são gerados de
+forma determinística a partir da consulta. Latência, taxa de erros e cota
+diária são configuráveis; os sorteios usam uma semente fixa.
+
+Para apontar o scraper para o servidor, defina `google_api.root_url` nas
+configurações (ex.: "http://127.0.0.1:8765").
+
+Uso:
+    python benchmarks/fake_search_server.py [--port 8765] [--latency 0.2]
+        [--error-rate 0.1] [--daily-limit 100] [--canned resultados.json]
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+SEARCH_PATH = "/customsearch/v1"
+BATCH_PATH = "/batch"
+SITES_PATH = "/sites/"
+
+# Página compartilhada por todas as lojas (ex.: um diretório de lojas),
+# para exercitar a deduplicação de URLs entre lojas
+SHARED_PAGE = "diretorio/lojas"
+
+def slugify(text):
+    """Converte o nome da loja em um identificador de URL."""
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-') or "loja"
+
+def store_from_query(query):
+    """Recupera o nome da loja a partir da consulta montada pelo scraper."""
+    return query.split(" contato ")[0].strip()
+
+class FakeSearchServer:
+    """
+    Servidor HTTP local compatível com a Custom Search API.
+
+    Args:
+        port (int): Porta (0 escolhe uma porta livre)
+        latency (float): Atraso fixo por requisição, em segundos
+        jitter (float): Atraso adicional aleatório máximo, em segundos
+        error_rate (float): Fração das consultas que falham com erro 500
+        daily_limit (int): Consultas aceitas antes de responder com cota diária esgotada
+        canned (dict): Resultados fixos por consulta; consultas ausentes são geradas
+        batch_enabled (bool): Se False, o endpoint de lote responde 404
+        seed (int): Semente dos sorteios de latência e erros
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, error_rate=0.0,
+                 daily_limit=None, canned=None, batch_enabled=True, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.daily_limit = daily_limit
+        self.canned = canned or {}
+        self.batch_enabled = batch_enabled
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {"queries": 0, "batches": 0, "errors": 0, "quota_errors": 0, "pages": 0}
+
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def root_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Inicia o servidor em uma thread de fundo e retorna sua URL raiz."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-search", daemon=True)
+        self._thread.start()
+        return self.root_url
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def reset_stats(self):
+        with self._lock:
+            for key in self.stats:
+                self.stats[key] = 0
+
+    def _sleep(self):
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _answer_query(self, params):
+        """
+        Responde uma consulta individual.
+
+        Returns:
+            tuple: (status HTTP, corpo JSON)
+        """
+        with self._lock:
+            self.stats["queries"] += 1
+
+            if self.daily_limit is not None and self.stats["queries"] > self.daily_limit:
+                self.stats["quota_errors"] += 1
+                return 403, self._error_body(403, "dailyLimitExceeded", "Queries per day quota exceeded.")
+
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.stats["errors"] += 1
+                return 500, self._error_body(500, "backendError", "Backend Error")
+
+        query = params.get("q", [""])[0]
+        num = int(params.get("num", ["10"])[0])
+        items = self.canned.get(query)
+        if items is None:
+            items = self._generate_items(query)
+        return 200, {"kind": "customsearch#search", "items": items[:num]}
+
+    @staticmethod
+    def _error_body(code, reason, message):
+        return {"error": {"code": code, "message": message, "errors": [{"reason": reason, "message": message}]}}
+
+    def _generate_items(self, query):
+        store_name = store_from_query(query)
+        slug = slugify(store_name)
+        return [
+            {"title": f"Contato - {store_name}", "link": f"{self.root_url}{SITES_PATH}{slug}/contato",
+             "snippet": f"Fale com a {store_name}"},
+            {"title": f"Sobre - {store_name}", "link": f"{self.root_url}{SITES_PATH}{slug}/sobre",
+             "snippet": f"Conheça a {store_name}"},
+            {"title": "Diretório de lojas", "link": f"{self.root_url}{SITES_PATH}{SHARED_PAGE}",
+             "snippet": "Lojas oficiais"}
+        ]
+
+    @staticmethod
+    def render_page(slug, page):
+        """Gera uma página HTML determinística com os contatos da loja."""
+        digest = int(hashlib.sha1(slug.encode('utf-8')).hexdigest(), 16)
+        ddd = 11 + digest % 80
+        number = f"9{digest % 10000:04d}-{(digest // 10000) % 10000:04d}"
+
+        if page == "contato":
+            body = (
+                f"<h1>Fale conosco</h1><p>Telefone: ({ddd}) {number}</p>"
+                f"<p>E-mail: contato@{slug}.com.br</p>"
+                f'<a href="https://wa.me/55{ddd}{number.replace("-", "")}">WhatsApp</a>'
+            )
+        else:
+            body = (
+                f"<h1>Sobre nós</h1><p>A {slug} atende todo o Brasil.</p>"
+                f'<a href="https://www.instagram.com/{slug}">Instagram</a>'
+                f"<p>SAC: sac@{slug}.com.br</p>"
+            )
+        return f"<html><head><title>{slug}</title></head><body>{body}</body></html>"
+
+    def _answer_batch(self, content_type, raw_body):
+        """
+        Responde uma requisição em lote com uma parte multipart por consulta.
+
+        Returns:
+            tuple: (content-type, corpo)
+        """
+        with self._lock:
+            self.stats["batches"] += 1
+
+        boundary = re.search(r'boundary="?([^";]+)', content_type).group(1)
+        boundary_out = "batch_fake_search"
+        parts = []
+
+        for part in raw_body.split(f"--{boundary}"):
+            content_id = re.search(r"Content-ID: <([^>]+)>", part)
+            request_line = re.search(r"GET (\S+) HTTP", part)
+            if not content_id or not request_line:
+                continue
+
+            status, payload = self._answer_query(parse_qs(urlsplit(request_line.group(1)).query))
+            body = json.dumps(payload)
+            reason = "OK" if status == 200 else "Error"
+            parts.append(
+                f"--{boundary_out}\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id.group(1)}>\r\n\r\n"
+                f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json; charset=UTF-8\r\n"
+                f"Content-Length: {len(body.encode('utf-8'))}\r\n\r\n{body}\r\n"
+            )
+
+        return f"multipart/mixed; boundary={boundary_out}", "".join(parts) + f"--{boundary_out}--\r\n"
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status, body, content_type="application/json; charset=UTF-8"):
+                data = body.encode('utf-8') if isinstance(body, str) else body
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                server._sleep()
+
+                if url.path == SEARCH_PATH:
+                    status, payload = server._answer_query(parse_qs(url.query))
+                    self._send(status, json.dumps(payload))
+                elif url.path.startswith(SITES_PATH):
+                    slug, _, page = url.path[len(SITES_PATH):].rpartition("/")
+                    with server._lock:
+                        server.stats["pages"] += 1
+                    self._send(200, server.render_page(slug, page), "text/html; charset=UTF-8")
+                else:
+                    self._send(404, json.dumps(server._error_body(404, "notFound", "Not Found")))
+
+            def do_POST(self):
+                raw_body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode('utf-8')
+
+                if urlsplit(self.path).path != BATCH_PATH or not server.batch_enabled:
+                    self._send(404, json.dumps(server._error_body(404, "notFound", "Not Found")))
+                    return
+
+                server._sleep()
+                content_type, body = server._answer_batch(self.headers.get("Content-Type", ""), raw_body)
+                self._send(200, body, content_type)
+
+        return Handler
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help="Atraso por requisição (s)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Atraso aleatório adicional máximo (s)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fração de consultas com erro 500")
+    parser.add_argument('--daily-limit', type=int, default=None, help="Consultas aceitas antes do erro de cota")
+    parser.add_argument('--canned', help="Arquivo JSON com resultados fixos (consulta -> itens)")
+    parser.add_argument('--no-batch', action='store_true', help="Recusar requisições em lote")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    canned = None
+    if args.canned:
+        with open(args.canned, 'r', encoding='utf-8') as f:
+            canned = json.load(f)
+
+    server = FakeSearchServer(
+        host=args.host, port=args.port, latency=args.latency, jitter=args.jitter,
+        error_rate=args.error_rate, daily_limit=args.daily_limit, canned=canned,
+        batch_enabled=not args.no_batch, seed=args.seed
+    )
+    print(f"Servidor de pesquisa local em {server.root_url}")
+    print(f'Configure "google_api": {{"root_url": "{server.root_url}"}} para usá-lo')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"Estatísticas: {server.stats}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+import re
+from domain.entities.contact_info import ContactInfo
+from domain.services.document_validation import validate_cnpjs, format_cnpj, format_cep
+
+# Padrões pré-compilados, compartilhados por todos os pontos de entrada de extração.
+# Os padrões que começam com grupos opcionais recebem um lookahead com os
+# possíveis primeiros caracteres: o resultado é o mesmo, mas o motor de regex
+# descarta rapidamente as posições que não podem iniciar um match.
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE_PATTERN = re.compile(r'(?=[+(\d])(?:\+?\d{1,3}[-.\s]?)?\(?\d{2,3}\)?[-.\s]?\d{4,5}[-.\s]?\d{4}')
+WHATSAPP_PATTERN = re.compile(r'(?=[haw])(?:https?://)?(?:api\.whatsapp\.com|wa\.me|whatsapp\.com)/(?:send\?phone=)?(\d+)')
+NON_DIGIT_PATTERN = re.compile(r'\D')
+
+# Documentos brasileiros: CNPJ com ou sem pontuação e CEP formatado (ou precedido de "CEP").
+# Só dígitos ASCII: `\d` também casa dígitos arábico-índicos e de largura total,
+# que não são documentos e quebrariam a validação em lote dos CNPJs.
+CNPJ_PATTERN = re.compile(r'(?=[0-9])(?<![0-9./-])[0-9]{2}\.?[0-9]{3}\.?[0-9]{3}/?[0-9]{4}-?[0-9]{2}(?![0-9/-])')
+CEP_PATTERN = re.compile(r'(?=[0-9cC])(?:(?<![0-9./-])[0-9]{2}\.?[0-9]{3}-[0-9]{3}(?![0-9/-])|\b[cC][eE][pP]\W{0,3}([0-9]{8})(?![0-9]))')
+
+# Cada rede social tem um trecho literal obrigatório; se ele não aparece no
+# texto, a expressão regular não tem como casar e a varredura é evitada.
+SOCIAL_PATTERNS = {
+    'facebook': ('facebook.com/', re.compile(r'(?=[hwf])(?:https?://)?(?:www\.)?facebook\.com/[a-zA-Z0-9.]+')),
+    'instagram': ('instagram.com/', re.compile(r'(?=[hwi])(?:https?://)?(?:www\.)?instagram\.com/[a-zA-Z0-9_.]+')),
+    'twitter': ('twitter.com/', re.compile(r'(?=[hwt])(?:https?://)?(?:www\.)?twitter\.com/[a-zA-Z0-9_]+')),
+    'linkedin': ('linkedin.com/', re.compile(r'(?=[hwl])(?:https?://)?(?:www\.)?linkedin\.com/(?:company|in)/[a-zA-Z0-9_-]+')),
+    'youtube': ('youtube.com/', re.compile(r'(?=[hwy])(?:https?://)?(?:www\.)?youtube\.com/(?:user|channel|c)/[a-zA-Z0-9_-]+'))
+}
+WHATSAPP_MARKERS = ('whatsapp.com/', 'wa.me/')
+
+MAX_PHONES_PER_STORE = 5
+MIN_PHONE_DIGITS = 8
+
+def normalize_phone(phone):
+    """Normaliza um número de telefone removendo formatação."""
+    return NON_DIGIT_PATTERN.sub('', phone)
+
+def mask_spans(text, spans):
+    """Substitui os trechos indicados por espaços, preservando as posições do texto."""
+    if not spans:
+        return text
+
+    parts = []
+    last_end = 0
+    for start, end in spans:
+        parts.append(text[last_end:start])
+        parts.append(' ' * (end - start))
+        last_end = end
+    parts.append(text[last_end:])
+    return ''.join(parts)
+
+def unique(items):
+    """Remove duplicatas preservando a ordem da primeira ocorrência."""
+    return list(dict.fromkeys(items))
+
+class ContactExtractionCore:
+    """
+    Núcleo único de extração de contatos.
+
+    `ExtractContactsUseCase` e as funções de `utils.contact_extractor` delegam
+    para esta classe, de forma que padrões e regras de telefone existem em um
+    só lugar.
+    """
+
+    def __init__(self, phone_registry=None):
+        self.phone_registry = phone_registry if phone_registry is not None else {}
+
+    def extract(self, text, store_name=None):
+        """
+        Extrai todas as informações de contato do texto.
+
+        Args:
+            text (str): Texto para extração
+            store_name (str): Nome da loja para o registro global de telefones
+
+        Returns:
+            ContactInfo: Objeto com informações de contato extraídas
+        """
+        whatsapp_numbers = self.extract_whatsapp_numbers(text)
+
+        cnpjs, ceps, phone_text = self.extract_documents(text)
+
+        return ContactInfo(
+            emails=self.extract_emails(text),
+            phones=self.extract_phones(phone_text, store_name),
+            cnpjs=cnpjs,
+            ceps=ceps,
+            whatsapp={
+                "links": [f"https://wa.me/{num}" for num in whatsapp_numbers],
+                "numbers": whatsapp_numbers
+            },
+            social_media=self.extract_social_media(text)
+        )
+
+    def extract_emails(self, text):
+        """Extrai e-mails únicos do texto."""
+        if '@' not in text:
+            return []
+        return unique(EMAIL_PATTERN.findall(text))
+
+    def extract_phones(self, text, store_name=None):
+        """
+        Extrai até 5 telefones, priorizando formatos internacionais e
+        ignorando números já registrados para outras lojas.
+        """
+        prioritized_phones = []
+        regular_phones = []
+        registry = self.phone_registry
+
+        for phone in PHONE_PATTERN.findall(text):
+            norm_phone = normalize_phone(phone)
+
+            # Verificar validade mínima (8+ dígitos para brasileiro)
+            if len(norm_phone) < MIN_PHONE_DIGITS:
+                continue
+
+            # Pular se o registro global atribui o número a outra loja (o registro pode
+            # vir de execuções anteriores e já conter os números da própria loja)
+            if registry.get(norm_phone, store_name) != store_name:
+                continue
+
+            if '+' in phone or phone.startswith('00'):
+                prioritized_phones.append((phone, norm_phone))
+            else:
+                regular_phones.append((phone, norm_phone))
+
+        # Limitar a 5 telefones, priorizando os internacionais
+        selected = (prioritized_phones + regular_phones)[:MAX_PHONES_PER_STORE]
+
+        if store_name:
+            for _, norm_phone in selected:
+                registry[norm_phone] = store_name
+
+        return [phone for phone, _ in selected]
+
+    def extract_documents(self, text):
+        """
+        Extrai CNPJs e CEPs e devolve o texto com esses trechos mascarados.
+
+        Os documentos encontrados são removidos do texto usado na busca por
+        telefones, para que suas sequências de dígitos não sejam lidas como números.
+
+        Returns:
+            tuple: (CNPJs, CEPs, texto mascarado)
+        """
+        cnpjs, cnpj_spans = self.extract_cnpjs(text)
+        text = mask_spans(text, cnpj_spans)
+
+        ceps, cep_spans = self.extract_ceps(text)
+        return cnpjs, ceps, mask_spans(text, cep_spans)
+
+    def extract_cnpjs(self, text):
+        """
+        Extrai CNPJs com dígitos verificadores válidos.
+
+        Todos os candidatos do texto são validados em um único lote.
+
+        Returns:
+            tuple: (lista de CNPJs formatados e únicos, lista de spans (início, fim) válidos)
+        """
+        matches = list(CNPJ_PATTERN.finditer(text))
+        if not matches:
+            return [], []
+
+        candidates = [normalize_phone(match.group()) for match in matches]
+        validity = validate_cnpjs(candidates)
+
+        cnpjs = unique(format_cnpj(cnpj) for cnpj, valid in zip(candidates, validity) if valid)
+        spans = [match.span() for match, valid in zip(matches, validity) if valid]
+        return cnpjs, spans
+
+    def extract_ceps(self, text):
+        """
+        Extrai CEPs únicos, no formato XXXXX-XXX.
+
+        Returns:
+            tuple: (lista de CEPs formatados, lista de spans (início, fim) dos números)
+        """
+        ceps = []
+        spans = []
+        for match in CEP_PATTERN.finditer(text):
+            group = 1 if match.group(1) else 0
+            digits = normalize_phone(match.group(group))
+            if len(digits) == 8 and digits != '00000000':
+                ceps.append(format_cep(digits))
+                spans.append(match.span(group))
+        return unique(ceps), spans
+
+    def extract_whatsapp_numbers(self, text):
+        """Extrai números de links de WhatsApp."""
+        if not any(marker in text for marker in WHATSAPP_MARKERS):
+            return []
+        return WHATSAPP_PATTERN.findall(text)
+
+    def extract_social_media(self, text):
+        """Extrai links únicos de redes sociais."""
+        social_media = {}
+        for platform, (marker, pattern) in SOCIAL_PATTERNS.items():
+            social_media[platform] = unique(pattern.findall(text)) if marker in text else []
+        return social_media
@@ -0,0 +1,63 @@
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy é opcional
+    np = None
+
+# Pesos do módulo 11 para os dois dígitos verificadores do CNPJ
+CNPJ_FIRST_WEIGHTS = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+CNPJ_SECOND_WEIGHTS = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+def _check_digit(total):
+    remainder = total % 11
+    return 0 if remainder < 2 else 11 - remainder
+
+def validate_cnpjs(candidates):
+    """
+    Valida um lote de CNPJs (14 dígitos, sem formatação) pelos dígitos verificadores.
+
+    Com numpy disponível, todo o lote é validado de uma vez como uma matriz
+    (n, 14); caso contrário, usa o cálculo escalar equivalente.
+
+    Args:
+        candidates (list): Lista de strings com 14 dígitos
+
+    Returns:
+        list: Lista de bool, na mesma ordem dos candidatos
+    """
+    if not candidates:
+        return []
+
+    if np is None:
+        return [_validate_cnpj_scalar(cnpj) for cnpj in candidates]
+
+    digits = np.frombuffer(''.join(candidates).encode('ascii'), dtype=np.uint8).reshape(-1, 14) - ord('0')
+    digits = digits.astype(np.int32)
+
+    first = digits[:, :12] @ np.array(CNPJ_FIRST_WEIGHTS, dtype=np.int32) % 11
+    first = np.where(first < 2, 0, 11 - first)
+
+    second = digits[:, :13] @ np.array(CNPJ_SECOND_WEIGHTS, dtype=np.int32) % 11
+    second = np.where(second < 2, 0, 11 - second)
+
+    # Sequências de um único dígito repetido passam no módulo 11, mas não são CNPJs
+    repeated = (digits == digits[:, :1]).all(axis=1)
+
+    valid = (digits[:, 12] == first) & (digits[:, 13] == second) & ~repeated
+    return valid.tolist()
+
+def _validate_cnpj_scalar(cnpj):
+    digits = [int(d) for d in cnpj]
+    if len(set(digits)) == 1:
+        return False
+
+    first = _check_digit(sum(d * w for d, w in zip(digits[:12], CNPJ_FIRST_WEIGHTS)))
+    second = _check_digit(sum(d * w for d, w in zip(digits[:13], CNPJ_SECOND_WEIGHTS)))
+    return digits[12] == first and digits[13] == second
+
+def format_cnpj(cnpj):
+    """Formata 14 dígitos como XX.XXX.XXX/XXXX-XX."""
+    return f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}"
+
+def format_cep(cep):
+    """Formata 8 dígitos como XXXXX-XXX."""
+    return f"{cep[:5]}-{cep[5:]}"
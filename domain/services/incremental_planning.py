@@ -0,0 +1,110 @@
+import datetime
+
+def record_contacts(record):
+    """Retorna os contatos de um resultado, no formato da execução ('contacts') ou de Store ('data')."""
+    contacts = record.get("contacts") or record.get("data") or {}
+    return contacts.to_dict() if hasattr(contacts, "to_dict") else contacts
+
+def _normalized_contacts(record):
+    """Contatos com as listas ordenadas, para comparar resultados sem depender da ordem."""
+    def normalize(value):
+        if isinstance(value, dict):
+            return {key: normalize(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return sorted(normalize(item) for item in value)
+        return value
+
+    return normalize(record_contacts(record))
+
+class IncrementalPlanner:
+    """
+    Decide quais lojas precisam ser processadas de novo numa execução incremental.
+
+    Uma loja é agendada se:
+    - 'new': não aparece nos resultados anteriores
+    - 'failed': o resultado anterior foi uma falha (se `retry_failed`)
+    - 'stale': o resultado anterior é mais velho que o TTL
+    - 'undated': o resultado anterior não tem 'scrapingTime'
+
+    As demais reaproveitam o resultado anterior.
+    """
+
+    def __init__(self, ttl_hours=168, retry_failed=True):
+        """
+        Args:
+            ttl_hours (float): Idade máxima de um resultado para ser reaproveitado
+            retry_failed (bool): Se lojas que falharam antes são sempre agendadas
+        """
+        self.ttl = datetime.timedelta(hours=ttl_hours)
+        self.retry_failed = retry_failed
+
+    def reason(self, previous, now=None):
+        """
+        Retorna o motivo para processar a loja de novo, ou None se o resultado anterior ainda vale.
+
+        Args:
+            previous (dict): Resultado anterior da loja (ou None)
+            now (datetime): Instante de referência (padrão: agora)
+        """
+        if previous is None:
+            return "new"
+        if self.retry_failed and not previous.get("success", False):
+            return "failed"
+
+        try:
+            scraped_at = datetime.datetime.fromisoformat(previous["scrapingTime"])
+        except (KeyError, TypeError, ValueError):
+            return "undated"
+
+        now = now or datetime.datetime.now(scraped_at.tzinfo)
+        if now - scraped_at > self.ttl:
+            return "stale"
+        return None
+
+    def plan(self, store_names, previous_results, now=None):
+        """
+        Separa as lojas do catálogo entre as que serão processadas e as reaproveitadas.
+
+        Args:
+            store_names (list): Lojas do catálogo
+            previous_results (dict): Nome da loja -> resultado anterior
+            now (datetime): Instante de referência (padrão: agora)
+
+        Returns:
+            tuple: (lojas agendadas, {loja agendada: motivo}, lojas reaproveitadas)
+        """
+        scheduled, reasons, reused = [], {}, []
+        for name in store_names:
+            reason = self.reason(previous_results.get(name), now)
+            if reason is None:
+                reused.append(name)
+            else:
+                scheduled.append(name)
+                reasons[name] = reason
+        return scheduled, reasons, reused
+
+    @staticmethod
+    def delta(previous_results, current_results):
+        """
+        Seleciona os resultados desta execução que mudam o conjunto de dados.
+
+        Args:
+            previous_results (dict): Nome da loja -> resultado anterior
+            current_results (list): Resultados processados nesta execução
+
+        Returns:
+            list: Resultados novos ou cujo desfecho ou contatos mudaram, com o campo
+                  'delta' ('new', 'changed')
+        """
+        changes = []
+        for result in current_results:
+            previous = previous_results.get(result.get("nome_loja"))
+            if previous is None:
+                change = "new"
+            elif (previous.get("success", False) != result.get("success", False)
+                  or _normalized_contacts(previous) != _normalized_contacts(result)):
+                change = "changed"
+            else:
+                continue
+            changes.append(dict(result, delta=change))
+        return changes
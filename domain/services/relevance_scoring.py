@@ -0,0 +1,91 @@
+import re
+from urllib.parse import urlsplit
+from domain.services.text_normalization import normalize_text
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Palavras que aparecem em nomes de lojas oficiais mas não identificam a marca
+STOPWORDS = frozenset({
+    "a", "o", "e", "de", "da", "do", "das", "dos", "the", "and",
+    "loja", "lojas", "oficial", "official", "store", "shop", "brasil", "brazil", "br"
+})
+
+def name_tokens(text):
+    """Tokens significativos de um texto normalizado (sem acentos e sem palavras genéricas)."""
+    return [token for token in TOKEN_PATTERN.findall(normalize_text(text)) if token not in STOPWORDS]
+
+class RelevanceScorer:
+    """
+    Pontua o quanto um resultado de pesquisa pertence a uma loja, antes de buscá-lo.
+
+    Compara os tokens do nome da loja (sem acentos) com o domínio, o título e o
+    trecho do resultado. O domínio pesa mais: um resultado em `nomedaloja.com.br`
+    quase certamente é da loja, enquanto redes sociais e portais só citam o nome.
+    """
+
+    def __init__(self, threshold=0.3, domain_weight=0.5, title_weight=0.3, snippet_weight=0.2):
+        """
+        Args:
+            threshold (float): Pontuação mínima para o resultado ser buscado
+            domain_weight (float): Peso da correspondência no domínio
+            title_weight (float): Peso da sobreposição com o título
+            snippet_weight (float): Peso da sobreposição com o trecho
+        """
+        self.threshold = threshold
+        self.domain_weight = domain_weight
+        self.title_weight = title_weight
+        self.snippet_weight = snippet_weight
+
+    def score(self, store_name, result, tokens=None):
+        """
+        Calcula a relevância de um resultado para a loja.
+
+        Args:
+            store_name (str): Nome da loja
+            result (dict): Resultado com 'link', 'title' e 'snippet'
+            tokens (list): Tokens do nome já calculados (opcional)
+
+        Returns:
+            float: Pontuação entre 0 e 1
+        """
+        tokens = tokens if tokens is not None else name_tokens(store_name)
+        if not tokens:
+            return 1.0
+
+        host = (urlsplit(result.get('link') or "").hostname or "").lower()
+        host_text = host.replace('-', '').replace('.', '')
+        if ''.join(tokens) in host_text:
+            domain_score = 1.0
+        else:
+            domain_score = sum(1 for token in tokens if token in host_text) / len(tokens)
+
+        title_tokens = set(name_tokens(result.get('title') or ""))
+        snippet_tokens = set(name_tokens(result.get('snippet') or ""))
+        title_score = sum(1 for token in tokens if token in title_tokens) / len(tokens)
+        snippet_score = sum(1 for token in tokens if token in snippet_tokens) / len(tokens)
+
+        return (
+            self.domain_weight * domain_score
+            + self.title_weight * title_score
+            + self.snippet_weight * snippet_score
+        )
+
+    def rank(self, store_name, results):
+        """
+        Ordena os resultados por relevância e descarta os abaixo do limite.
+
+        Args:
+            store_name (str): Nome da loja
+            results (list): Resultados da pesquisa
+
+        Returns:
+            tuple: (resultados relevantes do mais ao menos relevante, quantidade descartada)
+        """
+        tokens = name_tokens(store_name)
+        scored = [(self.score(store_name, result, tokens), i, result) for i, result in enumerate(results)]
+
+        relevant = sorted(
+            (item for item in scored if item[0] >= self.threshold),
+            key=lambda item: (-item[0], item[1])
+        )
+        return [result for _, _, result in relevant], len(scored) - len(relevant)
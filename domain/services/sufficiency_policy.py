@@ -0,0 +1,48 @@
+class SufficiencyPolicy:
+    """
+    Decide, a partir dos contatos já extraídos de uma loja, se novas buscas valem a pena.
+
+    Os contatos são suficientes quando todos os campos exigidos têm ao menos um
+    valor e há o número mínimo de perfis em redes sociais.
+    """
+
+    FIELDS = ("emails", "phones", "whatsapp", "cnpjs", "ceps")
+
+    def __init__(self, require=("emails", "phones"), min_social_profiles=1):
+        """
+        Args:
+            require (tuple): Campos que precisam de ao menos um valor
+                             ('emails', 'phones', 'whatsapp', 'cnpjs', 'ceps')
+            min_social_profiles (int): Perfis distintos em redes sociais exigidos
+        """
+        unknown = [field for field in require if field not in self.FIELDS]
+        if unknown:
+            raise ValueError(f"Campos desconhecidos na política de suficiência: {unknown}")
+
+        self.require = tuple(require)
+        self.min_social_profiles = min_social_profiles
+
+    def is_sufficient(self, contacts_list):
+        """
+        Verifica se os contatos reunidos até aqui bastam.
+
+        Args:
+            contacts_list (list): Contatos (ContactInfo) extraídos das páginas já processadas
+
+        Returns:
+            bool: True se nenhuma outra página precisa ser buscada
+        """
+        for field in self.require:
+            if field == "whatsapp":
+                found = any(c.whatsapp["links"] or c.whatsapp["numbers"] for c in contacts_list)
+            else:
+                found = any(getattr(c, field) for c in contacts_list)
+            if not found:
+                return False
+
+        if self.min_social_profiles:
+            profiles = {url for c in contacts_list for urls in c.social_media.values() for url in urls}
+            if len(profiles) < self.min_social_profiles:
+                return False
+
+        return True
@@ -0,0 +1,22 @@
+import re
+import unicodedata
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+def fold_accents(text):
+    """Remove acentos e diacríticos (ex.: "Ação" -> "Acao")."""
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+def normalize_text(text):
+    """
+    Normaliza um texto para comparação: sem acentos, em minúsculas e com
+    espaços colapsados.
+
+    Args:
+        text (str): Texto original
+
+    Returns:
+        str: Texto normalizado
+    """
+    return WHITESPACE_PATTERN.sub(' ', fold_accents(text).casefold()).strip()
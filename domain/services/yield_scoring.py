@@ -0,0 +1,125 @@
+import heapq
+import itertools
+
+def contact_count(record):
+    """Conta os contatos (e-mails, telefones, WhatsApp e perfis sociais) de um resultado anterior."""
+    contacts = record.get("contacts") or record.get("data") or {}
+    if hasattr(contacts, "to_dict"):
+        contacts = contacts.to_dict()
+
+    whatsapp = contacts.get("whatsapp") or {}
+    social = contacts.get("socialMedia") or {}
+    return (
+        len(contacts.get("emails") or []) + len(contacts.get("phones") or [])
+        + len(whatsapp.get("numbers") or []) + sum(len(urls) for urls in social.values())
+    )
+
+class YieldEstimator:
+    """
+    Estima a chance (0 a 1) de uma loja render contatos, a partir de sinais obtidos sem buscar páginas.
+
+    Sinais (None quando desconhecido, substituído pela probabilidade a priori):
+    - histórico: desfecho e número de contatos da execução anterior
+    - site adivinhado: se o domínio adivinhado pelo slug já foi verificado e existe
+    - pesquisa: relevância do melhor resultado de pesquisa em cache
+    """
+
+    def __init__(self, prior=0.5, history_weight=0.5, site_weight=0.3, search_weight=0.2):
+        """
+        Args:
+            prior (float): Estimativa usada para sinais desconhecidos
+            history_weight (float): Peso do histórico da loja
+            site_weight (float): Peso do site adivinhado pelo slug
+            search_weight (float): Peso da qualidade dos resultados de pesquisa
+        """
+        self.prior = prior
+        self.weights = (history_weight, site_weight, search_weight)
+
+    def history_signal(self, previous):
+        """Sinal do resultado anterior: sucessos valem mais quanto mais contatos tinham."""
+        if previous is None:
+            return None
+        if not previous.get("success", False):
+            return 0.1
+        return 0.6 + 0.4 * min(1.0, contact_count(previous) / 5)
+
+    @staticmethod
+    def site_signal(site_resolved):
+        if site_resolved is None:
+            return None
+        return 1.0 if site_resolved else 0.2
+
+    def score(self, previous=None, site_resolved=None, search_quality=None):
+        """
+        Calcula o rendimento esperado da loja.
+
+        Args:
+            previous (dict): Resultado da execução anterior (ou None)
+            site_resolved (bool): Se o site adivinhado existe (None se ainda não verificado)
+            search_quality (float): Relevância do melhor resultado em cache (None se não há pesquisa em cache)
+
+        Returns:
+            float: Rendimento esperado entre 0 e 1
+        """
+        signals = (self.history_signal(previous), self.site_signal(site_resolved), search_quality)
+        total = sum(self.weights)
+        if not total:
+            return self.prior
+
+        return sum(
+            weight * (self.prior if signal is None else signal)
+            for weight, signal in zip(self.weights, signals)
+        ) / total
+
+class StorePriorityQueue:
+    """
+    Fila de prioridade de lojas (heap): a de maior rendimento esperado sai primeiro.
+
+    Empates são desfeitos pelo menor custo em pesquisas e depois pela ordem de
+    entrada. Atualizar a prioridade de uma loja invalida a entrada anterior,
+    que é descartada ao chegar ao topo.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._entries = {}
+        self._counter = itertools.count()
+
+    def push(self, store_name, score, cost=0):
+        """Adiciona a loja ou atualiza sua prioridade."""
+        entry = [-score, cost, next(self._counter), store_name, True]
+        previous = self._entries.get(store_name)
+        if previous is not None:
+            previous[-1] = False
+        self._entries[store_name] = entry
+        heapq.heappush(self._heap, entry)
+
+    def pop(self):
+        """
+        Retira a loja de maior prioridade.
+
+        Returns:
+            tuple: (nome da loja, rendimento esperado)
+
+        Raises:
+            IndexError: Se a fila estiver vazia
+        """
+        while self._heap:
+            neg_score, _, _, store_name, valid = heapq.heappop(self._heap)
+            if valid:
+                del self._entries[store_name]
+                return store_name, -neg_score
+        raise IndexError("Fila de prioridade vazia")
+
+    def drain(self):
+        """Retira todas as lojas, da maior para a menor prioridade."""
+        ordered = []
+        while self._entries:
+            ordered.append(self.pop()[0])
+        return ordered
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, store_name):
+        return store_name in self._entries
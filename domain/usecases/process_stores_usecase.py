@@ -1,201 +1,121 @@
-<<<<<<< HEAD
-# Importação das bibliotecas necessárias
-# logging: Para registrar informações e erros durante a execução
-# Store: Nossa classe que representa uma loja e seus dados
-=======
->>>>>>> origin/main
 import logging
 from domain.entities.store import Store
 
 class ProcessStoresUseCase:
-<<<<<<< HEAD
-    """
-    Classe responsável por processar lojas e extrair suas informações
-    
-    Esta classe coordena todo o processo de:
-    1. Carregar dados das lojas de um arquivo JSON
-    2. Buscar o conteúdo HTML de cada loja
-    3. Extrair informações de contato do HTML
-    4. Salvar os resultados em um arquivo
-    
-    Utiliza três componentes principais:
-    - html_fetcher: Para buscar e processar conteúdo HTML
-    - contact_extractor: Para extrair informações de contato
-    - store_repository: Para carregar e salvar dados das lojas
-    """
-    
-    def __init__(self, html_fetcher, contact_extractor, store_repository):
-        """
-        Inicializa o caso de uso com seus componentes necessários
-        
-        Parâmetros:
-            html_fetcher: Componente para buscar e processar HTML
-            contact_extractor: Componente para extrair contatos
-            store_repository: Componente para persistência de dados
-        """
-        # Componentes principais do caso de uso
-        self.html_fetcher = html_fetcher          # Busca e processa HTML
-        self.contact_extractor = contact_extractor # Extrai contatos
-        self.store_repository = store_repository   # Gerencia dados
-        
-        # Configuração do logger para esta classe
-=======
     """Caso de uso para processamento de lojas."""
     
     def __init__(self, html_fetcher, contact_extractor, store_repository):
         self.html_fetcher = html_fetcher
         self.contact_extractor = contact_extractor
         self.store_repository = store_repository
->>>>>>> origin/main
         self.logger = logging.getLogger(__name__)
     
     def execute(self, json_file_path=None, output_file=None):
         """
-<<<<<<< HEAD
-        Executa o processamento completo das lojas
-        
-        Este método:
-        1. Carrega os dados das lojas do arquivo JSON
-        2. Para cada loja:
-           - Busca o conteúdo HTML da URL
-           - Extrai o texto do HTML
-           - Extrai informações de contato
-           - Registra sucesso ou falha
-        3. Salva os resultados em um arquivo
-        
-        Parâmetros:
-            json_file_path (str): Caminho do arquivo JSON com dados das lojas
-            output_file (str): Caminho para salvar os resultados
-            
-        Retorna:
-            list: Lista de objetos Store com os resultados do processamento
-        """
-        # Carrega os dados das lojas do arquivo JSON
-=======
         Processa lojas de um arquivo JSON e extrai seus contatos.
         
         Args:
             json_file_path: Caminho para arquivo JSON de entrada
-            output_file: Caminho para arquivo de saída
+            output_file: Caminho para arquivo de saída (gravado à medida que as lojas são concluídas)
             
         Returns:
             list: Lista de lojas processadas
         """
-        # Carregar dados das lojas
->>>>>>> origin/main
-        stores_data = self.store_repository.load_stores(json_file_path)
-        if not stores_data:
-            self.logger.error("Não foi possível carregar lojas de entrada")
-            return []
-            
-        self.logger.info(f"Carregadas {len(stores_data)} lojas para processamento")
-        
-<<<<<<< HEAD
-        # Lista para armazenar os resultados do processamento
         processed_stores = []
+        sink = self.store_repository.open_sink(output_file) if output_file else None
+        try:
+            for store in self.iter_execute(json_file_path):
+                processed_stores.append(store)
+                if sink is not None:
+                    sink.write(store)
+        finally:
+            if sink is not None:
+                sink.close()
         
-        # Processa cada loja individualmente
-        for i, store_data in enumerate(stores_data):
-            # Extrai informações básicas da loja
-            store_name = store_data.get('nome', f"Loja {i+1}")  # Nome ou número
-            store_url = store_data.get('url', '')               # URL da loja
-            
-            # Log do progresso
-            self.logger.info(f"Processando loja {i+1}/{len(stores_data)}: {store_name}")
-            
-            # Verifica se tem URL para processar
-=======
-        # Processamento das lojas
-        processed_stores = []
+        return processed_stores
+    
+    def stream(self, json_file_path, sink):
+        """
+        Processa as lojas gravando cada uma no sink assim que é concluída, sem acumulá-las.
         
-        for i, store_data in enumerate(stores_data):
-            store_name = store_data.get('nome', f"Loja {i+1}")
-            store_url = store_data.get('url', '')
+        Args:
+            json_file_path: Caminho para arquivo JSON de entrada
+            sink (StoreSink): Destino dos resultados (não é fechado aqui)
             
-            self.logger.info(f"Processando loja {i+1}/{len(stores_data)}: {store_name}")
+        Returns:
+            int: Número de lojas gravadas
+        """
+        count = 0
+        for store in self.iter_execute(json_file_path):
+            sink.write(store)
+            count += 1
+        return count
+    
+    def iter_execute(self, json_file_path=None):
+        """
+        Processa lojas de um arquivo JSON, devolvendo cada uma assim que é concluída.
+        
+        A entrada é lida uma loja por vez (lista JSON ou NDJSON), então a memória
+        usada não depende do tamanho do arquivo.
+        
+        Args:
+            json_file_path: Caminho para arquivo JSON de entrada
             
->>>>>>> origin/main
-            if not store_url:
-                self.logger.warning(f"URL não encontrada para a loja: {store_name}")
-                continue
-                
-            try:
-<<<<<<< HEAD
-                # Etapa 1: Buscar o conteúdo HTML da loja
-                html_content = self.html_fetcher.fetch(store_url)
-                
-                # Verifica se conseguiu obter o HTML
-=======
-                # Buscar conteúdo HTML
-                html_content = self.html_fetcher.fetch(store_url)
-                
->>>>>>> origin/main
-                if not html_content:
-                    self.logger.warning(f"Não foi possível obter conteúdo HTML da URL: {store_url}")
-                    continue
-                
-<<<<<<< HEAD
-                # Etapa 2: Extrair texto do HTML e buscar contatos
-                html_text = self.html_fetcher.extract_text(html_content)
-                contacts = self.contact_extractor.execute(html_text, store_url, store_name)
-                
-                # Etapa 3: Criar objeto Store com os dados extraídos
-                store = Store(name=store_name, url=store_url)
-                store.contact_info = contacts
-                
-                # Adiciona à lista de resultados
-                processed_stores.append(store)
-                
-                # Log das informações extraídas
-=======
-                # Processar HTML com o extrator de contatos
-                html_text = self.html_fetcher.extract_text(html_content)
-                contacts = self.contact_extractor.execute(html_text, store_url, store_name)
-                
-                # Criar objeto Store
-                store = Store(name=store_name, url=store_url)
-                store.contact_info = contacts
-                
-                # Adicionar ao resultado
-                processed_stores.append(store)
-                
-                # Registrar estatísticas
->>>>>>> origin/main
-                phones_count = len(contacts.phones)
-                self.logger.info(f"Extraídos {phones_count} telefones da loja {store_name}")
-                
-            except Exception as e:
-<<<<<<< HEAD
-                # Registra o erro no log
-                self.logger.error(f"Erro ao processar loja {store_name}: {str(e)}")
-                
-                # Cria um objeto Store marcando a falha
-                failed_store = Store(name=store_name, url=store_url)
-                failed_store.success = False           # Marca como falha
-                failed_store.error = str(e)           # Salva a mensagem de erro
-                
-                # Adiciona à lista de resultados
-                processed_stores.append(failed_store)
+        Yields:
+            Store: Loja processada (com os contatos ou com o erro)
+        """
+        count = 0
+        for i, store_data in enumerate(self.store_repository.iter_stores(json_file_path)):
+            store = self._process_store(i, store_data)
+            if store is not None:
+                count += 1
+                yield store
         
-        # Se foi especificado um arquivo de saída, salva os resultados
-        if output_file:
-            # Converte os objetos Store para dicionários
-            stores_dict = [store.to_dict() for store in processed_stores]
-            # Salva no arquivo especificado
-=======
-                self.logger.error(f"Erro ao processar loja {store_name}: {str(e)}")
-                
-                # Criar store com erro
-                failed_store = Store(name=store_name, url=store_url)
-                failed_store.success = False
-                failed_store.error = str(e)
-                
-                processed_stores.append(failed_store)
+        if count == 0:
+            self.logger.error("Nenhuma loja de entrada processada")
+    
+    def _process_store(self, i, store_data):
+        """
+        Busca a página de uma loja e extrai seus contatos.
         
-        # Salvar resultados
-        if output_file:
-            stores_dict = [store.to_dict() for store in processed_stores]
->>>>>>> origin/main
-            self.store_repository.save_stores(stores_dict, output_file)
+        Returns:
+            Store: Loja processada, ou None se a loja não tem URL ou a página não pôde ser obtida
+        """
+        store_name = store_data.get('nome', f"Loja {i+1}")
+        store_url = store_data.get('url', '')
         
-        return processed_stores
+        self.logger.info(f"Processando loja {i+1}: {store_name}")
+        
+        if not store_url:
+            self.logger.warning(f"URL não encontrada para a loja: {store_name}")
+            return None
+            
+        try:
+            # Buscar conteúdo HTML
+            html_content = self.html_fetcher.fetch(store_url)
+            
+            if not html_content:
+                self.logger.warning(f"Não foi possível obter conteúdo HTML da URL: {store_url}")
+                return None
+            
+            # Processar HTML com o extrator de contatos
+            html_text = self.html_fetcher.extract_text(html_content)
+            contacts = self.contact_extractor.execute(html_text, store_url, store_name)
+            
+            # Criar objeto Store
+            store = Store(name=store_name, url=store_url)
+            store.contact_info = contacts
+            
+            # Registrar estatísticas
+            phones_count = len(contacts.phones)
+            self.logger.info(f"Extraídos {phones_count} telefones da loja {store_name}")
+            return store
+            
+        except Exception as e:
+            self.logger.error(f"Erro ao processar loja {store_name}: {str(e)}")
+            
+            # Criar store com erro
+            failed_store = Store(name=store_name, url=store_url)
+            failed_store.success = False
+            failed_store.error = str(e)
+            return failed_store
@@ -0,0 +1,190 @@
+import hashlib
+import json
+import math
+import os
+import struct
+
+class BloomFilter:
+    """Filtro de Bloom de capacidade fixa com taxa de falso positivo configurável."""
+
+    def __init__(self, capacity, error_rate=0.001):
+        if capacity <= 0:
+            raise ValueError("capacity deve ser maior que zero")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate deve estar entre 0 e 1")
+
+        self.capacity = int(capacity)
+        self.error_rate = error_rate
+
+        # Dimensionamento ótimo: m = -n ln(p) / ln(2)^2 e k = m/n ln(2)
+        self.num_bits = max(8, int(math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / self.capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        """Calcula as posições dos bits via double hashing (Kirsch-Mitzenmacher)."""
+        digest = hashlib.blake2b(str(item).encode('utf-8'), digest_size=16).digest()
+        h1, h2 = struct.unpack('<QQ', digest)
+        h2 |= 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item):
+        """
+        Adiciona um item ao filtro.
+
+        Args:
+            item: Item a ser adicionado (convertido para str)
+
+        Returns:
+            bool: True se o item ainda não estava (provavelmente) presente
+        """
+        is_new = False
+        for pos in self._positions(item):
+            byte_index, mask = pos >> 3, 1 << (pos & 7)
+            if not self.bits[byte_index] & mask:
+                self.bits[byte_index] |= mask
+                is_new = True
+
+        if is_new:
+            self.count += 1
+        return is_new
+
+    def __contains__(self, item):
+        for pos in self._positions(item):
+            if not self.bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def is_full(self):
+        """Indica se o filtro atingiu a capacidade para a qual foi dimensionado."""
+        return self.count >= self.capacity
+
+class ScalableBloomFilter:
+    """
+    Filtro de Bloom escalável (Almeida et al.).
+
+    Encadeia filtros de capacidade crescente e taxa de erro cada vez mais
+    restrita, mantendo a taxa de falso positivo total abaixo de `error_rate`
+    sem precisar conhecer o volume final de itens.
+    """
+
+    MAGIC = b'SBF1'
+
+    def __init__(self, initial_capacity=10000, error_rate=0.001, growth_factor=2, tightening_ratio=0.85):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth_factor = growth_factor
+        self.tightening_ratio = tightening_ratio
+        self.filters = []
+
+    def _add_filter(self):
+        index = len(self.filters)
+        capacity = self.initial_capacity * (self.growth_factor ** index)
+        # A soma da série geométrica mantém o erro total <= error_rate
+        error_rate = self.error_rate * (1 - self.tightening_ratio) * (self.tightening_ratio ** index)
+        new_filter = BloomFilter(capacity, error_rate)
+        self.filters.append(new_filter)
+        return new_filter
+
+    def add(self, item):
+        """
+        Adiciona um item, criando um novo filtro interno quando o atual enche.
+
+        Returns:
+            bool: True se o item ainda não estava (provavelmente) presente
+        """
+        if item in self:
+            return False
+
+        current = self.filters[-1] if self.filters else None
+        if current is None or current.is_full:
+            current = self._add_filter()
+
+        return current.add(item)
+
+    def __contains__(self, item):
+        # Filtros mais recentes são maiores; consultar do mais novo para o mais antigo
+        for bloom in reversed(self.filters):
+            if item in bloom:
+                return True
+        return False
+
+    def __len__(self):
+        return sum(len(bloom) for bloom in self.filters)
+
+    def save(self, file_path):
+        """
+        Serializa o filtro em disco.
+
+        Formato: MAGIC + tamanho do cabeçalho (uint32) + cabeçalho JSON + bits de cada filtro.
+
+        Args:
+            file_path (str): Caminho do arquivo de destino
+        """
+        header = {
+            "initial_capacity": self.initial_capacity,
+            "error_rate": self.error_rate,
+            "growth_factor": self.growth_factor,
+            "tightening_ratio": self.tightening_ratio,
+            "filters": [
+                {
+                    "capacity": bloom.capacity,
+                    "error_rate": bloom.error_rate,
+                    "count": bloom.count
+                }
+                for bloom in self.filters
+            ]
+        }
+        header_bytes = json.dumps(header).encode('utf-8')
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Escrever em arquivo temporário para nunca deixar um filtro truncado em disco
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack('<I', len(header_bytes)))
+            f.write(header_bytes)
+            for bloom in self.filters:
+                f.write(bloom.bits)
+        os.replace(tmp_path, file_path)
+
+    @classmethod
+    def load(cls, file_path):
+        """
+        Carrega um filtro serializado com `save`.
+
+        Args:
+            file_path (str): Caminho do arquivo
+
+        Returns:
+            ScalableBloomFilter: Filtro restaurado
+        """
+        with open(file_path, 'rb') as f:
+            if f.read(4) != cls.MAGIC:
+                raise ValueError(f"Arquivo não é um filtro de Bloom válido: {file_path}")
+
+            (header_size,) = struct.unpack('<I', f.read(4))
+            header = json.loads(f.read(header_size).decode('utf-8'))
+
+            scalable = cls(
+                initial_capacity=header["initial_capacity"],
+                error_rate=header["error_rate"],
+                growth_factor=header["growth_factor"],
+                tightening_ratio=header["tightening_ratio"]
+            )
+
+            for meta in header["filters"]:
+                bloom = BloomFilter(meta["capacity"], meta["error_rate"])
+                bloom.bits = bytearray(f.read(len(bloom.bits)))
+                bloom.count = meta["count"]
+                scalable.filters.append(bloom)
+
+        return scalable
@@ -0,0 +1,89 @@
+import threading
+
+# Domínios conhecidos que nunca são o site próprio de uma loja, por classe
+DEFAULT_DOMAIN_CLASSES = {
+    "marketplace": [
+        "mercadolivre.com.br", "mercadolivre.com", "mercadolibre.com", "amazon.com.br", "amazon.com",
+        "shopee.com.br", "magazineluiza.com.br", "magalu.com.br", "americanas.com.br", "submarino.com.br",
+        "shoptime.com.br", "casasbahia.com.br", "pontofrio.com.br", "extra.com.br", "carrefour.com.br",
+        "aliexpress.com", "netshoes.com.br", "dafiti.com.br", "kabum.com.br", "olx.com.br", "enjoei.com.br",
+        "elo7.com.br", "zoom.com.br", "buscape.com.br"
+    ],
+    "social": [
+        "facebook.com", "fb.com", "instagram.com", "twitter.com", "x.com", "linkedin.com",
+        "youtube.com", "youtu.be", "tiktok.com", "pinterest.com", "threads.net", "wa.me", "whatsapp.com"
+    ],
+    "news": [
+        "globo.com", "uol.com.br", "terra.com.br", "r7.com", "estadao.com.br", "folha.uol.com.br",
+        "exame.com", "infomoney.com.br", "metropoles.com", "cnnbrasil.com.br", "band.uol.com.br",
+        "wikipedia.org", "medium.com", "blogspot.com"
+    ],
+    "review": [
+        "reclameaqui.com.br", "consumidor.gov.br", "trustpilot.com", "ebit.com.br", "glassdoor.com.br",
+        "glassdoor.com", "indeed.com", "econodata.com.br", "cnpj.biz", "casadosdados.com.br", "cnpja.com"
+    ]
+}
+
+class DomainTrie:
+    """
+    Trie de domínios com os rótulos invertidos (ex.: 'com' → 'br' → 'loja').
+
+    A classificação de um host percorre seus rótulos do fim para o começo, em
+    O(número de rótulos), e devolve a classe do sufixo registrado mais longo:
+    'm.facebook.com' e 'pt-br.facebook.com' caem em 'facebook.com'.
+    """
+
+    def __init__(self, domain_classes=None):
+        """
+        Args:
+            domain_classes (dict): Classe -> lista de domínios
+        """
+        self._root = {}
+        self._size = 0
+        for domain_class, domains in (domain_classes or {}).items():
+            for domain in domains:
+                self.add(domain, domain_class)
+
+    def add(self, domain, domain_class):
+        """Registra um domínio (e todos os seus subdomínios) em uma classe."""
+        node = self._root
+        for label in reversed(domain.lower().strip('.').split('.')):
+            node = node.setdefault(label, {})
+        if None not in node:
+            self._size += 1
+        node[None] = domain_class
+
+    def classify(self, host):
+        """
+        Classifica um host pelo sufixo registrado mais longo.
+
+        Args:
+            host (str): Host da URL (ex.: 'www.instagram.com')
+
+        Returns:
+            str: Classe do domínio ou None se o host não é conhecido
+        """
+        node = self._root
+        domain_class = None
+        for label in reversed((host or "").lower().rstrip('.').split('.')):
+            node = node.get(label)
+            if node is None:
+                break
+            domain_class = node.get(None, domain_class)
+        return domain_class
+
+    def __len__(self):
+        return self._size
+
+_default_trie = None
+_default_lock = threading.Lock()
+
+def default_domain_trie():
+    """Retorna a trie pré-computada com os domínios conhecidos (montada uma vez por processo)."""
+    global _default_trie
+
+    if _default_trie is None:
+        with _default_lock:
+            if _default_trie is None:
+                _default_trie = DomainTrie(DEFAULT_DOMAIN_CLASSES)
+    return _default_trie
@@ -0,0 +1,224 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from infrastructure.index.bloom_filter import ScalableBloomFilter
+
+class SqliteKeyValueStore:
+    """
+    Armazenamento exato chave → valor em SQLite, para registros que não cabem em memória.
+
+    As escritas são confirmadas em lotes (a cada `commit_every` escritas ou
+    `commit_interval` segundos), para que uma queda perca no máximo o último
+    lote sem pagar um commit por chave.
+    """
+
+    def __init__(self, file_path, commit_every=500, commit_interval=5.0):
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.file_path = file_path
+        self.commit_every = commit_every
+        self.commit_interval = commit_interval
+        self._lock = threading.Lock()
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+        self._conn = sqlite3.connect(file_path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT)")
+        self._conn.commit()
+
+    def __contains__(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    def __getitem__(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return row[0]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value) VALUES (?, ?)",
+                (key, None if value is None else str(value))
+            )
+            self._uncommitted += 1
+            if self._uncommitted >= self.commit_every or time.monotonic() - self._last_commit >= self.commit_interval:
+                self._commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def keys(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT key FROM entries").fetchall()
+        return [row[0] for row in rows]
+
+    def items(self):
+        with self._lock:
+            return self._conn.execute("SELECT key, value FROM entries").fetchall()
+
+    def _commit(self):
+        self._conn.commit()
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+
+    def commit(self):
+        with self._lock:
+            self._commit()
+
+    def close(self):
+        with self._lock:
+            self._commit()
+            self._conn.close()
+
+class SeenIndex:
+    """
+    Índice de itens já vistos com um filtro de Bloom na frente da estrutura exata.
+
+    Expõe a mesma interface de dicionário usada pelo registro global de
+    telefones (`in`, `[]`, `get`), de forma que pode substituí-lo diretamente.
+    A estrutura exata (dict em memória ou SQLite em disco) só é consultada
+    quando o filtro responde "talvez".
+    """
+
+    def __init__(self, name, error_rate=0.001, initial_capacity=10000, directory=None,
+                 commit_every=500, commit_interval=5.0):
+        """
+        Args:
+            name (str): Nome do índice, usado nos arquivos persistidos
+            error_rate (float): Taxa máxima de falso positivo do filtro
+            initial_capacity (int): Capacidade inicial do filtro escalável
+            directory (str): Diretório para persistência; se None, tudo fica em memória
+            commit_every (int): Escritas entre commits do SQLite
+            commit_interval (float): Segundos máximos entre commits do SQLite
+        """
+        self.name = name
+        self.directory = directory
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+        self.exact = {}
+        if directory:
+            self.exact = SqliteKeyValueStore(self.exact_path, commit_every=commit_every, commit_interval=commit_interval)
+            self.bloom = self._load_bloom(initial_capacity, error_rate)
+        else:
+            self.bloom = ScalableBloomFilter(initial_capacity=initial_capacity, error_rate=error_rate)
+
+        # Estatísticas de uso do filtro
+        self.stats = {
+            "lookups": 0,
+            "bloom_negatives": 0,
+            "exact_lookups": 0,
+            "false_positives": 0
+        }
+
+    def _load_bloom(self, initial_capacity, error_rate):
+        """
+        Carrega o filtro persistido; se ele não existir ou não puder ser lido,
+        reconstrói o filtro a partir das chaves já gravadas em SQLite.
+
+        O arquivo do filtro é removido após a carga e só volta a existir no
+        próximo `save()`: se o processo cair depois de novos commits no
+        SQLite, a execução seguinte reconstrói o filtro em vez de carregar
+        uma versão que desconhece essas chaves.
+        """
+        if os.path.exists(self.bloom_path):
+            try:
+                bloom = ScalableBloomFilter.load(self.bloom_path)
+                self.logger.info(f"Filtro de Bloom '{self.name}' carregado de {self.bloom_path}")
+                os.remove(self.bloom_path)
+                return bloom
+            except Exception as e:
+                self.logger.warning(f"Erro ao carregar filtro de Bloom '{self.name}': {str(e)}")
+
+        bloom = ScalableBloomFilter(initial_capacity=initial_capacity, error_rate=error_rate)
+        keys = self.exact.keys()
+        for key in keys:
+            bloom.add(key)
+        if keys:
+            self.logger.info(f"Filtro de Bloom '{self.name}' reconstruído com {len(keys)} itens")
+        return bloom
+
+    @property
+    def bloom_path(self):
+        return os.path.join(self.directory, f"{self.name}.bloom") if self.directory else None
+
+    @property
+    def exact_path(self):
+        return os.path.join(self.directory, f"{self.name}.sqlite") if self.directory else None
+
+    def __contains__(self, key):
+        with self._lock:
+            self.stats["lookups"] += 1
+            if key not in self.bloom:
+                self.stats["bloom_negatives"] += 1
+                return False
+
+            self.stats["exact_lookups"] += 1
+            found = key in self.exact
+            if not found:
+                self.stats["false_positives"] += 1
+            return found
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        return self.exact[key]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self.bloom.add(key)
+            self.exact[key] = value
+
+    def __len__(self):
+        return len(self.exact)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def items(self):
+        """Retorna os pares (item, valor) da estrutura exata."""
+        with self._lock:
+            return list(self.exact.items())
+
+    def add(self, key, value=None):
+        """
+        Marca um item como visto.
+
+        Returns:
+            bool: True se o item ainda não estava no índice
+        """
+        with self._lock:
+            if key in self.bloom and key in self.exact:
+                return False
+            self.bloom.add(key)
+            self.exact[key] = value
+            return True
+
+    def save(self):
+        """Persiste o filtro e a estrutura exata, se o índice tiver diretório."""
+        if not self.directory:
+            return False
+
+        with self._lock:
+            self.bloom.save(self.bloom_path)
+            self.exact.commit()
+
+        self.logger.info(f"Índice '{self.name}' salvo em {self.directory} ({len(self)} itens)")
+        return True
+
+    def close(self):
+        """Salva e libera os recursos do índice."""
+        self.save()
+        if isinstance(self.exact, SqliteKeyValueStore):
+            self.exact.close()
@@ -0,0 +1,125 @@
+import hashlib
+import re
+import threading
+from collections import Counter
+
+SCRIPT_STYLE_PATTERN = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+FINGERPRINT_BITS = 64
+
+def _hash64(token):
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'little')
+
+def simhash(text, shingle_size=3):
+    """
+    Calcula o SimHash de 64 bits de um texto a partir de shingles de palavras.
+
+    Textos quase idênticos geram fingerprints com distância de Hamming pequena.
+
+    Args:
+        text (str): Texto para o fingerprint
+        shingle_size (int): Quantidade de palavras por shingle
+
+    Returns:
+        int: Fingerprint de 64 bits
+    """
+    words = WORD_PATTERN.findall(text.lower())
+    if not words:
+        return 0
+
+    if len(words) < shingle_size:
+        shingles = Counter([' '.join(words)])
+    else:
+        shingles = Counter(' '.join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1))
+
+    weights = [0] * FINGERPRINT_BITS
+    for shingle, count in shingles.items():
+        value = _hash64(shingle)
+        for bit in range(FINGERPRINT_BITS):
+            if value >> bit & 1:
+                weights[bit] += count
+            else:
+                weights[bit] -= count
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+def html_fingerprint(html_content, shingle_size=3):
+    """
+    Calcula o SimHash do texto visível de um HTML sem montar a árvore do documento.
+
+    A remoção de tags por regex é bem mais barata que o BeautifulSoup e basta
+    para decidir se a página já foi vista.
+    """
+    text = SCRIPT_STYLE_PATTERN.sub(' ', html_content)
+    text = TAG_PATTERN.sub(' ', text)
+    return simhash(text, shingle_size)
+
+def hamming_distance(a, b):
+    return bin(a ^ b).count('1')
+
+class SimHashIndex:
+    """
+    Índice de fingerprints SimHash para busca de documentos quase duplicados.
+
+    Usa o princípio da casa dos pombos: com `max_distance + 1` faixas de bits,
+    dois fingerprints a até `max_distance` bits de distância coincidem em pelo
+    menos uma faixa inteira, então só os documentos de faixas iguais são comparados.
+    """
+
+    def __init__(self, max_distance=3):
+        self.max_distance = max_distance
+        self.num_bands = max_distance + 1
+        self.band_bits = FINGERPRINT_BITS // self.num_bands
+        self.band_mask = (1 << self.band_bits) - 1
+
+        self._buckets = [dict() for _ in range(self.num_bands)]
+        self._entries = []
+        self._lock = threading.Lock()
+
+    def _bands(self, fingerprint):
+        return [(fingerprint >> (i * self.band_bits)) & self.band_mask for i in range(self.num_bands)]
+
+    def add(self, fingerprint, value):
+        """
+        Adiciona um documento ao índice.
+
+        Args:
+            fingerprint (int): SimHash do documento
+            value: Dado associado ao documento (ex.: resultado da extração)
+        """
+        with self._lock:
+            entry_id = len(self._entries)
+            self._entries.append((fingerprint, value))
+            for band_index, band in enumerate(self._bands(fingerprint)):
+                self._buckets[band_index].setdefault(band, []).append(entry_id)
+
+    def find(self, fingerprint):
+        """
+        Procura o documento mais próximo dentro da distância máxima.
+
+        Returns:
+            tuple: (valor, distância) ou (None, None) se não houver quase duplicata
+        """
+        best_value, best_distance = None, None
+
+        with self._lock:
+            candidates = set()
+            for band_index, band in enumerate(self._bands(fingerprint)):
+                candidates.update(self._buckets[band_index].get(band, ()))
+
+            for entry_id in candidates:
+                entry_fingerprint, value = self._entries[entry_id]
+                distance = hamming_distance(fingerprint, entry_fingerprint)
+                if distance <= self.max_distance and (best_distance is None or distance < best_distance):
+                    best_value, best_distance = value, distance
+
+        return best_value, best_distance
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,221 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from application.services.work_queue import WorkQueue, WorkLease
+from infrastructure.repositories.store_repository import to_serializable
+
+STATES = ("pending", "leased", "done", "dead")
+
+class SqliteWorkQueue(WorkQueue):
+    """
+    Fila de lojas em um arquivo SQLite, compartilhável entre processos e máquinas.
+
+    Implementação de referência de `WorkQueue`: o arquivo pode ficar em um
+    armazenamento compartilhado e cada worker abre sua própria conexão. As
+    concessões são feitas em transações `BEGIN IMMEDIATE`, de forma que dois
+    workers nunca recebem a mesma loja. O journal padrão (rollback) é mantido
+    porque o modo WAL não funciona em sistemas de arquivos de rede.
+
+    Uma concessão vale `lease_seconds` e é renovada por heartbeats. Se o worker
+    morrer, a concessão vence e a loja é repassada a outro worker; cada
+    concessão conta como uma tentativa e, após `max_attempts`, a loja vai para
+    'dead'. Falhas registradas com `fail` voltam à fila com espera exponencial.
+    """
+
+    def __init__(self, file_path, lease_seconds=300, max_attempts=3, retry_delay_seconds=60, busy_timeout=30):
+        """
+        Args:
+            file_path (str): Caminho do arquivo da fila
+            lease_seconds (float): Duração de uma concessão sem heartbeat
+            max_attempts (int): Concessões permitidas antes de mover a loja para 'dead'
+            retry_delay_seconds (float): Espera antes da primeira nova tentativa (dobra a cada falha)
+            busy_timeout (float): Tempo de espera pelo bloqueio do arquivo, em segundos
+        """
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.file_path = file_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay_seconds = retry_delay_seconds
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(file_path, timeout=busy_timeout, isolation_level=None, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS work_items ("
+            "seq INTEGER PRIMARY KEY AUTOINCREMENT, store_name TEXT UNIQUE NOT NULL, link TEXT, "
+            "state TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0, "
+            "lease_owner TEXT, lease_token TEXT, lease_expires_at REAL, available_at REAL NOT NULL DEFAULT 0, "
+            "last_error TEXT, result TEXT, updated_at REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS work_items_state ON work_items (state, available_at)")
+
+        self.stats = {"leased": 0, "expired_reclaimed": 0, "completed": 0, "failed": 0, "dead_lettered": 0}
+
+    def _transaction(self, operation):
+        """Executa `operation(conn)` em uma transação com bloqueio de escrita imediato."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                value = operation(self._conn)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return value
+
+    def enqueue(self, stores):
+        now = time.time()
+
+        def insert(conn):
+            added = 0
+            for name, link in stores:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO work_items (store_name, link, available_at, updated_at) VALUES (?, ?, 0, ?)",
+                    (name, link, now)
+                )
+                added += cursor.rowcount
+            return added
+
+        added = self._transaction(insert)
+        self.logger.info(f"Fila {self.file_path}: {added} lojas adicionadas, {len(stores) - added} já presentes")
+        return added
+
+    def lease(self, worker_id, limit=1):
+        now = time.time()
+        expires_at = now + self.lease_seconds
+
+        def take(conn):
+            # Concessões vencidas de lojas que já esgotaram as tentativas vão para 'dead'
+            dead = conn.execute(
+                "UPDATE work_items SET state = 'dead', lease_owner = NULL, lease_token = NULL, updated_at = ?, "
+                "last_error = COALESCE(last_error, 'Concessão vencida sem conclusão') "
+                "WHERE state = 'leased' AND lease_expires_at < ? AND attempts >= ?",
+                (now, now, self.max_attempts)
+            ).rowcount
+
+            rows = conn.execute(
+                "SELECT store_name, link, attempts, state FROM work_items "
+                "WHERE (state = 'pending' AND available_at <= ?) OR (state = 'leased' AND lease_expires_at < ?) "
+                "ORDER BY seq LIMIT ?",
+                (now, now, limit)
+            ).fetchall()
+
+            leases = []
+            for store_name, link, attempts, state in rows:
+                token = uuid.uuid4().hex
+                conn.execute(
+                    "UPDATE work_items SET state = 'leased', lease_owner = ?, lease_token = ?, lease_expires_at = ?, "
+                    "attempts = attempts + 1, updated_at = ? WHERE store_name = ?",
+                    (worker_id, token, expires_at, now, store_name)
+                )
+                if state == "leased":
+                    self.logger.warning(f"Concessão de '{store_name}' venceu; repassando para '{worker_id}'")
+                leases.append((WorkLease(store_name, link, token, worker_id, attempts + 1, expires_at), state))
+            return dead, leases
+
+        dead, leases = self._transaction(take)
+        with self._lock:
+            self.stats["dead_lettered"] += dead
+            self.stats["leased"] += len(leases)
+            self.stats["expired_reclaimed"] += sum(1 for _, state in leases if state == "leased")
+        return [lease for lease, _ in leases]
+
+    def heartbeat(self, leases):
+        now = time.time()
+        expires_at = now + self.lease_seconds
+
+        def renew(conn):
+            renewed = []
+            for lease in leases:
+                cursor = conn.execute(
+                    "UPDATE work_items SET lease_expires_at = ?, updated_at = ? "
+                    "WHERE store_name = ? AND lease_token = ? AND state = 'leased'",
+                    (expires_at, now, lease.store_name, lease.token)
+                )
+                if cursor.rowcount:
+                    lease.expires_at = expires_at
+                    renewed.append(lease)
+                else:
+                    self.logger.warning(f"Concessão de '{lease.store_name}' perdida por '{lease.worker_id}'")
+            return renewed
+
+        return self._transaction(renew)
+
+    def complete(self, lease, result):
+        payload = json.dumps(result, ensure_ascii=False, default=to_serializable)
+        updated = self._finish_lease(
+            lease,
+            "UPDATE work_items SET state = 'done', result = ?, lease_owner = NULL, lease_token = NULL, updated_at = ? "
+            "WHERE store_name = ? AND lease_token = ? AND state = 'leased'",
+            (payload, time.time(), lease.store_name, lease.token)
+        )
+        if updated:
+            with self._lock:
+                self.stats["completed"] += 1
+        return updated
+
+    def fail(self, lease, error):
+        now = time.time()
+        if lease.attempts >= self.max_attempts:
+            state, available_at = "dead", now
+        else:
+            state, available_at = "pending", now + self.retry_delay_seconds * (2 ** (lease.attempts - 1))
+
+        updated = self._finish_lease(
+            lease,
+            "UPDATE work_items SET state = ?, available_at = ?, last_error = ?, lease_owner = NULL, lease_token = NULL, "
+            "updated_at = ? WHERE store_name = ? AND lease_token = ? AND state = 'leased'",
+            (state, available_at, str(error), now, lease.store_name, lease.token)
+        )
+        if updated:
+            with self._lock:
+                self.stats["failed"] += 1
+                if state == "dead":
+                    self.stats["dead_lettered"] += 1
+        return updated
+
+    def release(self, lease):
+        return self._finish_lease(
+            lease,
+            "UPDATE work_items SET state = 'pending', attempts = MAX(0, attempts - 1), available_at = ?, "
+            "lease_owner = NULL, lease_token = NULL, updated_at = ? "
+            "WHERE store_name = ? AND lease_token = ? AND state = 'leased'",
+            (0, time.time(), lease.store_name, lease.token)
+        )
+
+    def _finish_lease(self, lease, sql, params):
+        """Aplica uma atualização condicionada ao token da concessão; retorna False se ela foi perdida."""
+        updated = self._transaction(lambda conn: conn.execute(sql, params).rowcount)
+        if not updated:
+            self.logger.warning(f"Concessão de '{lease.store_name}' já não pertence a '{lease.worker_id}'")
+        return bool(updated)
+
+    def counts(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT state, COUNT(*) FROM work_items GROUP BY state").fetchall()
+        counts = dict.fromkeys(STATES, 0)
+        counts.update(dict(rows))
+        return counts
+
+    def results(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT result FROM work_items WHERE state = 'done' ORDER BY seq").fetchall()
+        return [json.loads(row[0]) for row in rows if row[0]]
+
+    def dead_letters(self):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT store_name, attempts, last_error FROM work_items WHERE state = 'dead' ORDER BY seq"
+            ).fetchall()
+        return [{"nome": name, "tentativas": attempts, "erro": error} for name, attempts, error in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
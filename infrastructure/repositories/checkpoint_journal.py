@@ -0,0 +1,152 @@
+import json
+import logging
+import os
+import threading
+import time
+from infrastructure.repositories.store_repository import to_serializable
+
+class CheckpointJournal:
+    """
+    Journal de checkpoint só de acréscimos (NDJSON): uma linha por loja concluída.
+
+    Cada resultado é gravado com uma única escrita em modo append, então o custo
+    por loja é constante (em vez de regravar todos os resultados a cada
+    snapshot) e vários processos podem acrescentar ao mesmo arquivo. O fsync é
+    feito em lotes: a cada `fsync_every` registros ou `fsync_interval` segundos,
+    o que vier primeiro, e ao fechar.
+
+    Se a execução cair no meio de uma escrita, a última linha pode ficar
+    truncada; ela é ignorada na leitura e a próxima escrita começa em uma nova
+    linha. Quando uma loja aparece mais de uma vez, vale o último registro.
+    """
+
+    def __init__(self, file_path, fsync_every=20, fsync_interval=5.0):
+        """
+        Args:
+            file_path (str): Caminho do journal
+            fsync_every (int): Registros entre dois fsyncs
+            fsync_interval (float): Segundos máximos entre dois fsyncs
+        """
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.file_path = file_path
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_interval = fsync_interval
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._fd = os.open(file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+        # Terminar uma linha truncada por uma queda anterior
+        size = os.fstat(self._fd).st_size
+        if size:
+            with open(file_path, 'rb') as f:
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    os.write(self._fd, b"\n")
+
+    def append(self, result):
+        """
+        Registra o resultado de uma loja concluída.
+
+        Args:
+            result (dict): Resultado do scraping (com 'nome_loja')
+        """
+        line = json.dumps(result, ensure_ascii=False, default=to_serializable) + "\n"
+        with self._lock:
+            os.write(self._fd, line.encode("utf-8"))
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._sync()
+
+    def sync(self):
+        """Força a gravação em disco dos registros pendentes."""
+        with self._lock:
+            self._sync()
+
+    def _sync(self):
+        if self._unsynced:
+            os.fsync(self._fd)
+            self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        with self._lock:
+            if self._fd is None:
+                return
+            self._sync()
+            os.close(self._fd)
+            self._fd = None
+
+    @staticmethod
+    def read(file_path):
+        """
+        Lê o journal e devolve o último resultado de cada loja.
+
+        Args:
+            file_path (str): Caminho do journal
+
+        Returns:
+            dict: Nome da loja -> resultado, na ordem da primeira conclusão
+        """
+        records = {}
+        if not os.path.exists(file_path):
+            return records
+
+        logger = logging.getLogger(__name__)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Linha {line_number} do journal {file_path} corrompida; ignorada")
+                    continue
+                if record.get("nome_loja") is not None:
+                    records[record["nome_loja"]] = record
+        return records
+
+    @classmethod
+    def compact(cls, file_path, output_path, order=None, base=None):
+        """
+        Gera o arquivo final de resultados a partir do journal.
+
+        A escrita é atômica (arquivo temporário + rename), de forma que o
+        arquivo final nunca fica pela metade.
+
+        Args:
+            file_path (str): Caminho do journal
+            output_path (str): Arquivo JSON final
+            order (list): Nomes das lojas na ordem desejada; lojas fora da lista vêm no fim
+            base (dict): Resultados anteriores (loja -> resultado), substituídos pelos do journal
+
+        Returns:
+            int: Número de lojas gravadas
+        """
+        records = dict(base or {})
+        records.update(cls.read(file_path))
+        if order is not None:
+            position = {name: i for i, name in enumerate(order)}
+            names = sorted(records, key=lambda name: position.get(name, len(position)))
+        else:
+            names = list(records)
+
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{output_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump([records[name] for name in names], f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, output_path)
+
+        logging.getLogger(__name__).info(f"Journal {file_path} compactado em {output_path} ({len(names)} lojas)")
+        return len(names)
@@ -1,66 +1,65 @@
-<<<<<<< HEAD
-# Importação das bibliotecas necessárias
-# json: Para ler e escrever arquivos JSON
-# os: Para operações com arquivos e diretórios
-# logging: Para registrar informações e erros
-=======
->>>>>>> origin/main
 import json
 import os
 import logging
+from application.services.store_sink import StoreSink, store_record
 
-class StoreRepository:
-<<<<<<< HEAD
+def to_serializable(value):
+    """Converte entidades (ex.: ContactInfo nos resultados do scraping) para JSON."""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError(f"Objeto do tipo {type(value).__name__} não é serializável em JSON")
+
+class JsonArrayStoreSink(StoreSink):
     """
-    Classe responsável por gerenciar a persistência dos dados das lojas
-    
-    Esta classe implementa operações para:
-    1. Carregar dados de lojas de arquivos JSON
-    2. Salvar dados de lojas em arquivos JSON
-    3. Gerenciar erros de leitura/escrita
-    4. Registrar operações no log
+    Grava lojas em um arquivo JSON (lista) à medida que são concluídas.
     
-    Utiliza codificação UTF-8 para suportar caracteres especiais
-    e formatação JSON indentada para melhor legibilidade.
+    Cada loja é escrita logo ao chegar, sem acumular a lista em memória. A
+    escrita vai para um arquivo temporário, renomeado para o destino ao fechar:
+    o arquivo final é sempre uma lista JSON completa, mesmo que o processamento
+    seja interrompido (com as lojas recebidas até então).
     """
     
-    def __init__(self):
+    def __init__(self, file_path):
         """
-        Inicializa o repositório de lojas
-        
-        Configura o logger específico para esta classe
-        para registrar operações de leitura e escrita.
+        Args:
+            file_path (str): Arquivo JSON de destino
         """
-        # Configuração do logger para esta classe
-=======
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self.file_path = file_path
+        self.count = 0
+        self.logger = logging.getLogger(__name__)
+        self._tmp_path = f"{file_path}.tmp"
+        self._file = open(self._tmp_path, 'w', encoding='utf-8')
+        self._file.write("[")
+    
+    def write(self, store):
+        item = json.dumps(store_record(store), ensure_ascii=False, indent=2, default=to_serializable)
+        self._file.write(("," if self.count else "") + "\n  " + item.replace("\n", "\n  "))
+        self._file.flush()
+        self.count += 1
+    
+    def close(self):
+        if self._file is None:
+            return
+        self._file.write("\n]" if self.count else "]")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+        os.replace(self._tmp_path, self.file_path)
+        self.logger.info(f"Dados de {self.count} lojas salvos em {self.file_path}")
+
+class StoreRepository:
     """Repositório para gerenciar dados de lojas."""
     
     def __init__(self):
->>>>>>> origin/main
         self.logger = logging.getLogger(__name__)
     
     def load_stores(self, file_path):
         """
-<<<<<<< HEAD
-        Carrega dados de lojas de um arquivo JSON
-        
-        Este método:
-        1. Verifica se o arquivo existe
-        2. Lê e decodifica o conteúdo JSON
-        3. Registra sucesso ou falha no log
-        4. Trata diferentes tipos de erros
-        
-        Parâmetros:
-            file_path (str): Caminho completo do arquivo JSON
-            
-        Retorna:
-            list: Lista com os dados das lojas se sucesso
-                 Lista vazia se houver qualquer erro
-        """
-        try:
-            # Primeiro verifica se o arquivo existe
-            # Evita tentar ler um arquivo inexistente
-=======
         Carrega lojas de um arquivo JSON.
         
         Args:
@@ -71,75 +70,89 @@ class StoreRepository:
         """
         try:
             # Verificar se o arquivo existe
->>>>>>> origin/main
             if not os.path.exists(file_path):
                 self.logger.error(f"Arquivo não encontrado: {file_path}")
                 return []
             
-<<<<<<< HEAD
-            # Abre e lê o arquivo JSON com encoding UTF-8
-            # para suportar caracteres especiais
-            with open(file_path, 'r', encoding='utf-8') as f:
-                stores_data = json.load(f)
-                
-            # Registra sucesso no log
-=======
             # Ler arquivo JSON
             with open(file_path, 'r', encoding='utf-8') as f:
                 stores_data = json.load(f)
                 
->>>>>>> origin/main
             self.logger.info(f"Carregadas {len(stores_data)} lojas de {file_path}")
             return stores_data
             
         except json.JSONDecodeError:
-<<<<<<< HEAD
-            # Erro específico de formato JSON inválido
-=======
->>>>>>> origin/main
             self.logger.error(f"Erro ao decodificar JSON de {file_path}")
             return []
             
         except Exception as e:
-<<<<<<< HEAD
-            # Captura qualquer outro erro que possa ocorrer
-=======
->>>>>>> origin/main
             self.logger.error(f"Erro ao carregar lojas de {file_path}: {str(e)}")
             return []
     
-    def save_stores(self, stores_data, file_path):
+    def iter_stores(self, file_path, chunk_size=65536):
         """
-<<<<<<< HEAD
-        Salva dados de lojas em um arquivo JSON
-        
-        Este método:
-        1. Cria o diretório de destino se necessário
-        2. Salva os dados em formato JSON indentado
-        3. Usa codificação UTF-8 para caracteres especiais
-        4. Registra sucesso ou falha no log
+        Lê lojas de um arquivo JSON (lista) ou NDJSON uma a uma, sem carregar o arquivo inteiro.
         
-        Parâmetros:
-            stores_data (list): Lista com os dados das lojas
-            file_path (str): Caminho onde salvar o arquivo
+        Args:
+            file_path (str): Caminho do arquivo
+            chunk_size (int): Caracteres lidos por vez
             
-        Retorna:
-            bool: True se os dados foram salvos com sucesso
-                 False se ocorreu algum erro
+        Yields:
+            dict: Dados de cada loja, na ordem do arquivo
         """
-        try:
-            # Cria toda a estrutura de diretórios necessária
-            # exist_ok=True evita erro se o diretório já existir
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            
-            # Salva os dados em formato JSON
-            # ensure_ascii=False: permite caracteres não-ASCII
-            # indent=2: formata o JSON de forma legível
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(stores_data, f, ensure_ascii=False, indent=2)
+        if not os.path.exists(file_path):
+            self.logger.error(f"Arquivo não encontrado: {file_path}")
+            return
+        
+        decoder = json.JSONDecoder()
+        buffer, pos, count = "", 0, 0
+        in_array = None
+        eof = False
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            while True:
+                # Pular espaços e separadores entre os itens
+                while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                    pos += 1
+                
+                if pos < len(buffer):
+                    if in_array is None:
+                        in_array = buffer[pos] == "["
+                        pos += 1 if in_array else 0
+                        continue
+                    if in_array and buffer[pos] == "]":
+                        break
+                    try:
+                        store_data, pos = decoder.raw_decode(buffer, pos)
+                    except json.JSONDecodeError:
+                        # Item incompleto: ler mais do arquivo
+                        if eof:
+                            self.logger.error(f"Erro ao decodificar JSON de {file_path} após {count} lojas")
+                            break
+                    else:
+                        count += 1
+                        yield store_data
+                        continue
+                elif eof:
+                    break
                 
-            # Registra sucesso no log
-=======
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer, pos = buffer[pos:] + chunk, 0
+        
+        self.logger.info(f"Lidas {count} lojas de {file_path}")
+    
+    def open_sink(self, file_path):
+        """
+        Abre um destino que grava as lojas no arquivo JSON à medida que são concluídas.
+        
+        Returns:
+            JsonArrayStoreSink: Sink do arquivo (deve ser fechado ao final)
+        """
+        return JsonArrayStoreSink(file_path)
+    
+    def save_stores(self, stores_data, file_path):
+        """
         Salva dados de lojas em um arquivo JSON.
         
         Args:
@@ -153,18 +166,17 @@ class StoreRepository:
             # Criar diretório de destino se não existir
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
             
-            # Salvar como JSON
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(stores_data, f, ensure_ascii=False, indent=2)
+            # Salvar como JSON (arquivo temporário + rename: o destino nunca fica pela metade)
+            tmp_path = f"{file_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(stores_data, f, ensure_ascii=False, indent=2, default=to_serializable)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
                 
->>>>>>> origin/main
             self.logger.info(f"Dados de {len(stores_data)} lojas salvos em {file_path}")
             return True
             
         except Exception as e:
-<<<<<<< HEAD
-            # Registra qualquer erro que ocorra durante o salvamento
-=======
->>>>>>> origin/main
             self.logger.error(f"Erro ao salvar dados em {file_path}: {str(e)}")
             return False
@@ -1,210 +1,409 @@
-<<<<<<< HEAD
-# Importação das bibliotecas necessárias
-# logging: Para registrar informações e erros
-# build: Cliente oficial do Google para APIs
-# time: Para implementar delays entre tentativas
-# random: Para adicionar variação aos delays
-=======
->>>>>>> origin/main
+import json
 import logging
-from googleapiclient.discovery import build
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import httplib2
+from googleapiclient.discovery import build_from_document
+from googleapiclient.errors import HttpError
+from infrastructure.search.quota_scheduler import QuotaExceededError
 import time
 import random
 
-class GoogleSearchService:
-<<<<<<< HEAD
-    """
-    Classe responsável por realizar buscas usando a API do Google
+# Documento de descoberta da Custom Search API versionado junto com o código,
+# para que o cliente seja montado sem buscar nem reprocessar o documento a cada consulta
+DISCOVERY_DOCUMENT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "discovery", "customsearch.v1.json")
+
+_discovery_document = None
+_discovery_lock = threading.Lock()
+
+def load_discovery_document():
+    """Carrega (uma única vez por processo) o documento de descoberta empacotado."""
+    global _discovery_document
     
-    Esta classe implementa:
-    1. Buscas gerais no Google usando Custom Search API
-    2. Buscas específicas por informações de contato de lojas
-    3. Sistema de retry com backoff exponencial
-    4. Logging detalhado das operações
+    if _discovery_document is None:
+        with _discovery_lock:
+            if _discovery_document is None:
+                with open(DISCOVERY_DOCUMENT_PATH, 'r', encoding='utf-8') as f:
+                    _discovery_document = f.read()
     
-    Requer:
-    - API Key válida do Google
-    - ID do mecanismo de busca personalizado (Custom Search Engine)
+    return _discovery_document
+
+def build_search_client(api_key, http=None, root_url=None):
     """
+    Monta um cliente da Custom Search API a partir do documento empacotado.
     
-    def __init__(self, api_key, engine_id):
-        """
-        Inicializa o serviço de busca do Google
-        
-        Parâmetros:
-            api_key (str): Chave de API do Google para autenticação
-            engine_id (str): ID do mecanismo de busca personalizado
+    Args:
+        api_key (str): Chave de API do Google
+        http: Transporte HTTP (httplib2.Http ou compatível) exclusivo do cliente
+        root_url (str): Endpoint alternativo da API (ex.: servidor local de testes);
+                        também usado pelas requisições em lote
         
-        A API Key pode ser obtida no Google Cloud Console
-        O Engine ID pode ser obtido no Google Custom Search Console
-        """
-        # Credenciais necessárias para usar a API
-        self.api_key = api_key      # Chave de API do Google
-        self.engine_id = engine_id  # ID do mecanismo de busca
-        
-        # Configuração do logger para esta classe
-=======
+    Returns:
+        Resource: Cliente da API
+    """
+    document = load_discovery_document()
+    if root_url:
+        discovery = json.loads(document)
+        discovery["rootUrl"] = root_url.rstrip("/") + "/"
+        discovery["baseUrl"] = discovery["rootUrl"] + discovery.get("servicePath", "")
+        document = discovery
+    
+    return build_from_document(document, developerKey=api_key, http=http or httplib2.Http())
+
+class GoogleSearchService:
     """Serviço para realizar pesquisas utilizando a API do Google."""
     
-    def __init__(self, api_key, engine_id):
+    def __init__(self, api_key, engine_id, timeout=30, http_factory=None, cache=None, quota=None, root_url=None,
+                 max_pending_revalidations=50):
         self.api_key = api_key
         self.engine_id = engine_id
->>>>>>> origin/main
+        self.timeout = timeout
+        self.root_url = root_url
+        self.http_factory = http_factory or (lambda: httplib2.Http(timeout=self.timeout))
+        self.cache = cache
+        self.quota = quota
         self.logger = logging.getLogger(__name__)
+        
+        # Desligado na primeira vez que o endpoint recusar requisições em lote
+        self.batch_supported = True
+        
+        # Consultas sendo revalidadas em segundo plano (stale-while-revalidate). Uma única
+        # thread consome uma fila limitada: cada revalidação gasta uma consulta da cota, e
+        # uma rajada de entradas vencidas não pode disparar consultas pagas em paralelo
+        self._revalidating = set()
+        self._revalidating_lock = threading.Lock()
+        self._revalidations = queue.Queue(maxsize=max_pending_revalidations)
+        self._revalidation_worker = None
+        
+        # httplib2.Http não é thread-safe: cada thread recebe seu próprio
+        # cliente e transporte, criados uma única vez e reutilizados
+        self._local = threading.local()
     
-    def search(self, query, max_results=10, retry_attempts=3):
-        """
-<<<<<<< HEAD
-        Executa uma busca no Google usando a Custom Search API
-        
-        Este método:
-        1. Tenta executar a busca até retry_attempts vezes
-        2. Implementa backoff exponencial entre tentativas
-        3. Registra todo o processo no log
-        
-        Parâmetros:
-            query (str): Texto da busca a ser realizada
-            max_results (int): Número máximo de resultados (padrão: 10)
-            retry_attempts (int): Máximo de tentativas em caso de erro
-            
-        Retorna:
-            list: Lista de resultados da busca, cada resultado é um dict
-                 Lista vazia em caso de falha em todas as tentativas
+    def _get_client(self):
+        """Retorna o cliente da API da thread atual, criando-o na primeira chamada."""
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = build_search_client(self.api_key, http=self.http_factory(), root_url=self.root_url)
+            self._local.client = client
+        return client
+    
+    def search(self, query, max_results=10, retry_attempts=3, deadline=None):
         """
-        # Tenta a busca várias vezes em caso de erro
-        for attempt in range(retry_attempts):
-            try:
-                # Registra a busca que será realizada
-                self.logger.info(f"Realizando pesquisa: '{query}'")
-                
-                # Cria um cliente para a API de busca personalizada
-                # usando as credenciais fornecidas
-                service = build("customsearch", "v1", developerKey=self.api_key)
-                
-                # Configura e executa a busca com os parâmetros:
-                # q: texto da busca
-                # cx: ID do mecanismo de busca
-                # num: quantidade de resultados
-=======
-        Realiza uma pesquisa no Google.
+        Realiza uma pesquisa no Google, consultando antes o cache persistente.
+        
+        Entradas vencidas mas dentro da janela de revalidação são devolvidas
+        imediatamente, enquanto a consulta é refeita em segundo plano.
         
         Args:
             query (str): Consulta para pesquisar
             max_results (int): Número máximo de resultados
             retry_attempts (int): Número máximo de tentativas em caso de erro
+            deadline (float): Instante limite (time.monotonic()) para novas tentativas e esperas
             
         Returns:
             list: Lista de resultados da pesquisa
         """
+        if self.cache is not None:
+            cached, state = self.cache.get(query, max_results)
+            if state == "fresh":
+                self.logger.info(f"Pesquisa em cache: '{query}' ({len(cached)} resultados)")
+                return cached
+            if state == "stale":
+                self.logger.info(f"Pesquisa em cache vencida: '{query}'; revalidando em segundo plano")
+                self._revalidate_async(query, max_results, retry_attempts)
+                return cached
+        
+        items = self._search_remote(query, max_results, retry_attempts, deadline=deadline)
+        if items is None:
+            return []
+        
+        if self.cache is not None:
+            self.cache.set(query, max_results, items)
+        return items
+    
+    def _revalidate_async(self, query, max_results, retry_attempts):
+        """Agenda a consulta para ser refeita em segundo plano; se a fila estiver cheia, ela fica para outra ocasião."""
+        key = self.cache.make_key(query, max_results)
+        with self._revalidating_lock:
+            if key in self._revalidating:
+                return
+            try:
+                self._revalidations.put_nowait((key, query, max_results, retry_attempts))
+            except queue.Full:
+                self.logger.info(f"Fila de revalidação cheia; '{query}' segue com a entrada vencida")
+                return
+            self._revalidating.add(key)
+            
+            if self._revalidation_worker is None:
+                self._revalidation_worker = threading.Thread(
+                    target=self._revalidate_loop, name="search-revalidate", daemon=True
+                )
+                self._revalidation_worker.start()
+    
+    def _revalidate_loop(self):
+        """Refaz as consultas agendadas, uma de cada vez, e atualiza o cache."""
+        while True:
+            key, query, max_results, retry_attempts = self._revalidations.get()
+            try:
+                items = self._search_remote(query, max_results, retry_attempts)
+                if items is not None:
+                    self.cache.set(query, max_results, items)
+            except QuotaExceededError as e:
+                self.logger.warning(f"Revalidação de '{query}' cancelada: {str(e)}")
+            except Exception as e:
+                self.logger.error(f"Erro ao revalidar '{query}': {str(e)}")
+            finally:
+                with self._revalidating_lock:
+                    self._revalidating.discard(key)
+    
+    def _search_remote(self, query, max_results, retry_attempts, charge_quota=True, deadline=None):
+        """
+        Executa a pesquisa na API, com retentativas.
+        
+        Com `deadline` (time.monotonic()), não começa tentativas nem esperas
+        entre tentativas que terminariam depois dele.
+        
+        Returns:
+            list: Lista de resultados ou None se todas as tentativas falharam
+            
+        Raises:
+            QuotaExceededError: Se a cota diária acabou (não há novas tentativas)
+        """
         for attempt in range(retry_attempts):
+            if deadline is not None and time.monotonic() >= deadline:
+                self.logger.warning(f"Tempo limite esgotado; pesquisa '{query}' abandonada")
+                return None
+            
+            # Cada tentativa consome uma consulta da cota (a primeira pode já ter sido reservada)
+            if self.quota is not None and (charge_quota or attempt > 0):
+                self.quota.acquire()
+            
             try:
                 self.logger.info(f"Realizando pesquisa: '{query}'")
                 
-                # Criar serviço de pesquisa
-                service = build("customsearch", "v1", developerKey=self.api_key)
+                # Obter cliente reutilizável da thread
+                service = self._get_client()
                 
                 # Executar pesquisa
->>>>>>> origin/main
                 request = service.cse().list(
                     q=query,
                     cx=self.engine_id,
                     num=max_results
                 )
                 
-<<<<<<< HEAD
-                # Executa a requisição e obtém a resposta
-                response = request.execute()
-                
-                # Extrai apenas os itens (resultados) da resposta
-                # Se não houver resultados, retorna lista vazia
-                items = response.get("items", [])
-                
-                # Registra o sucesso da operação
-=======
                 # Obter resultados
                 response = request.execute()
                 
                 # Extrair itens
                 items = response.get("items", [])
                 
->>>>>>> origin/main
                 self.logger.info(f"Pesquisa concluída. Encontrados {len(items)} resultados.")
                 return items
                 
             except Exception as e:
-<<<<<<< HEAD
-                # Registra a falha desta tentativa
-                self.logger.warning(f"Tentativa {attempt+1}/{retry_attempts} falhou: {str(e)}")
+                if self._is_daily_quota_error(e):
+                    # Novas tentativas só gastariam tempo: a cota só volta na próxima janela
+                    if self.quota is not None:
+                        self.quota.mark_exhausted()
+                    raise QuotaExceededError(f"Cota diária da API esgotada: {str(e)}") from e
                 
-                # Se ainda houver tentativas restantes
-                if attempt < retry_attempts - 1:
-                    # Calcula o tempo de espera usando backoff exponencial
-                    # Fórmula: 2^tentativa + random(1,3)
-                    # Exemplo: 1ª falha = 2-4s, 2ª falha = 4-6s, 3ª falha = 8-10s
-                    delay = 2 ** attempt + random.uniform(1, 3)
-                    
-                    # Registra e executa o delay
-                    self.logger.info(f"Aguardando {delay:.2f}s antes de nova tentativa...")
-                    time.sleep(delay)
-                else:
-                    # Registra falha definitiva após todas as tentativas
-                    self.logger.error(f"Pesquisa falhou após {retry_attempts} tentativas: {str(e)}")
-        
-        # Retorna lista vazia se todas as tentativas falharam
-=======
                 self.logger.warning(f"Tentativa {attempt+1}/{retry_attempts} falhou: {str(e)}")
                 
                 if attempt < retry_attempts - 1:
                     # Aplicar backoff exponencial entre tentativas
                     delay = 2 ** attempt + random.uniform(1, 3)
+                    if deadline is not None and time.monotonic() + delay >= deadline:
+                        self.logger.warning(f"Sem tempo para nova tentativa da pesquisa '{query}'")
+                        return None
                     self.logger.info(f"Aguardando {delay:.2f}s antes de nova tentativa...")
                     time.sleep(delay)
                 else:
                     self.logger.error(f"Pesquisa falhou após {retry_attempts} tentativas: {str(e)}")
         
->>>>>>> origin/main
-        return []
+        return None
+    
+    @staticmethod
+    def _is_daily_quota_error(error):
+        """Indica se o erro da API corresponde ao limite diário de consultas."""
+        if not isinstance(error, HttpError) or error.resp.status not in (403, 429):
+            return False
+        
+        content = error.content.decode('utf-8', errors='ignore') if isinstance(error.content, bytes) else str(error.content)
+        return "dailyLimitExceeded" in content or "per day" in content.lower()
+    
+    @staticmethod
+    def build_store_query(store_name):
+        """Monta a consulta de contatos de uma loja."""
+        return f"{store_name} contato telefone email whatsapp site oficial"
     
-    def search_store_contacts(self, store_name):
+    def search_cost(self, store_name):
         """
-<<<<<<< HEAD
-        Realiza uma busca otimizada por informações de contato
+        Estima quantas consultas pagas a pesquisa da loja vai consumir, no melhor caso.
         
-        Este método especializado:
-        1. Formata uma query específica para buscar contatos
-        2. Limita os resultados para maior eficiência
-        3. Inclui palavras-chave relevantes na busca
+        Entradas vencidas também custam uma consulta: a resposta vem do cache,
+        mas a revalidação em segundo plano gasta cota. Retentativas não entram
+        na estimativa: dependem de falhas que não se sabem de antemão.
         
-        Parâmetros:
-            store_name (str): Nome da loja para buscar contatos
-            
-        Retorna:
-            list: Lista com até 3 resultados mais relevantes
-                 Cada resultado é um dict com dados da página
+        Returns:
+            int: 0 se a resposta válida está no cache, 1 caso contrário
+        """
+        if self.cache is None:
+            return 1
+        
+        _, state = self.cache.get(self.build_store_query(store_name), 3, record_stats=False)
+        return 0 if state == "fresh" else 1
+    
+    def search_store_contacts(self, store_name, deadline=None):
         """
-        # Formata uma query específica para buscar contatos
-        # Inclui palavras-chave relevantes como:
-        # - contato: páginas de contato
-        # - telefone: números de telefone
-        # - email: endereços de e-mail
-        # - whatsapp: números e links de WhatsApp
-        # - site oficial: para priorizar o site oficial da loja
-        query = f"{store_name} contato telefone email whatsapp site oficial"
-        
-        # Executa a busca limitada a 3 resultados
-        # Menos resultados = mais rápido e mais relevante
-=======
         Pesquisa informações de contato de uma loja específica.
         
         Args:
             store_name (str): Nome da loja para pesquisar
+            deadline (float): Instante limite (time.monotonic()) para tentativas e esperas
             
         Returns:
             list: Resultados de pesquisa
         """
         # Formatar consulta específica para contatos
-        query = f"{store_name} contato telefone email whatsapp site oficial"
+        query = self.build_store_query(store_name)
         
         # Executar pesquisa
->>>>>>> origin/main
-        return self.search(query, max_results=3)
+        return self.search(query, max_results=3, deadline=deadline)
+    
+    def search_many(self, store_names, max_results=3, batch_size=10, max_workers=4):
+        """
+        Pesquisa os contatos de várias lojas, agrupando as consultas.
+        
+        Respostas em cache são usadas diretamente. As demais consultas são
+        enviadas em requisições HTTP em lote (batch) da biblioteca cliente;
+        se o endpoint não aceitar lotes, ou se alguma consulta do lote falhar,
+        elas são executadas em paralelo com concorrência limitada.
+        
+        Args:
+            store_names (list): Nomes das lojas
+            max_results (int): Número máximo de resultados por loja
+            batch_size (int): Consultas por requisição em lote
+            max_workers (int): Consultas simultâneas no modo paralelo
+            
+        Returns:
+            dict: Nome da loja -> lista de resultados. Lojas que não puderam ser
+                  pesquisadas (ex.: cota esgotada) ficam fora do dicionário.
+        """
+        results = {}
+        pending = []
+        
+        for store_name in dict.fromkeys(store_names):
+            query = self.build_store_query(store_name)
+            
+            if self.cache is not None:
+                cached, state = self.cache.get(query, max_results)
+                if state != "miss":
+                    if state == "stale":
+                        self._revalidate_async(query, max_results, 3)
+                    results[store_name] = cached
+                    continue
+            
+            pending.append((store_name, query))
+        
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            
+            # Reservar cota para cada consulta do lote
+            acquired = []
+            quota_exhausted = False
+            for store_name, query in chunk:
+                if self.quota is not None:
+                    try:
+                        self.quota.acquire()
+                    except QuotaExceededError as e:
+                        self.logger.warning(f"Pesquisa em lote interrompida: {str(e)}")
+                        quota_exhausted = True
+                        break
+                acquired.append((store_name, query))
+            
+            chunk_results = {}
+            sent = False
+            if self.batch_supported:
+                chunk_results = self._execute_batch(acquired, max_results)
+                # Um lote recusado como um todo desativa os lotes: nenhuma consulta foi enviada
+                sent = self.batch_supported
+            
+            # Consultas enviadas no lote e que falharam já gastaram a cota reservada;
+            # repeti-las consome cota de novo. As que não foram enviadas usam a reserva.
+            failed = [(name, query) for name, query in acquired if name not in chunk_results]
+            if failed:
+                chunk_results.update(self._execute_parallel(failed, max_results, max_workers, charge_quota=sent))
+            
+            for store_name, query in acquired:
+                if store_name in chunk_results:
+                    results[store_name] = chunk_results[store_name]
+                    if self.cache is not None:
+                        self.cache.set(query, max_results, chunk_results[store_name])
+            
+            if quota_exhausted:
+                break
+        
+        self.logger.info(f"Pesquisa em lote: {len(results)}/{len(store_names)} lojas com resultados disponíveis")
+        return results
+    
+    def _execute_batch(self, queries, max_results):
+        """
+        Executa as consultas em uma única requisição HTTP em lote.
+        
+        Returns:
+            dict: Nome da loja -> resultados, apenas para as consultas bem-sucedidas
+        """
+        if not queries:
+            return {}
+        
+        results = {}
+        
+        def callback(request_id, response, exception):
+            if exception is None:
+                results[request_id] = response.get("items", [])
+            else:
+                self.logger.warning(f"Consulta '{request_id}' falhou no lote: {str(exception)}")
+        
+        try:
+            service = self._get_client()
+            batch = service.new_batch_http_request(callback=callback)
+            for store_name, query in queries:
+                batch.add(service.cse().list(q=query, cx=self.engine_id, num=max_results), request_id=store_name)
+            batch.execute()
+            self.logger.info(f"Lote de {len(queries)} consultas executado ({len(results)} com sucesso)")
+        except Exception as e:
+            self.logger.warning(f"Requisições em lote indisponíveis; usando consultas paralelas: {str(e)}")
+            self.batch_supported = False
+            return {}
+        
+        return results
+    
+    def _execute_parallel(self, queries, max_results, max_workers, charge_quota=False):
+        """
+        Executa as consultas individualmente com concorrência limitada.
+        
+        Cada thread usa seu próprio cliente e conexão HTTP persistente.
+        
+        Args:
+            charge_quota (bool): Se a primeira tentativa de cada consulta consome
+                cota; False quando o chamador já a reservou e a consulta ainda não foi enviada
+        
+        Returns:
+            dict: Nome da loja -> resultados, apenas para as consultas bem-sucedidas
+        """
+        def run(query):
+            try:
+                return self._search_remote(query, max_results, retry_attempts=3, charge_quota=charge_quota)
+            except QuotaExceededError:
+                return None
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="search") as executor:
+            items_list = executor.map(run, [query for _, query in queries])
+            for (store_name, _), items in zip(queries, items_list):
+                if items is not None:
+                    results[store_name] = items
+        return results
+
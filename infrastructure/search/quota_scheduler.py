@@ -0,0 +1,158 @@
+import datetime
+import json
+import logging
+import os
+import threading
+import time
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # pragma: no cover - Python < 3.9
+    ZoneInfo = None
+
+class QuotaExceededError(Exception):
+    """Cota diária de pesquisas esgotada."""
+
+class SearchQuotaScheduler:
+    """
+    Agendador de pesquisas com cota diária e limite de consultas por segundo.
+
+    O consumo do dia é persistido em um arquivo JSON, de forma que execuções
+    diferentes no mesmo dia compartilham o mesmo orçamento. O dia da cota segue
+    o fuso de reinício da Custom Search API (meia-noite do Pacífico). Sem
+    `state_path`, o consumo fica só em memória (ex.: fatia da cota de um shard).
+    """
+
+    def __init__(self, state_path, daily_limit=100, qps=1.0, reset_timezone="America/Los_Angeles"):
+        self.state_path = state_path
+        self.daily_limit = daily_limit
+        self.min_interval = 1.0 / qps if qps and qps > 0 else 0.0
+        self.timezone = ZoneInfo(reset_timezone) if ZoneInfo and reset_timezone else None
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._day, self._used = self._load_state()
+
+    def _today(self):
+        return datetime.datetime.now(self.timezone).date().isoformat()
+
+    def _load_state(self):
+        today = self._today()
+        try:
+            if self.state_path and os.path.exists(self.state_path):
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                if state.get("day") == today:
+                    return today, int(state.get("used", 0))
+        except Exception as e:
+            self.logger.warning(f"Erro ao carregar estado da cota de {self.state_path}: {str(e)}")
+        return today, 0
+
+    def _save_state(self):
+        if not self.state_path:
+            return
+
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"day": self._day, "used": self._used, "daily_limit": self.daily_limit}, f)
+        os.replace(tmp_path, self.state_path)
+
+    def _roll_day(self):
+        today = self._today()
+        if today != self._day:
+            self.logger.info(f"Nova janela de cota ({today}); contador de pesquisas reiniciado")
+            self._day, self._used = today, 0
+
+    @property
+    def used(self):
+        with self._lock:
+            self._roll_day()
+            return self._used
+
+    def remaining(self):
+        """Retorna quantas pesquisas ainda cabem na cota do dia."""
+        with self._lock:
+            self._roll_day()
+            return max(0, self.daily_limit - self._used)
+
+    def acquire(self):
+        """
+        Reserva uma pesquisa da cota, aguardando o intervalo mínimo entre consultas.
+
+        Raises:
+            QuotaExceededError: Se a cota diária já foi consumida
+        """
+        with self._lock:
+            self._roll_day()
+            if self._used >= self.daily_limit:
+                raise QuotaExceededError(
+                    f"Cota diária de {self.daily_limit} pesquisas esgotada ({self._day})"
+                )
+
+            self._used += 1
+            self._save_state()
+
+            now = time.monotonic()
+            wait = max(0.0, self._next_slot - now)
+            self._next_slot = max(now, self._next_slot) + self.min_interval
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def mark_exhausted(self):
+        """Marca a cota do dia como esgotada (ex.: a API respondeu com limite diário excedido)."""
+        with self._lock:
+            self._roll_day()
+            self._used = max(self._used, self.daily_limit)
+            self._save_state()
+
+    def record_usage(self, count):
+        """Soma ao consumo do dia pesquisas feitas por outro agendador (ex.: processos de um shard)."""
+        if count <= 0:
+            return
+
+        with self._lock:
+            self._roll_day()
+            self._used += count
+            self._save_state()
+
+    def plan(self, stores, priority=None, cost=None):
+        """
+        Divide as lojas entre as que cabem na cota restante e as que ficam para a próxima janela.
+
+        O plano é otimista: cada loja custa o informado por `cost`, sem contar
+        retentativas (cobradas por tentativa) nem a pesquisa de reserva de lojas
+        cujos sites obtidos sem pesquisa não bastaram. O que passar do plano é
+        contido em tempo de execução: `acquire` levanta QuotaExceededError e as
+        lojas restantes são adiadas.
+
+        Args:
+            stores (list): Lojas a processar
+            priority (callable): Função loja -> valor; maiores valores são processados primeiro
+            cost (callable): Função loja -> número de pesquisas necessárias (ex.: 0 se válida em cache)
+
+        Returns:
+            tuple: (lojas agendadas, lojas adiadas)
+        """
+        ordered = sorted(stores, key=priority, reverse=True) if priority else list(stores)
+        budget = self.remaining()
+
+        scheduled, deferred = [], []
+        for store in ordered:
+            store_cost = cost(store) if cost else 1
+            if store_cost <= budget:
+                scheduled.append(store)
+                budget -= store_cost
+            else:
+                deferred.append(store)
+
+        if deferred:
+            self.logger.warning(
+                f"Cota insuficiente: {len(scheduled)} lojas agendadas, {len(deferred)} adiadas para a próxima janela"
+            )
+        return scheduled, deferred
@@ -0,0 +1,116 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from domain.services.text_normalization import normalize_text
+
+class SearchResultCache:
+    """
+    Cache persistente (SQLite) de resultados de pesquisa, com TTL e stale-while-revalidate.
+
+    As chaves são consultas normalizadas (sem acentos, minúsculas e com espaços
+    colapsados), de forma que variações de grafia da mesma consulta não
+    gastam uma nova chamada paga à API.
+
+    Estados de uma entrada:
+    - 'fresh': dentro do TTL, pode ser usada diretamente
+    - 'stale': TTL vencido, mas dentro da janela de revalidação; pode ser usada
+      enquanto uma nova consulta é feita em segundo plano
+    - 'miss': inexistente ou velha demais
+    """
+
+    def __init__(self, file_path, ttl_seconds=7 * 24 * 3600, stale_ttl_seconds=30 * 24 * 3600):
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.file_path = file_path
+        self.ttl_seconds = ttl_seconds
+        self.stale_ttl_seconds = stale_ttl_seconds
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(file_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS search_results ("
+            "key TEXT PRIMARY KEY, query TEXT, results TEXT, fetched_at REAL)"
+        )
+        self._conn.commit()
+
+        self.stats = {"fresh": 0, "stale": 0, "miss": 0}
+
+    @staticmethod
+    def make_key(query, max_results):
+        """Gera a chave do cache a partir da consulta normalizada e do número de resultados."""
+        return f"{normalize_text(query)}|{max_results}"
+
+    def get(self, query, max_results, now=None, record_stats=True):
+        """
+        Busca resultados em cache.
+
+        Args:
+            query (str): Consulta
+            max_results (int): Número de resultados pedidos
+            now (float): Instante de referência (padrão: agora)
+            record_stats (bool): Se a consulta entra nas estatísticas do cache
+
+        Returns:
+            tuple: (lista de resultados ou None, estado 'fresh' | 'stale' | 'miss')
+        """
+        now = now if now is not None else time.time()
+        key = self.make_key(query, max_results)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT results, fetched_at FROM search_results WHERE key = ?", (key,)
+            ).fetchone()
+
+        state = "miss"
+        results = None
+        if row is not None:
+            age = now - row[1]
+            if age <= self.ttl_seconds:
+                state = "fresh"
+            elif age <= self.ttl_seconds + self.stale_ttl_seconds:
+                state = "stale"
+
+            if state != "miss":
+                results = json.loads(row[0])
+
+        if record_stats:
+            with self._lock:
+                self.stats[state] += 1
+        return results, state
+
+    def set(self, query, max_results, results, now=None):
+        """Grava os resultados de uma consulta no cache."""
+        key = self.make_key(query, max_results)
+        fetched_at = now if now is not None else time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_results (key, query, results, fetched_at) VALUES (?, ?, ?, ?)",
+                (key, query, json.dumps(results, ensure_ascii=False), fetched_at)
+            )
+            self._conn.commit()
+
+    def purge_expired(self, now=None):
+        """
+        Remove entradas que já passaram da janela de revalidação.
+
+        Returns:
+            int: Quantidade de entradas removidas
+        """
+        now = now if now is not None else time.time()
+        limit = now - self.ttl_seconds - self.stale_ttl_seconds
+
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM search_results WHERE fetched_at < ?", (limit,))
+            self._conn.commit()
+        return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
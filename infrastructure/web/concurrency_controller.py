@@ -0,0 +1,184 @@
+import logging
+import threading
+import time
+
+class _Limit:
+    """Limite AIMD de requisições simultâneas de um escopo (global ou um host)."""
+
+    def __init__(self, limit, min_limit, max_limit):
+        self.limit = float(limit)
+        self.min_limit = float(min_limit)
+        self.max_limit = float(max_limit)
+        self.in_flight = 0
+        self.latency = None
+        self.min_latency = None
+        self.error_rate = 0.0
+        self.last_decrease = 0.0
+        self.blocked_until = 0.0
+        self.requests = 0
+        self.decreases = 0
+
+    @property
+    def permits(self):
+        return max(1, int(self.limit))
+
+    def snapshot(self):
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "latency_ms": round(self.latency * 1000) if self.latency is not None else None,
+            "error_rate": round(self.error_rate, 3),
+            "requests": self.requests,
+            "decreases": self.decreases
+        }
+
+class AimdConcurrencyController:
+    """
+    Controla o número de requisições simultâneas por aumento aditivo e redução multiplicativa (AIMD).
+
+    Há um limite global e um por host. Cada resposta saudável aumenta o limite
+    em `increase / limite` (cerca de +`increase` por janela completa de
+    requisições, como no controle de congestionamento do TCP). O limite de um
+    host é multiplicado por `decrease_factor` quando:
+    - o servidor pede para desacelerar (429 ou 503), respeitando o Retry-After
+    - a taxa de erros (média móvel) passa de `error_rate_threshold`
+    - a latência passa de `latency_tolerance` vezes a menor latência já observada
+
+    O limite global só reage à latência média: erros e pedidos de desaceleração
+    dizem respeito a um host (sites fora do ar são comuns entre as lojas) e não
+    devem frear as requisições aos demais.
+
+    Reduções no mesmo escopo têm um intervalo mínimo (`cooldown_seconds`), para
+    que uma rajada de respostas ruins conte como um único sinal. Assim o limite
+    converge para a maior concorrência que o destino aguenta sem degradar.
+    """
+
+    def __init__(self, initial_limit=4, min_limit=1, max_limit=32, initial_host_limit=2, max_host_limit=8,
+                 increase=1.0, decrease_factor=0.5, latency_tolerance=2.0, error_rate_threshold=0.2,
+                 cooldown_seconds=2.0, smoothing=0.2):
+        """
+        Args:
+            initial_limit (float): Limite global inicial
+            min_limit (float): Limite mínimo (global e por host)
+            max_limit (float): Limite global máximo
+            initial_host_limit (float): Limite inicial de cada host
+            max_host_limit (float): Limite máximo de cada host
+            increase (float): Aumento aditivo por janela de respostas saudáveis
+            decrease_factor (float): Fator multiplicativo aplicado em cada redução
+            latency_tolerance (float): Latência máxima saudável, em múltiplos da menor observada
+            error_rate_threshold (float): Taxa de erros (média móvel) que dispara redução
+            cooldown_seconds (float): Intervalo mínimo entre reduções do mesmo escopo
+            smoothing (float): Peso de cada nova amostra nas médias móveis
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.initial_host_limit = initial_host_limit
+        self.max_host_limit = max_host_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.error_rate_threshold = error_rate_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.smoothing = smoothing
+        self.logger = logging.getLogger(__name__)
+
+        self._condition = threading.Condition()
+        self._global = _Limit(initial_limit, min_limit, max_limit)
+        self._hosts = {}
+
+    def _host(self, host):
+        scope = self._hosts.get(host)
+        if scope is None:
+            scope = _Limit(self.initial_host_limit, self.min_limit, self.max_host_limit)
+            self._hosts[host] = scope
+        return scope
+
+    def acquire(self, host, timeout=None):
+        """
+        Aguarda uma vaga no limite global e no do host.
+
+        Args:
+            host (str): Host da requisição
+            timeout (float): Espera máxima em segundos (None: sem limite)
+
+        Returns:
+            bool: True se a vaga foi obtida; False se o tempo de espera acabou
+        """
+        give_up_at = time.monotonic() + timeout if timeout is not None else None
+        with self._condition:
+            scope = self._host(host)
+            while True:
+                now = time.monotonic()
+                if give_up_at is not None and now >= give_up_at:
+                    return False
+
+                wait = None if give_up_at is None else give_up_at - now
+                if now < scope.blocked_until:
+                    wait = scope.blocked_until - now if wait is None else min(wait, scope.blocked_until - now)
+                elif self._global.in_flight < self._global.permits and scope.in_flight < scope.permits:
+                    break
+                self._condition.wait(wait)
+
+            self._global.in_flight += 1
+            scope.in_flight += 1
+            return True
+
+    def release(self, host, latency, outcome, retry_after=None):
+        """
+        Libera a vaga e ajusta os limites conforme o desfecho da requisição.
+
+        Args:
+            host (str): Host da requisição
+            latency (float): Duração da requisição em segundos
+            outcome (str): 'ok', 'error' (falha de conexão, timeout, 5xx) ou 'throttled' (429/503)
+            retry_after (float): Segundos pedidos pelo servidor antes de novas requisições ao host
+        """
+        with self._condition:
+            scope = self._host(host)
+            self._global.in_flight -= 1
+            scope.in_flight -= 1
+
+            now = time.monotonic()
+            if retry_after:
+                scope.blocked_until = max(scope.blocked_until, now + retry_after)
+
+            self._update(self._global, "global", latency, outcome, now, latency_only=True)
+            self._update(scope, host, latency, outcome, now)
+
+            self._condition.notify_all()
+
+    def _update(self, scope, name, latency, outcome, now, latency_only=False):
+        scope.requests += 1
+        failed = outcome != "ok"
+        scope.error_rate += self.smoothing * ((1.0 if failed else 0.0) - scope.error_rate)
+
+        slow = False
+        if not failed:
+            scope.latency = latency if scope.latency is None else scope.latency + self.smoothing * (latency - scope.latency)
+            scope.min_latency = scope.latency if scope.min_latency is None else min(scope.min_latency, scope.latency)
+            slow = scope.latency > scope.min_latency * self.latency_tolerance
+
+        overloaded = outcome == "throttled" or (failed and scope.error_rate > self.error_rate_threshold)
+        if slow or (overloaded and not latency_only):
+            if now - scope.last_decrease >= self.cooldown_seconds:
+                previous = scope.limit
+                scope.limit = max(scope.min_limit, scope.limit * self.decrease_factor)
+                scope.last_decrease = now
+                scope.decreases += 1
+                if slow:
+                    # A latência de referência passa a ser a atual, para não reduzir indefinidamente
+                    scope.min_latency = scope.latency / self.latency_tolerance
+                self.logger.info(
+                    f"Concorrência '{name}' reduzida de {previous:.1f} para {scope.limit:.1f} "
+                    f"({'latência alta' if slow else outcome})"
+                )
+        elif not failed:
+            scope.limit = min(scope.max_limit, scope.limit + self.increase / scope.limit)
+
+    def snapshot(self):
+        """Retorna os limites atuais, as requisições em andamento e as médias de latência e erros."""
+        with self._condition:
+            return {
+                "global": self._global.snapshot(),
+                "hosts": {host: scope.snapshot() for host, scope in self._hosts.items()}
+            }
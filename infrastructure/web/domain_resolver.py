@@ -0,0 +1,265 @@
+import json
+import logging
+import re
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+import requests
+
+SLUG_PATTERN = re.compile(r'/loja/([^/?#]+)')
+
+class CandidateDomainResolver:
+    """
+    Adivinha o site oficial de uma loja a partir do slug do Mercado Livre.
+
+    Para um link como `/loja/01smart-brasil` são gerados candidatos como
+    `01smartbrasil.com.br`, `01smart-brasil.com` e `01smart.com.br`. Os
+    candidatos de um grupo de lojas são verificados em paralelo, primeiro por
+    DNS e depois por uma requisição HEAD; o resultado de cada domínio fica em
+    cache (em memória e, opcionalmente, em disco).
+    """
+
+    def __init__(self, tlds=(".com.br", ".com"), strip_suffixes=("brasil", "br", "oficial"),
+                 timeout=3, max_workers=16, cache=None, cache_ttl_seconds=30 * 24 * 3600):
+        """
+        Args:
+            tlds (tuple): Sufixos de domínio testados, em ordem de preferência
+            strip_suffixes (tuple): Sufixos de slug removidos para gerar candidatos extras
+            timeout (float): Tempo limite da requisição HEAD, em segundos
+            max_workers (int): Verificações simultâneas
+            cache: Armazenamento chave → valor persistente (ex.: SqliteKeyValueStore)
+            cache_ttl_seconds (float): Validade das verificações persistidas
+        """
+        self.tlds = tuple(tlds)
+        self.strip_suffixes = tuple(strip_suffixes)
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.cache = cache
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._checked = {}
+        self._local = threading.local()
+
+        self.stats = {
+            "stores": 0,
+            "resolved": 0,
+            "cache_hits": 0,
+            "dns_checks": 0,
+            "dns_failures": 0,
+            "head_checks": 0,
+            "head_failures": 0
+        }
+
+    @staticmethod
+    def extract_slug(link):
+        """Extrai o slug da loja de um link do Mercado Livre (ex.: '.../loja/013-garage')."""
+        match = SLUG_PATTERN.search(link or "")
+        return match.group(1).lower() if match else None
+
+    def candidate_domains(self, slug):
+        """
+        Gera os domínios candidatos de um slug, em ordem de preferência.
+
+        Args:
+            slug (str): Slug da loja (ex.: '01smart-brasil')
+
+        Returns:
+            list: Domínios candidatos sem repetição
+        """
+        slug = re.sub(r'[^a-z0-9-]', '', slug.lower()).strip('-')
+        bases = [slug.replace('-', ''), slug]
+
+        parts = slug.split('-')
+        while len(parts) > 1 and parts[-1] in self.strip_suffixes:
+            parts = parts[:-1]
+            bases.append(''.join(parts))
+
+        candidates = []
+        for base in bases:
+            if len(base) < 3:
+                continue
+            for tld in self.tlds:
+                domain = f"{base}{tld}"
+                if domain not in candidates:
+                    candidates.append(domain)
+        return candidates
+
+    def resolve(self, link):
+        """Retorna a URL do site oficial da loja ou None."""
+        return self.resolve_many([link]).get(link)
+
+    def resolve_many(self, links):
+        """
+        Resolve o site oficial de várias lojas, verificando todos os candidatos em paralelo.
+
+        Args:
+            links (list): Links das lojas no Mercado Livre
+
+        Returns:
+            dict: Link -> URL do site oficial, apenas para as lojas resolvidas
+        """
+        candidates_by_link = {}
+        for link in dict.fromkeys(links):
+            slug = self.extract_slug(link)
+            if slug:
+                candidates_by_link[link] = self.candidate_domains(slug)
+
+        pending = []
+        for domain in dict.fromkeys(d for domains in candidates_by_link.values() for d in domains):
+            if not self._load_cached(domain):
+                pending.append(domain)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="domain-probe") as executor:
+                for domain, (url, definitive) in zip(pending, executor.map(self._probe, pending)):
+                    self._store(domain, url, persist=definitive)
+
+            # Gravar o lote, liberando o arquivo para outros processos (execução em shards)
+            if self.cache is not None and hasattr(self.cache, "commit"):
+                self.cache.commit()
+
+        resolved = {}
+        for link, domains in candidates_by_link.items():
+            url = next((self._checked[d] for d in domains if self._checked.get(d)), None)
+            if url:
+                resolved[link] = url
+
+        with self._lock:
+            self.stats["stores"] += len(candidates_by_link)
+            self.stats["resolved"] += len(resolved)
+
+        self.logger.info(f"Sites oficiais adivinhados: {len(resolved)}/{len(candidates_by_link)} lojas")
+        return resolved
+
+    def cached_site(self, link):
+        """
+        Consulta, sem acessar a rede, o que já se sabe sobre o site adivinhado da loja.
+
+        Returns:
+            bool: True se algum candidato existe, False se todos já foram
+                  verificados sem sucesso, None se falta verificar algum
+        """
+        slug = self.extract_slug(link)
+        if not slug:
+            return False
+
+        unknown = False
+        for domain in self.candidate_domains(slug):
+            found, url = self._cached_entry(domain)
+            if url:
+                return True
+            unknown = unknown or not found
+        return None if unknown else False
+
+    def _cached_entry(self, domain):
+        """Retorna (verificado, URL) do domínio em memória ou no cache persistente dentro do TTL."""
+        with self._lock:
+            if domain in self._checked:
+                return True, self._checked[domain]
+
+        if self.cache is None:
+            return False, None
+
+        try:
+            raw = self.cache[domain]
+        except KeyError:
+            return False, None
+
+        entry = json.loads(raw)
+        if time.time() - entry["checked_at"] > self.cache_ttl_seconds:
+            return False, None
+        return True, entry["url"]
+
+    def _load_cached(self, domain):
+        """Carrega a verificação do domínio do cache; retorna False se precisar verificar."""
+        found, url = self._cached_entry(domain)
+        if not found:
+            return False
+
+        with self._lock:
+            self._checked[domain] = url
+            self.stats["cache_hits"] += 1
+        return True
+
+    def _store(self, domain, url, persist=True):
+        with self._lock:
+            self._checked[domain] = url
+        if self.cache is not None and persist:
+            self.cache[domain] = json.dumps({"url": url, "checked_at": time.time()})
+
+    def close(self):
+        """Grava o cache persistente de verificações, se houver."""
+        if self.cache is not None and hasattr(self.cache, "close"):
+            self.cache.close()
+
+    def _get_session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+    def _probe(self, domain):
+        """
+        Verifica um domínio candidato por DNS e HEAD.
+
+        Returns:
+            tuple: (URL final do site após redirecionamentos ou None,
+                    se o resultado é definitivo e pode ser persistido)
+        """
+        host = None
+        definitive = True
+        for candidate_host in (domain, f"www.{domain}"):
+            with self._lock:
+                self.stats["dns_checks"] += 1
+            try:
+                socket.getaddrinfo(candidate_host, 443, type=socket.SOCK_STREAM)
+                host = candidate_host
+                break
+            except socket.gaierror as e:
+                # Falha temporária do resolvedor não prova que o domínio não existe
+                if e.errno == socket.EAI_AGAIN:
+                    definitive = False
+            except UnicodeError:
+                continue
+
+        if host is None:
+            with self._lock:
+                self.stats["dns_failures"] += 1
+            return None, definitive
+
+        with self._lock:
+            self.stats["head_checks"] += 1
+        try:
+            response = self._get_session().head(f"https://{host}/", allow_redirects=True, timeout=self.timeout)
+        except requests.RequestException as e:
+            self.logger.debug(f"HEAD falhou para {host}: {str(e)}")
+            with self._lock:
+                self.stats["head_failures"] += 1
+            return None, not isinstance(e, requests.Timeout)
+
+        # 405: o site existe, mas não aceita HEAD
+        if response.status_code >= 400 and response.status_code != 405:
+            with self._lock:
+                self.stats["head_failures"] += 1
+            return None, True
+
+        final_url = response.url or f"https://{host}/"
+        if not self._same_site(domain, final_url):
+            self.logger.debug(f"{domain} redireciona para outro site ({final_url}); descartado")
+            with self._lock:
+                self.stats["head_failures"] += 1
+            return None, True
+
+        return final_url, True
+
+    @staticmethod
+    def _same_site(domain, final_url):
+        """Confere se o redirecionamento não levou a outro site (ex.: páginas de domínio à venda)."""
+        name = domain.split('.')[0].replace('-', '')
+        final_host = (urlsplit(final_url).hostname or "").replace('-', '').replace('.', '')
+        return name in final_host
@@ -1,14 +1,25 @@
 import requests
 import logging
 import random
+import socket
+import threading
 import time
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 
+THROTTLE_STATUS = (429, 503)
+
 class HtmlFetcher:
     """Serviço para buscar e processar conteúdo HTML."""
     
-    def __init__(self, config=None):
+    def __init__(self, config=None, controller=None):
+        """
+        Args:
+            config (dict): Configurações do serviço
+            controller (AimdConcurrencyController): Controle de requisições simultâneas (opcional)
+        """
         self.config = config or {}
+        self.controller = controller
         self.logger = logging.getLogger(__name__)
         self.default_headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
@@ -16,14 +27,30 @@ class HtmlFetcher:
             'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
             'Referer': 'https://www.google.com/'
         }
+        
+        # Sessão por thread: reaproveita conexões (keep-alive) com o mesmo host
+        self._local = threading.local()
+    
+    def _get_session(self):
+        """Retorna a sessão HTTP da thread atual, criando-a na primeira chamada."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
     
-    def fetch(self, url, max_retries=3):
+    def fetch(self, url, max_retries=3, deadline=None):
         """
         Busca conteúdo HTML de uma URL com suporte a retentativas.
         
+        Cada tentativa tem um tempo total máximo ('total_timeout'), e não só por
+        leitura: um servidor que envia a página aos poucos é interrompido. Com
+        `deadline`, nenhuma tentativa ou espera entre tentativas passa dele.
+        
         Args:
             url (str): URL para buscar
             max_retries (int): Número máximo de tentativas
+            deadline (float): Instante limite (time.monotonic()) para obter a página
             
         Returns:
             str: Conteúdo HTML ou None em caso de falha
@@ -33,17 +60,14 @@ class HtmlFetcher:
                 # Adicionar delay aleatório para evitar bloqueios
                 if attempt > 0:
                     delay = 2 ** attempt + random.uniform(1, 3)
+                    if deadline is not None and time.monotonic() + delay >= deadline:
+                        self.logger.warning(f"Sem tempo para nova tentativa de buscar {url}")
+                        return None
                     self.logger.info(f"Aguardando {delay:.2f}s antes de nova tentativa...")
                     time.sleep(delay)
                 
                 # Fazer requisição
-                response = requests.get(
-                    url,
-                    headers=self.default_headers,
-                    timeout=30
-                )
-                response.raise_for_status()
-                return response.text
+                return self._request(url, deadline)
                 
             except requests.RequestException as e:
                 self.logger.warning(f"Tentativa {attempt+1}/{max_retries} falhou: {str(e)}")
@@ -51,6 +75,98 @@ class HtmlFetcher:
         self.logger.error(f"Todas as {max_retries} tentativas falharam ao buscar {url}")
         return None
     
+    def _request(self, url, deadline=None):
+        """Faz a requisição dentro do limite de concorrência e informa o desfecho ao controle."""
+        request_deadline = time.monotonic() + self.config.get("total_timeout", 45)
+        if deadline is not None:
+            request_deadline = min(request_deadline, deadline)
+        
+        if self.controller is None:
+            return self._download(url, request_deadline)
+        
+        host = urlparse(url).netloc
+        if not self.controller.acquire(host, timeout=request_deadline - time.monotonic()):
+            raise requests.Timeout(f"Sem vaga para requisições a {host} dentro do tempo limite")
+        started = time.monotonic()
+        outcome, retry_after = "error", None
+        try:
+            content = self._download(url, request_deadline)
+            outcome = "ok"
+            return content
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else 500
+            if status in THROTTLE_STATUS:
+                outcome, retry_after = "throttled", self._retry_after(e.response)
+            elif status < 500:
+                outcome = "ok"
+            raise
+        finally:
+            self.controller.release(host, time.monotonic() - started, outcome, retry_after)
+    
+    def _download(self, url, request_deadline):
+        """
+        Baixa a página, fechando a conexão se o instante limite passar antes do fim.
+        
+        Raises:
+            requests.Timeout: Se o instante limite passar antes do fim da página
+            requests.HTTPError: Se o servidor responder com erro
+        """
+        remaining = request_deadline - time.monotonic()
+        if remaining <= 0:
+            raise requests.Timeout(f"Tempo limite esgotado antes de buscar {url}")
+        
+        read_timeout = min(self.config.get("timeout", 30), remaining)
+        with self._get_session().get(url, headers=self.default_headers, timeout=read_timeout, stream=True) as response:
+            response.raise_for_status()
+            
+            # O timeout da biblioteca vale por leitura; um servidor que envia a página
+            # aos poucos só é interrompido desligando a conexão no instante limite
+            expired = threading.Event()
+            
+            def expire():
+                expired.set()
+                self._abort(response)
+            
+            timer = threading.Timer(max(0.0, request_deadline - time.monotonic()), expire)
+            timer.daemon = True
+            timer.start()
+            try:
+                content = response.text
+            except Exception as e:
+                if expired.is_set():
+                    raise requests.Timeout(f"Tempo total excedido ao baixar {url}") from e
+                raise
+            finally:
+                timer.cancel()
+            
+            if expired.is_set():
+                raise requests.Timeout(f"Tempo total excedido ao baixar {url}")
+            return content
+    
+    @staticmethod
+    def _abort(response):
+        """Interrompe o download em andamento: fechar a resposta não desbloqueia uma leitura já em curso, desligar o socket sim."""
+        sock = getattr(getattr(response.raw, "connection", None), "sock", None)
+        if sock is None:
+            # Conexões que fecham ao fim da resposta (HTTP/1.0, 'Connection: close') só
+            # guardam o socket no arquivo de leitura da resposta
+            fp = getattr(getattr(response.raw, "_fp", None), "fp", None)
+            sock = getattr(getattr(fp, "raw", None), "_sock", None)
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        response.close()
+    
+    @staticmethod
+    def _retry_after(response):
+        """Segundos pedidos no cabeçalho Retry-After (None se ausente ou em formato de data)."""
+        try:
+            return max(0.0, float(response.headers.get("Retry-After")))
+        except (TypeError, ValueError):
+            return None
+    
     def extract_text(self, html_content):
         """
         Extrai texto e links de conteúdo HTML.
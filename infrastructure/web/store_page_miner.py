@@ -0,0 +1,124 @@
+import logging
+import re
+from urllib.parse import urljoin, urlsplit
+from domain.services.relevance_scoring import RelevanceScorer
+from infrastructure.index.domain_trie import DomainTrie, default_domain_trie
+from infrastructure.web.url_result_cache import UrlResultCache
+
+# Links em atributos href e em campos de URL do estado embutido da página (JSON)
+LINK_PATTERN = re.compile(r'(?:href=|"(?:url|link|href|website|site)"\s*:\s*)["\']([^"\'\s<>]+)["\']', re.IGNORECASE)
+
+# Domínios do próprio Mercado Livre e de infraestrutura das páginas, além dos
+# domínios conhecidos de default_domain_trie, que nunca são o site da loja
+INFRASTRUCTURE_HOSTS = DomainTrie({"infrastructure": [
+    "mlstatic.com", "mercadopago.com", "mercadopago.com.br", "mercadoshops.com.br",
+    "google.com", "google.com.br", "googletagmanager.com", "gstatic.com", "doubleclick.net",
+    "apple.com", "schema.org", "w3.org", "facebook.net", "cloudfront.net"
+]})
+
+class StorePageMiner:
+    """
+    Extrai links externos da página de loja oficial no Mercado Livre.
+
+    As páginas de loja costumam apontar para o site da marca e para seus
+    perfis em redes sociais. Os links do site servem de ponto de partida para
+    a extração de contatos, dispensando a pesquisa; os de redes sociais são
+    devolvidos à parte. Cada página é buscada uma única vez por execução.
+
+    A página também traz links de rodapé, analytics, órgãos públicos e
+    parceiros. Por isso os sites são pontuados contra o nome da loja
+    (RelevanceScorer) e os abaixo do limite de relevância são descartados.
+    """
+
+    def __init__(self, html_fetcher, cache=None, max_sites=2, relevance_scorer=None):
+        """
+        Args:
+            html_fetcher (HtmlFetcher): Serviço de busca de HTML
+            cache (UrlResultCache): Cache de resultados por URL da execução
+            max_sites (int): Número máximo de links de site devolvidos por loja
+            relevance_scorer (RelevanceScorer): Pontuação dos sites contra o nome da loja
+        """
+        self.html_fetcher = html_fetcher
+        self.cache = cache if cache is not None else UrlResultCache()
+        self.max_sites = max_sites
+        self.relevance_scorer = relevance_scorer if relevance_scorer is not None else RelevanceScorer()
+        self.logger = logging.getLogger(__name__)
+
+    def mine(self, store_link, store_name=None):
+        """
+        Busca a página da loja no Mercado Livre e separa seus links externos.
+
+        Args:
+            store_link (str): Link da loja no Mercado Livre
+            store_name (str): Nome da loja; sem ele, os sites não são filtrados por relevância
+
+        Returns:
+            dict: {'sites': [...], 'social': [...]}; listas vazias se a página
+                  não pôde ser buscada
+        """
+        result, _ = self.cache.get_or_load(store_link, lambda: self._load(store_link))
+        return {"sites": self.select_sites(store_name, result["sites"]), "social": result["social"]}
+
+    def select_sites(self, store_name, sites):
+        """
+        Escolhe até `max_sites` sites, do mais ao menos relevante para a loja.
+
+        Returns:
+            list: URLs dos sites com relevância acima do limite
+        """
+        if store_name:
+            ranked, rejected = self.relevance_scorer.rank(store_name, [{"link": url} for url in sites])
+            if rejected:
+                self.logger.info(f"{rejected} sites da página da loja ignorados por não pertencerem a '{store_name}'")
+            sites = [result["link"] for result in ranked]
+        return sites[:self.max_sites]
+
+    def _load(self, store_link):
+        html_content = self.html_fetcher.fetch(store_link)
+        if not html_content:
+            self.logger.warning(f"Não foi possível buscar a página da loja: {store_link}")
+            return {"sites": [], "social": []}
+
+        result = self.extract_links(html_content, store_link)
+        self.logger.info(
+            f"Página da loja {store_link}: {len(result['sites'])} sites, {len(result['social'])} redes sociais"
+        )
+        return result
+
+    def extract_links(self, html_content, base_url):
+        """
+        Separa os links externos de uma página em sites e redes sociais.
+
+        Args:
+            html_content (str): HTML da página da loja
+            base_url (str): URL da página, para resolver links relativos
+
+        Returns:
+            dict: {'sites': [...], 'social': [...]} sem repetição, na ordem em que aparecem
+                  (todos os sites; a seleção por loja é feita em `select_sites`)
+        """
+        # URLs no estado embutido vêm com barras escapadas
+        html_content = html_content.replace('\\u002F', '/').replace('\\/', '/')
+
+        sites, social = [], []
+        seen_hosts = set()
+
+        for match in LINK_PATTERN.finditer(html_content):
+            url = urljoin(base_url, match.group(1).replace('&amp;', '&'))
+            parts = urlsplit(url)
+            if parts.scheme not in ("http", "https") or not parts.hostname:
+                continue
+
+            host = parts.hostname.lower()
+            domain_class = default_domain_trie().classify(host)
+
+            if domain_class == "social":
+                if url not in social:
+                    social.append(url)
+            elif domain_class is None and INFRASTRUCTURE_HOSTS.classify(host) is None:
+                site_host = host[4:] if host.startswith("www.") else host
+                if site_host not in seen_hosts:
+                    seen_hosts.add(site_host)
+                    sites.append(url)
+
+        return {"sites": sites, "social": social}
@@ -0,0 +1,108 @@
+import logging
+import threading
+from concurrent.futures import Future
+
+class UrlResultCache:
+    """
+    Cache de resultados por URL com escopo de uma execução.
+
+    Guarda o resultado de buscar e extrair cada URL (status e contatos) e
+    coalesce requisições simultâneas: se uma URL já está sendo processada por
+    outra thread, as demais aguardam o mesmo resultado em vez de buscá-la de novo.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._results = {}
+        self._in_flight = {}
+
+        self.stats = {
+            "lookups": 0,
+            "hits": 0,
+            "coalesced": 0,
+            "misses": 0
+        }
+
+    def get_or_load(self, url, loader):
+        """
+        Obtém o resultado da URL do cache ou executa `loader` uma única vez.
+        
+        Args:
+            url (str): URL normalizada
+            loader (callable): Função sem argumentos que retorna o resultado da URL
+            
+        Returns:
+            tuple: (resultado, origem) onde origem é 'hit', 'coalesced' ou 'miss'
+        """
+        origin, value = self.claim(url)
+        if origin == "hit":
+            return value, "hit"
+        if origin == "coalesced":
+            return value.result(), "coalesced"
+        
+        try:
+            result = loader()
+        except BaseException as e:
+            self.fail(url, e)
+            raise
+        
+        self.complete(url, result)
+        return result, "miss"
+    
+    def claim(self, url):
+        """
+        Reserva a URL para quem vai carregá-la, sem bloquear.
+        
+        Quem recebe 'owner' deve chamar `complete` ou `fail` depois, possivelmente
+        em outra thread (ex.: a busca em uma etapa e a extração em outra).
+        
+        Returns:
+            tuple: ('hit', resultado), ('coalesced', Future do resultado) ou ('owner', None)
+        """
+        with self._lock:
+            self.stats["lookups"] += 1
+            
+            if url in self._results:
+                self.stats["hits"] += 1
+                return "hit", self._results[url]
+            
+            future = self._in_flight.get(url)
+            if future is not None:
+                self.stats["coalesced"] += 1
+                return "coalesced", future
+            
+            self.stats["misses"] += 1
+            self._in_flight[url] = Future()
+            return "owner", None
+    
+    def complete(self, url, result):
+        """Grava o resultado de uma URL reservada e libera quem a aguarda."""
+        with self._lock:
+            self._results[url] = result
+            future = self._in_flight.pop(url, None)
+        if future is not None:
+            future.set_result(result)
+    
+    def fail(self, url, error):
+        """Propaga o erro de uma URL reservada para quem a aguarda, sem guardar em cache."""
+        with self._lock:
+            future = self._in_flight.pop(url, None)
+        if future is not None:
+            future.set_exception(error)
+    
+    def __contains__(self, url):
+        with self._lock:
+            return url in self._results
+
+    def __len__(self):
+        with self._lock:
+            return len(self._results)
+
+    def get_stats(self):
+        """Retorna as estatísticas do cache, incluindo a taxa de acerto."""
+        with self._lock:
+            stats = dict(self.stats)
+        served = stats["hits"] + stats["coalesced"]
+        stats["hit_rate"] = round(served / stats["lookups"], 4) if stats["lookups"] else 0.0
+        return stats
@@ -1,7 +1,8 @@
 import logging
+import os
+import shutil
 import signal
 import sys
-import os
 import traceback
 from datetime import datetime
 
@@ -13,46 +14,64 @@ class ScrapingController:
         self.presenter = presenter
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.collected_results = []
+        self.processed_count = 0
+        
+        # Destino dos resultados da execução em andamento e pedido de interrupção (Ctrl+C)
+        self._sink = None
+        self._interrupted = False
     
     def setup_signal_handlers(self):
         """Configura manipuladores de sinais para interrupção limpa."""
         signal.signal(signal.SIGINT, self._handle_interrupt)
     
     def _handle_interrupt(self, signal_num, frame):
-        """Manipula interrupção Ctrl+C."""
-        self.logger.info("\n\nInterrupção detectada (Ctrl+C). Finalizando de forma limpa...")
-        self._save_intermediate_results("interrompido")
-        sys.exit(0)
-    
-    def _save_intermediate_results(self, suffix="parcial"):
-        """Salva resultados intermediários."""
-        if not self.collected_results:
-            self.logger.warning("Nenhum resultado para salvar.")
-            return
-            
-        # Criar diretório de saída se não existir
-        os.makedirs("resultados", exist_ok=True)
-        
-        # Salvar em vários formatos
-        output_base = f"resultados/contatos_{suffix}"
+        """
+        Manipula interrupção Ctrl+C.
         
-        # Converter para dicionários
-        results_dict = [store.to_dict() for store in self.collected_results]
+        Durante o processamento, só marca a interrupção: o sinal pode chegar no
+        meio da gravação de uma loja, então os arquivos são concluídos pelo laço
+        de `process_stores`, depois da loja em andamento. Um segundo Ctrl+C
+        encerra imediatamente (os arquivos podem ficar incompletos).
+        """
+        if self._sink is None:
+            sys.exit(0)
+        if self._interrupted:
+            raise KeyboardInterrupt
+        self._interrupted = True
+    
+    def _close_sink(self, output_base, suffix=None):
+        """
+        Conclui os arquivos de saída com as lojas gravadas até agora.
         
-        # JSON
-        self.presenter.save_json(results_dict, f"{output_base}.json")
+        Com `suffix`, também os copia para `resultados/contatos_{suffix}.*`
+        ('final' ou 'interrompido'), os nomes usados pelas execuções anteriores.
+        """
+        sink, self._sink = self._sink, None
+        if sink is None:
+            return
+        sink.close()
+        self.logger.info(f"{sink.count} lojas gravadas nos arquivos de saída")
         
-        # CSV
-        self.presenter.save_csv(results_dict, f"{output_base}.csv")
+        if suffix is None:
+            return
+        if not sink.count:
+            self.logger.warning("Nenhum resultado para salvar.")
+            return
         
-        # HTML
-        self.presenter.save_html(results_dict, f"{output_base}.html")
+        target_base = os.path.join(os.path.dirname(output_base), f"contatos_{suffix}")
+        for extension in ("json", "csv", "html"):
+            shutil.copyfile(f"{output_base}.{extension}", f"{target_base}.{extension}")
+        self.logger.info(f"Resultados copiados para {target_base}.json/.csv/.html")
     
     def process_stores(self, json_file_path=None):
         """
         Processa lojas de um arquivo JSON.
         
+        Cada loja é gravada nos arquivos de saída (JSON, CSV e HTML) assim que
+        é concluída, sem acumular os resultados em memória. Ao final, os arquivos
+        também ficam em `resultados/contatos_final.*` (ou `contatos_interrompido.*`
+        se a execução for interrompida com Ctrl+C).
+        
         Args:
             json_file_path: Caminho do arquivo JSON com lojas
             
@@ -64,25 +83,34 @@ class ScrapingController:
             if not json_file_path:
                 json_file_path = self.config.get("default_input_file", "lojas_oficiais_emergencia.json")
             
-            # Caminho para arquivo de saída
+            # Caminho base dos arquivos de saída
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"resultados/contatos_processados_{timestamp}.json"
+            output_base = f"resultados/contatos_processados_{timestamp}"
             
             # Processar lojas
             self.logger.info(f"Iniciando processamento de lojas de: {json_file_path}")
             
-            processed_stores = self.process_stores_usecase.execute(
-                json_file_path=json_file_path,
-                output_file=output_file
-            )
-            
-            # Armazenar resultados para acesso posterior
-            self.collected_results = processed_stores
+            self._interrupted = False
+            self.processed_count = 0
+            suffix = None
+            self._sink = self.presenter.open_sinks(output_base)
+            try:
+                for store in self.process_stores_usecase.iter_execute(json_file_path):
+                    self._sink.write(store)
+                    self.processed_count += 1
+                    if self._interrupted:
+                        break
+                suffix = "final"
+                if self._interrupted:
+                    self.logger.info("\n\nInterrupção detectada (Ctrl+C). Finalizando de forma limpa...")
+                    suffix = "interrompido"
+            finally:
+                self._close_sink(output_base, suffix)
             
-            # Salvar em múltiplos formatos
-            self._save_intermediate_results("final")
+            if self._interrupted:
+                sys.exit(0)
             
-            self.logger.info(f"Processamento concluído. {len(processed_stores)} lojas processadas.")
+            self.logger.info(f"Processamento concluído. {self.processed_count} lojas processadas.")
             return True
             
         except Exception as e:
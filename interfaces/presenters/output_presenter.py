@@ -1,7 +1,104 @@
+import csv
+import html
 import json
 import pandas as pd
 import logging
 import os
+from application.services.store_sink import StoreSink, CompositeStoreSink, store_record
+from infrastructure.repositories.store_repository import JsonArrayStoreSink
+
+SOCIAL_NETWORKS = ['facebook', 'instagram', 'twitter', 'linkedin', 'youtube']
+
+# Colunas da tabela planificada (CSV/HTML) de resultados
+FLAT_COLUMNS = [
+    'nome_loja', 'url', 'success', 'data_scraping', 'emails', 'telefones', 'cnpjs', 'ceps',
+    'whatsapp_links', 'whatsapp_numeros', *SOCIAL_NETWORKS, 'erro'
+]
+
+def flatten_record(item):
+    """Converte um resultado aninhado em um registro planificado para CSV/HTML."""
+    # Verificar se é um resultado bem-sucedido
+    success = item.get('success', False)
+    
+    flat_record = {
+        'nome_loja': item.get('nome_loja', 'Desconhecido'),
+        'url': item.get('url', ''),
+        'success': success,
+        'data_scraping': item.get('scrapingTime', '')
+    }
+    
+    # Adicionar dados de contato se bem-sucedido
+    if success and 'data' in item:
+        contact_data = item['data']
+        
+        # Emails
+        flat_record['emails'] = ', '.join(contact_data.get('emails', []))
+        
+        # Telefones
+        flat_record['telefones'] = ', '.join(contact_data.get('phones', []))
+        
+        # Documentos (CNPJ e CEP)
+        flat_record['cnpjs'] = ', '.join(contact_data.get('cnpjs', []))
+        flat_record['ceps'] = ', '.join(contact_data.get('ceps', []))
+        
+        # WhatsApp
+        whatsapp = contact_data.get('whatsapp', {})
+        flat_record['whatsapp_links'] = ', '.join(whatsapp.get('links', []))
+        flat_record['whatsapp_numeros'] = ', '.join(whatsapp.get('numbers', []))
+        
+        # Redes sociais
+        social = contact_data.get('socialMedia', {})
+        for network in SOCIAL_NETWORKS:
+            flat_record[network] = ', '.join(social.get(network, []))
+    else:
+        # Adicionar mensagem de erro
+        flat_record['erro'] = item.get('error', 'Erro desconhecido')
+    
+    return flat_record
+
+class CsvStoreSink(StoreSink):
+    """Grava lojas em CSV (colunas de FLAT_COLUMNS), uma linha por loja concluída."""
+    
+    def __init__(self, output_path):
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        self.output_path = output_path
+        self._file = open(output_path, 'w', encoding='utf-8', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=FLAT_COLUMNS)
+        self._writer.writeheader()
+    
+    def write(self, store):
+        self._writer.writerow(flatten_record(store_record(store)))
+        self._file.flush()
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+class HtmlStoreSink(StoreSink):
+    """Grava lojas em uma tabela HTML (mesmo formato de `save_html`), uma linha por loja concluída."""
+    
+    def __init__(self, output_path):
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        self.output_path = output_path
+        self._file = open(output_path, 'w', encoding='utf-8')
+        header = "".join(f"      <th>{html.escape(column)}</th>\n" for column in FLAT_COLUMNS)
+        self._file.write(
+            '<table border="1" class="dataframe table table-striped">\n  <thead>\n'
+            f'    <tr style="text-align: right;">\n{header}    </tr>\n  </thead>\n  <tbody>\n'
+        )
+    
+    def write(self, store):
+        record = flatten_record(store_record(store))
+        cells = "".join(f"      <td>{html.escape(str(record.get(column, '')))}</td>\n" for column in FLAT_COLUMNS)
+        self._file.write(f"    <tr>\n{cells}    </tr>\n")
+        self._file.flush()
+    
+    def close(self):
+        if self._file is not None:
+            self._file.write("  </tbody>\n</table>")
+            self._file.close()
+            self._file = None
 
 class OutputPresenter:
     """Apresentador para formatar e salvar resultados."""
@@ -9,6 +106,24 @@ class OutputPresenter:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
     
+    def open_sinks(self, output_base):
+        """
+        Abre destinos JSON, CSV e HTML que gravam cada loja assim que é concluída.
+        
+        Args:
+            output_base (str): Caminho dos arquivos, sem extensão
+            
+        Returns:
+            CompositeStoreSink: Sink que repassa cada loja aos três arquivos
+        """
+        sinks = CompositeStoreSink([
+            JsonArrayStoreSink(f"{output_base}.json"),
+            CsvStoreSink(f"{output_base}.csv"),
+            HtmlStoreSink(f"{output_base}.html")
+        ])
+        self.logger.info(f"Gravando resultados em {output_base}.json/.csv/.html à medida que são concluídos")
+        return sinks
+    
     def save_json(self, data, output_path):
         """Salva dados em formato JSON."""
         try:
@@ -72,45 +187,4 @@ class OutputPresenter:
     
     def _flatten_data(self, data):
         """Converte dados aninhados em formato planificado para CSV/HTML."""
-        flat_records = []
-        
-        for item in data:
-            if not isinstance(item, dict):
-                continue
-                
-            # Verificar se é um resultado bem-sucedido
-            success = item.get('success', False)
-            
-            flat_record = {
-                'nome_loja': item.get('nome_loja', 'Desconhecido'),
-                'url': item.get('url', ''),
-                'success': success,
-                'data_scraping': item.get('scrapingTime', '')
-            }
-            
-            # Adicionar dados de contato se bem-sucedido
-            if success and 'data' in item:
-                contact_data = item['data']
-                
-                # Emails
-                flat_record['emails'] = ', '.join(contact_data.get('emails', []))
-                
-                # Telefones
-                flat_record['telefones'] = ', '.join(contact_data.get('phones', []))
-                
-                # WhatsApp
-                whatsapp = contact_data.get('whatsapp', {})
-                flat_record['whatsapp_links'] = ', '.join(whatsapp.get('links', []))
-                flat_record['whatsapp_numeros'] = ', '.join(whatsapp.get('numbers', []))
-                
-                # Redes sociais
-                social = contact_data.get('socialMedia', {})
-                for network in ['facebook', 'instagram', 'twitter', 'linkedin', 'youtube']:
-                    flat_record[network] = ', '.join(social.get(network, []))
-            else:
-                # Adicionar mensagem de erro
-                flat_record['erro'] = item.get('error', 'Erro desconhecido')
-            
-            flat_records.append(flat_record)
-            
-        return flat_records
+        return [flatten_record(item) for item in data if isinstance(item, dict)]
@@ -1,5 +1,25 @@
 
-from googleapiclient.discovery import build
+import threading
+
+from infrastructure.search.google_search_service import build_search_client
+
+# Clientes reutilizados por thread e por chave de API
+_clientes = threading.local()
+
+def obter_cliente(chave_api):
+  """
+  Retorna o cliente da Custom Search API da thread atual para a chave informada.
+
+  O cliente é montado uma única vez a partir do documento de descoberta
+  empacotado, em vez de ser reconstruído a cada pesquisa.
+  """
+  cache = getattr(_clientes, "por_chave", None)
+  if cache is None:
+    cache = _clientes.por_chave = {}
+
+  if chave_api not in cache:
+    cache[chave_api] = build_search_client(chave_api)
+  return cache[chave_api]
 
 def pesquisa_google(chave_api, id_mecanismo, consulta):
   """
@@ -14,7 +34,7 @@ def pesquisa_google(chave_api, id_mecanismo, consulta):
     Uma lista de resultados da pesquisa ou None em caso de erro.
   """
   try:
-    servico = build("customsearch", "v1", developerKey=chave_api)
+    servico = obter_cliente(chave_api)
     requisicao = servico.cse().list(q=consulta, cx=id_mecanismo)
     resposta = requisicao.execute()
     return resposta.get("items")
@@ -0,0 +1,40 @@
+"""
+Compacta o journal de checkpoint do Scraper Service no arquivo final de resultados.
+
+Mantém o último registro de cada loja, na ordem da lista de lojas de entrada
+(se informada), e grava o JSON final de forma atômica. Pode ser executado a
+qualquer momento, inclusive com uma execução em andamento.
+
+Uso:
+    python services/compact_checkpoint.py [--journal resultados/checkpoint/contatos.ndjson]
+        [--output resultados/scraper_service_results.json] [--stores lojas_oficiais_parcial.json]
+"""
+import argparse
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import Settings
+from infrastructure.repositories.checkpoint_journal import CheckpointJournal
+from infrastructure.repositories.store_repository import StoreRepository
+
+def main():
+    settings = Settings()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--journal', default=settings.get("checkpoint.path", "resultados/checkpoint/contatos.ndjson"))
+    parser.add_argument('--output', default="resultados/scraper_service_results.json")
+    parser.add_argument('--stores', default="lojas_oficiais_parcial.json", help="Lista de lojas que define a ordem de saída")
+    args = parser.parse_args()
+
+    order = None
+    if args.stores and os.path.exists(args.stores):
+        order = [item.get("nome") for item in StoreRepository().load_stores(args.stores) if "nome" in item]
+
+    total = CheckpointJournal.compact(args.journal, args.output, order=order)
+    print(f"{total} lojas gravadas em {args.output}")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    main()
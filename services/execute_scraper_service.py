@@ -1,11 +1,33 @@
 import os
+import glob
+import socket
+import time
 import logging
+import argparse
+import datetime
+from collections import Counter
 from config.settings import Settings
 from domain.usecases.extract_contacts_usecase import ExtractContactsUseCase
 from infrastructure.repositories.store_repository import StoreRepository
+from infrastructure.repositories.checkpoint_journal import CheckpointJournal
+from domain.services.incremental_planning import IncrementalPlanner
+from domain.services.relevance_scoring import RelevanceScorer
+from domain.services.yield_scoring import YieldEstimator, StorePriorityQueue
 from infrastructure.web.html_fetcher import HtmlFetcher
+from infrastructure.web.concurrency_controller import AimdConcurrencyController
+from infrastructure.web.domain_resolver import CandidateDomainResolver
+from infrastructure.web.store_page_miner import StorePageMiner
 from infrastructure.search.google_search_service import GoogleSearchService
+from infrastructure.search.search_cache import SearchResultCache
+from infrastructure.search.quota_scheduler import SearchQuotaScheduler, QuotaExceededError
+from infrastructure.index.seen_index import SeenIndex, SqliteKeyValueStore
+from infrastructure.queue.sqlite_work_queue import SqliteWorkQueue
 from application.services.scraping_service import ScrapingService
+from application.services.scraping_pipeline import ScrapingPipeline
+from application.services.sharded_runner import ShardedRunner
+from application.services.queue_worker import QueueWorker
+from application.services.deadline_scheduler import DeadlineScheduler, DeadlineExceededError, parse_deadline
+from application.services.store_watchdog import StoreWatchdog
 
 # Configurar logging
 logging.basicConfig(
@@ -19,43 +41,653 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-def main():
-    """Executa o Scraper Service diretamente para uma lista de lojas"""
-    logger.info("=== Inicializando Scraper Service ===")
+def create_seen_index(settings, name):
+    """Cria um índice de itens vistos conforme as configurações de 'index'."""
+    return SeenIndex(
+        name,
+        error_rate=settings.get("index.error_rate", 0.001),
+        initial_capacity=settings.get("index.initial_capacity", 10000),
+        directory=settings.get("index.directory") if settings.get("index.persist", False) else None,
+        commit_every=settings.get("index.commit_every", 500),
+        commit_interval=settings.get("index.commit_interval_seconds", 5.0)
+    )
+
+def create_search_cache(settings):
+    """Cria o cache persistente de pesquisas, se habilitado nas configurações."""
+    if not settings.get("search_cache.enabled", True):
+        return None
     
-    # 1. Carregar configurações
-    settings = Settings()
+    return SearchResultCache(
+        settings.get("search_cache.path", "resultados/cache/pesquisas.sqlite"),
+        ttl_seconds=settings.get("search_cache.ttl_hours", 168) * 3600,
+        stale_ttl_seconds=settings.get("search_cache.stale_ttl_hours", 720) * 3600
+    )
+
+def create_store_page_miner(settings, html_fetcher):
+    """Cria o extrator de links das páginas de loja, se habilitado nas configurações."""
+    if not settings.get("store_pages.enabled", True):
+        return None
     
-    # 2. Criar repositório
-    store_repository = StoreRepository()
+    return StorePageMiner(
+        html_fetcher,
+        max_sites=settings.get("store_pages.max_sites", 2),
+        relevance_scorer=RelevanceScorer(threshold=settings.get("relevance.threshold", 0.3))
+    )
+
+def create_domain_resolver(settings):
+    """Cria o resolvedor de sites oficiais por slug, se habilitado nas configurações."""
+    if not settings.get("domain_guess.enabled", True):
+        return None
+    
+    cache_path = settings.get("domain_guess.cache_path")
+    return CandidateDomainResolver(
+        tlds=settings.get("domain_guess.tlds", [".com.br", ".com"]),
+        strip_suffixes=settings.get("domain_guess.strip_suffixes", ["brasil", "br", "oficial"]),
+        timeout=settings.get("domain_guess.timeout", 3),
+        max_workers=settings.get("domain_guess.max_workers", 16),
+        cache=SqliteKeyValueStore(cache_path) if cache_path else None,
+        cache_ttl_seconds=settings.get("domain_guess.cache_ttl_hours", 720) * 3600
+    )
+
+def create_concurrency_controller(settings):
+    """Cria o controle AIMD de requisições simultâneas, se habilitado nas configurações."""
+    if not settings.get("concurrency.enabled", True):
+        return None
+    
+    return AimdConcurrencyController(
+        initial_limit=settings.get("concurrency.initial_limit", 4),
+        min_limit=settings.get("concurrency.min_limit", 1),
+        max_limit=settings.get("concurrency.max_limit", 32),
+        initial_host_limit=settings.get("concurrency.initial_host_limit", 2),
+        max_host_limit=settings.get("concurrency.max_host_limit", 8),
+        increase=settings.get("concurrency.increase", 1.0),
+        decrease_factor=settings.get("concurrency.decrease_factor", 0.5),
+        latency_tolerance=settings.get("concurrency.latency_tolerance", 2.0),
+        error_rate_threshold=settings.get("concurrency.error_rate_threshold", 0.2),
+        cooldown_seconds=settings.get("concurrency.cooldown_seconds", 2.0)
+    )
+
+def create_quota_scheduler(settings):
+    """Cria o agendador de cota de pesquisas, se habilitado nas configurações."""
+    if not settings.get("quota.enabled", True):
+        return None
+    
+    return SearchQuotaScheduler(
+        settings.get("quota.state_path", "resultados/cache/cota_pesquisas.json"),
+        daily_limit=settings.get("quota.daily_limit", 100),
+        qps=settings.get("quota.qps", 1.0),
+        reset_timezone=settings.get("quota.reset_timezone", "America/Los_Angeles")
+    )
+
+def shard_usage_path(settings, shard):
+    """Arquivo em que o shard grava, a cada pesquisa, o consumo da sua fatia da cota."""
+    base, _ = os.path.splitext(settings.get("quota.state_path", "resultados/cache/cota_pesquisas.json"))
+    return f"{base}.shard-{shard}.json"
+
+def collect_shard_usage(settings, quota):
+    """
+    Soma à cota do dia o consumo gravado pelos shards e remove seus arquivos.
+    
+    Os arquivos são atualizados a cada pesquisa, então o consumo de um shard
+    (ou de uma execução inteira) que caiu antes de devolver sua saída também
+    é contabilizado, na próxima chamada.
+    
+    Returns:
+        int: Pesquisas somadas à cota
+    """
+    base, _ = os.path.splitext(settings.get("quota.state_path", "resultados/cache/cota_pesquisas.json"))
+    total = 0
+    for path in glob.glob(f"{glob.escape(base)}.shard-*.json"):
+        # Só conta o consumo do dia corrente da cota; arquivos de outro dia valem 0
+        total += SearchQuotaScheduler(
+            path, reset_timezone=settings.get("quota.reset_timezone", "America/Los_Angeles")
+        ).used
+        os.remove(path)
+    quota.record_usage(total)
+    return total
+
+def load_deferred_stores(settings, store_repository):
+    """
+    Carrega as lojas adiadas pela execução anterior (por cota ou por prazo).
+    
+    Returns:
+        list: Nomes das lojas pendentes (vazia se não houver arquivo)
+    """
+    deferred_path = settings.get("quota.deferred_path", "resultados/lojas_pendentes.json")
+    if not os.path.exists(deferred_path):
+        return []
+    return [item.get("nome") for item in store_repository.load_stores(deferred_path) if "nome" in item]
+
+def plan_quota(settings, google_search, store_names, pending=()):
+    """
+    Ordena as lojas por prioridade e separa as que cabem na cota restante.
+    
+    Lojas adiadas em execuções anteriores (`pending`) e as listadas em
+    'quota.priority_stores' vêm primeiro; lojas com pesquisa válida em cache não consomem cota (as vencidas
+    consomem uma consulta, gasta na revalidação em segundo plano).
+    
+    O plano é otimista (uma consulta por loja sem cache, mesmo que a loja
+    venha a ter sites sem pesquisa ou precise de retentativas); lojas que não
+    couberem de fato são adiadas quando a cota acaba durante a execução.
+    
+    Returns:
+        tuple: (lojas agendadas, lojas adiadas)
+    """
+    priority_names = set(pending) | set(settings.get("quota.priority_stores", []))
+    candidates = list(dict.fromkeys(list(pending) + list(store_names)))
+    
+    logger.info(f"Cota de pesquisas restante hoje: {google_search.quota.remaining()}")
+    return google_search.quota.plan(
+        candidates,
+        priority=lambda name: name in priority_names,
+        cost=google_search.search_cost
+    )
+
+def save_deferred_stores(settings, store_repository, store_names):
+    """Salva as lojas que ficaram para a próxima janela de cota (ou limpa a lista anterior)."""
+    deferred_path = settings.get("quota.deferred_path", "resultados/lojas_pendentes.json")
+    
+    if store_names:
+        store_repository.save_stores([{"nome": name} for name in store_names], deferred_path)
+        logger.info(f"{len(store_names)} lojas adiadas salvas em '{deferred_path}'")
+    elif os.path.exists(deferred_path):
+        os.remove(deferred_path)
+
+def load_previous_results(store_repository, results_path):
+    """Carrega os resultados da execução anterior (loja -> resultado), se o arquivo existir."""
+    if not os.path.exists(results_path):
+        return {}
+    
+    return {
+        item.get("nome_loja"): item
+        for item in store_repository.load_stores(results_path) if item.get("nome_loja")
+    }
+
+def plan_incremental(settings, anteriores, store_names):
+    """
+    Seleciona as lojas de uma execução incremental a partir dos resultados anteriores.
+    
+    São agendadas as lojas novas no catálogo, as que falharam antes e as com
+    resultado mais velho que 'incremental.ttl_hours'; as demais mantêm o
+    resultado anterior no conjunto de dados completo.
+    
+    Returns:
+        list: Lojas agendadas
+    """
+    planner = IncrementalPlanner(
+        ttl_hours=settings.get("incremental.ttl_hours", 168),
+        retry_failed=settings.get("incremental.retry_failed", True)
+    )
+    agendadas, motivos, reaproveitadas = planner.plan(store_names, anteriores)
+    logger.info(
+        f"Execução incremental: {len(agendadas)} lojas agendadas {dict(Counter(motivos.values()))}, "
+        f"{len(reaproveitadas)} com resultado ainda válido"
+    )
+    return agendadas
+
+def estimate_store_yields(settings, scraping_service, store_names, links, anteriores):
+    """
+    Estima o rendimento esperado e o custo em pesquisas de cada loja.
+    
+    Os sinais vêm só de dados locais, sem acessar a rede: o resultado da
+    execução anterior, o site adivinhado pelo slug (se já verificado) e a
+    relevância da pesquisa em cache.
+    
+    Returns:
+        dict: Nome da loja -> (rendimento esperado, pesquisas necessárias)
+    """
+    estimator = YieldEstimator(
+        prior=settings.get("scheduling.prior", 0.5),
+        history_weight=settings.get("scheduling.history_weight", 0.5),
+        site_weight=settings.get("scheduling.site_weight", 0.3),
+        search_weight=settings.get("scheduling.search_weight", 0.2)
+    )
+    scorer = scraping_service.relevance_scorer or RelevanceScorer()
+    google_search = scraping_service.search_service
+    resolver = scraping_service.domain_resolver
+    
+    estimativas = {}
+    for nome in store_names:
+        link = links.get(nome)
+        site = resolver.cached_site(link) if resolver is not None and link else None
+        
+        qualidade, custo = None, 1
+        if google_search.cache is not None:
+            cached, state = google_search.cache.get(google_search.build_store_query(nome), 3, record_stats=False)
+            if state != "miss":
+                qualidade = max((scorer.score(nome, resultado) for resultado in cached), default=0.0)
+                custo = 0
+        
+        estimativas[nome] = (estimator.score(anteriores.get(nome), site, qualidade), custo)
+    return estimativas
+
+def prioritize_stores(estimativas):
+    """
+    Ordena as lojas pelo rendimento esperado, da maior para a menor.
+    
+    Com cota ou tempo limitados, as lojas mais promissoras (e, no empate, as
+    de pesquisa em cache) vêm primeiro.
+    
+    Args:
+        estimativas (dict): Nome da loja -> (rendimento esperado, pesquisas necessárias)
+    
+    Returns:
+        list: Lojas na ordem de processamento
+    """
+    fila = StorePriorityQueue()
+    for nome, (rendimento, custo) in estimativas.items():
+        fila.push(nome, rendimento, custo)
+    
+    ordenadas = fila.drain()
+    logger.info(f"Lojas ordenadas por rendimento esperado; primeiras: {ordenadas[:5]}")
+    return ordenadas
+
+def merge_results(anteriores, resultados, ordem):
+    """Combina os resultados anteriores com os desta execução (que prevalecem), na ordem das lojas."""
+    combinados = dict(anteriores)
+    combinados.update((resultado.get('nome_loja'), resultado) for resultado in resultados)
+    posicao = {nome: i for i, nome in enumerate(ordem)}
+    return [combinados[nome] for nome in sorted(combinados, key=lambda nome: posicao.get(nome, len(posicao)))]
+
+def log_run_report(report):
+    """Registra no log o relatório de estatísticas da execução."""
+    logger.info("=== Relatório da execução ===")
+    for key, value in report.items():
+        logger.info(f"  {key}: {value}")
+
+def log_store_result(resultado):
+    """Registra no log o desfecho de uma loja."""
+    nome_loja = resultado.get('nome_loja')
+    if resultado.get('success', False):
+        logger.info(f"✓ Obtidos dados de contato para '{nome_loja}'")
+    else:
+        logger.warning(f"✗ Falha ao processar '{nome_loja}': {resultado.get('error', 'Erro desconhecido')}")
+
+def create_checkpoint_journal(settings):
+    """Abre o journal de checkpoint, se habilitado nas configurações."""
+    if not settings.get("checkpoint.enabled", True):
+        return None
+    
+    return CheckpointJournal(
+        settings.get("checkpoint.path", "resultados/checkpoint/contatos.ndjson"),
+        fsync_every=settings.get("checkpoint.fsync_every", 20),
+        fsync_interval=settings.get("checkpoint.fsync_interval_seconds", 5)
+    )
+
+def result_handler(journal):
+    """Retorna o tratamento de cada loja concluída: registro no journal (se houver) e no log."""
+    def handle(resultado):
+        if journal is not None:
+            journal.append(resultado)
+        log_store_result(resultado)
+    return handle
+
+def run_sequential(scraping_service, lojas, batch_size, on_result=log_store_result):
+    """
+    Processa as lojas uma de cada vez.
+    
+    Args:
+        scraping_service (ScrapingService): Serviço de scraping
+        lojas (list): Pares (nome da loja, link da loja no Mercado Livre)
+        batch_size (int): Tamanho dos grupos preparados de uma vez
+        on_result (callable): Chamado com o resultado de cada loja concluída
+        
+    Returns:
+        tuple: (resultados, nomes das lojas adiadas por falta de cota ou de tempo)
+    """
+    resultados = []
+    
+    for i, (nome_loja, _) in enumerate(lojas):
+        # Obter os sites do próximo grupo sem pesquisa e antecipar as pesquisas restantes
+        if i % batch_size == 0:
+            scraping_service.prepare_batch(lojas[i:i + batch_size])
+        
+        logger.info(f"Processando loja {i+1}/{len(lojas)}: {nome_loja}")
+        
+        # Executar scraping para a loja
+        try:
+            resultado = scraping_service.scrape_store(nome_loja)
+        except (QuotaExceededError, DeadlineExceededError) as e:
+            logger.warning(f"{str(e)}. Adiando {len(lojas) - i} lojas para a próxima janela")
+            return resultados, [nome for nome, _ in lojas[i:]]
+        
+        resultados.append(resultado)
+        on_result(resultado)
+    
+    return resultados, []
+
+def run_pipeline(settings, scraping_service, lojas, batch_size, on_result=log_store_result):
+    """
+    Processa as lojas pelo pipeline em etapas (pesquisa → busca → extração → persistência).
+    
+    Returns:
+        tuple: (resultados, nomes das lojas adiadas por falta de cota)
+    """
+    pipeline = ScrapingPipeline(scraping_service, settings, on_result=on_result)
+    resultados, adiadas = pipeline.run(lojas, batch_size=batch_size)
+    
+    metrics = pipeline.get_metrics()
+    logger.info(
+        f"Pipeline: {metrics['elapsed_seconds']}s, espera na admissão {metrics['admission_wait_seconds']}s"
+    )
+    for name, stage in metrics["stages"].items():
+        logger.info(f"  Etapa {name}: {stage}")
     
-    # 3. Criar serviços auxiliares
-    html_fetcher = HtmlFetcher(settings.config.get("scraping", {}))
+    return resultados, adiadas
+
+def run_with_deadline(settings, scraping_service, lojas, run, estimativas):
+    """
+    Processa as lojas em rodadas até o prazo da execução ('deadline.at').
+    
+    A cada rodada, o DeadlineScheduler escolhe as lojas que ainda cabem no
+    tempo restante, pelas latências medidas até então; perto do prazo, as de
+    maior rendimento por segundo vêm primeiro. As lojas que não cabem, e as
+    em andamento quando o prazo termina sem contatos reunidos, são adiadas.
+    
+    Args:
+        run (callable): Executor de cada rodada (run_sequential ou run_pipeline)
+        estimativas (dict): Nome da loja -> (rendimento esperado, pesquisas necessárias)
+        
+    Returns:
+        tuple: (resultados, nomes das lojas adiadas, estado do agendador)
+    """
+    scheduler = DeadlineScheduler(
+        settings.get("deadline.at"),
+        scraping_service.latency,
+        safety_margin=settings.get("deadline.safety_margin_seconds", 60),
+        smoothing=settings.get("deadline.smoothing", 0.3)
+    )
+    rendimentos = {nome: rendimento for nome, (rendimento, _) in estimativas.items()}
+    custos = {nome: custo for nome, (_, custo) in estimativas.items()}
+    round_size = max(1, settings.get("deadline.round_size", 20))
+    
+    pendentes = list(lojas)
+    resultados, adiadas = [], []
+    while pendentes:
+        rodada, descartadas = scheduler.next_round(pendentes, rendimentos, custos, round_size)
+        adiadas.extend(nome for nome, _ in descartadas)
+        if not rodada:
+            logger.warning(f"Prazo esgotado; {len(adiadas)} lojas adiadas")
+            break
+        
+        escolhidas = {nome for nome, _ in rodada} | {nome for nome, _ in descartadas}
+        pendentes = [loja for loja in pendentes if loja[0] not in escolhidas]
+        
+        inicio = time.monotonic()
+        resultados_rodada, adiadas_rodada = run(rodada)
+        scheduler.record_round([r.get('nome_loja') for r in resultados_rodada], custos, time.monotonic() - inicio)
+        resultados.extend(resultados_rodada)
+        
+        # Cota ou prazo esgotados durante a rodada: as lojas restantes ficam para a próxima execução
+        if adiadas_rodada:
+            adiadas.extend(adiadas_rodada)
+            adiadas.extend(nome for nome, _ in pendentes)
+            break
+        
+        logger.info(
+            f"Rodada concluída: {len(resultados)} lojas processadas, {len(pendentes)} pendentes, "
+            f"{scheduler.remaining():.0f}s restantes"
+        )
+    
+    return resultados, adiadas, scheduler.snapshot()
+
+def create_work_queue(settings):
+    """Abre a fila de lojas compartilhada configurada em 'work_queue'."""
+    return SqliteWorkQueue(
+        settings.get("work_queue.path", "resultados/fila/lojas.sqlite"),
+        lease_seconds=settings.get("work_queue.lease_seconds", 300),
+        max_attempts=settings.get("work_queue.max_attempts", 3),
+        retry_delay_seconds=settings.get("work_queue.retry_delay_seconds", 60)
+    )
+
+def run_queue_worker(settings, scraping_service, lojas, batch_size, on_result=log_store_result):
+    """
+    Adiciona as lojas à fila compartilhada e processa lojas retiradas dela.
+    
+    Outras máquinas podem rodar o mesmo comando com o mesmo arquivo de fila:
+    cada loja é processada por um só worker, e as concessões de workers que
+    morrerem voltam à fila ao vencer. As lojas devolvidas por falta de cota
+    continuam pendentes na fila para a próxima execução.
+    
+    Returns:
+        tuple: (resultados de todas as lojas concluídas na fila, lista vazia de adiadas)
+    """
+    work_queue = create_work_queue(settings)
+    work_queue.enqueue(lojas)
+    
+    worker = QueueWorker(
+        scraping_service,
+        work_queue,
+        worker_id=settings.get("work_queue.worker_id") or f"{socket.gethostname()}-{os.getpid()}",
+        batch_size=batch_size,
+        heartbeat_seconds=settings.get("work_queue.heartbeat_seconds", 60),
+        poll_seconds=settings.get("work_queue.poll_seconds", 0),
+        on_result=on_result
+    )
+    worker.run()
+    
+    logger.info(f"Fila: {work_queue.counts()}")
+    for dead in work_queue.dead_letters():
+        logger.warning(f"Loja desistida após {dead['tentativas']} tentativas: '{dead['nome']}' ({dead['erro']})")
+    
+    resultados = work_queue.results()
+    work_queue.close()
+    return resultados, []
+
+def create_store_watchdog(settings):
+    """Cria o watchdog das lojas presas, se habilitado e se há tempo limite por loja."""
+    if not settings.get("watchdog.enabled", True) or not settings.get("scraping.store_timeout", 90):
+        return None
+    
+    return StoreWatchdog(
+        budget=settings.get("scraping.store_timeout", 90),
+        grace=settings.get("watchdog.grace_seconds", 15),
+        interval=settings.get("watchdog.interval_seconds", 1)
+    )
+
+def create_scraping_service(settings, store_repository, quota, phone_registry, url_index):
+    """
+    Monta o ScrapingService e os serviços de que ele depende.
+    
+    Args:
+        settings (Settings): Configurações
+        store_repository (StoreRepository): Repositório de lojas
+        quota (SearchQuotaScheduler): Agendador de cota de pesquisas (ou None)
+        phone_registry: Registro global de telefones (telefone -> loja)
+        url_index: Índice de URLs visitadas (URL -> loja)
+        
+    Returns:
+        ScrapingService: Serviço de scraping configurado
+    """
+    html_fetcher = HtmlFetcher(settings.config.get("scraping", {}), controller=create_concurrency_controller(settings))
     google_search = GoogleSearchService(
         api_key=settings.get("google_api.api_key"),
-        engine_id=settings.get("google_api.engine_id")
+        engine_id=settings.get("google_api.engine_id"),
+        root_url=settings.get("google_api.root_url"),
+        timeout=settings.get("scraping.timeout", 30),
+        cache=create_search_cache(settings),
+        quota=quota,
+        max_pending_revalidations=settings.get("search_cache.max_pending_revalidations", 50)
     )
     
-    # 4. Criar caso de uso para extração de contatos
-    phone_registry = {}  # Registro global para evitar duplicatas
-    contact_extractor = ExtractContactsUseCase(phone_registry)
-    
-    # 5. Criar o Scraper Service
-    scraping_service = ScrapingService(
+    return ScrapingService(
         search_service=google_search,
         html_fetcher=html_fetcher,
-        contact_extractor=contact_extractor,
+        contact_extractor=ExtractContactsUseCase(phone_registry),
         store_repository=store_repository,
-        config=settings
+        config=settings,
+        url_index=url_index,
+        domain_resolver=create_domain_resolver(settings),
+        store_page_miner=create_store_page_miner(settings, html_fetcher),
+        watchdog=create_store_watchdog(settings)
     )
+
+def close_scraping_service(scraping_service):
+    """Libera os recursos persistentes do serviço (cache de domínios adivinhados) e o watchdog."""
+    if scraping_service.domain_resolver is not None:
+        scraping_service.domain_resolver.close()
+    if scraping_service.watchdog is not None:
+        scraping_service.watchdog.stop()
+
+def run_shard(shard, lojas, settings, quota_share=None, known_phones=None, known_urls=None):
+    """
+    Processa as lojas de um shard em um processo próprio (worker do ShardedRunner).
     
-    # 6. Carregar lista de lojas
+    O shard usa registros em memória, iniciados com os itens já conhecidos pelo
+    processo principal, e uma fatia da cota de pesquisas do dia, cujo consumo
+    é gravado a cada pesquisa em `shard_usage_path`.
+    
+    Args:
+        shard (int): Índice do shard
+        lojas (list): Pares (nome da loja, link da loja no Mercado Livre)
+        settings (Settings): Configurações
+        quota_share (dict): Cota restante ('daily_limit'), total de lojas ('stores') e 'qps'
+                            por shard; o shard recebe a fração proporcional às suas lojas
+        known_phones (dict): Telefones já registrados (telefone -> loja)
+        known_urls (dict): URLs já visitadas (URL -> loja)
+        
+    Returns:
+        dict: Saída do shard no formato esperado por ShardedRunner.merge
+    """
+    known_phones = known_phones or {}
+    known_urls = known_urls or {}
+    
+    quota = None
+    if quota_share is not None:
+        quota = SearchQuotaScheduler(
+            shard_usage_path(settings, shard),
+            daily_limit=quota_share["daily_limit"] * len(lojas) // max(1, quota_share["stores"]),
+            qps=quota_share["qps"],
+            reset_timezone=settings.get("quota.reset_timezone", "America/Los_Angeles")
+        )
+    
+    phone_registry = SeenIndex(f"telefones-{shard}")
+    url_index = SeenIndex(f"urls-{shard}")
+    for registry, known in ((phone_registry, known_phones), (url_index, known_urls)):
+        for key, value in known.items():
+            registry[key] = value
+    
+    scraping_service = create_scraping_service(settings, StoreRepository(), quota, phone_registry, url_index)
+    batch_size = max(1, settings.get("search.batch_size", 10))
+    
+    # Cada shard acrescenta ao mesmo journal de checkpoint
+    journal = create_checkpoint_journal(settings)
+    on_result = result_handler(journal)
+    
+    logger.info(f"Shard {shard}: processando {len(lojas)} lojas (pid {os.getpid()})")
+    if settings.get("pipeline.enabled", False):
+        resultados, adiadas = run_pipeline(settings, scraping_service, lojas, batch_size, on_result)
+    else:
+        resultados, adiadas = run_sequential(scraping_service, lojas, batch_size, on_result)
+    close_scraping_service(scraping_service)
+    if journal is not None:
+        journal.close()
+    
+    return {
+        "shard": shard,
+        "results": resultados,
+        "deferred": adiadas,
+        "phones": {key: value for key, value in phone_registry.items() if key not in known_phones},
+        "urls": {key: value for key, value in url_index.items() if key not in known_urls},
+        "report": scraping_service.get_run_report(),
+        "searches_used": quota.used if quota is not None else 0
+    }
+
+def run_sharded(settings, lojas, quota, phone_registry, url_index, journal=None):
+    """
+    Processa as lojas em vários processos e junta resultados e registros.
+    
+    A cota restante do dia (e o limite de consultas por segundo) é dividida
+    entre os shards proporcionalmente ao número de lojas de cada um. Os
+    telefones e URLs novos, já sem conflitos entre shards, são gravados nos
+    registros do processo principal. O consumo de cota de cada shard é lido
+    dos arquivos que ele atualiza a cada pesquisa, inclusive se ele cair. Se algum telefone mudou de loja na junção,
+    os resultados combinados são registrados de novo no journal (vale o último).
+    
+    Returns:
+        tuple: (resultados, nomes das lojas adiadas, relatório somado dos shards)
+    """
+    runner = ShardedRunner(
+        run_shard,
+        shards=settings.get("sharding.shards", 0),
+        strategy=settings.get("sharding.strategy", "hash")
+    )
+    
+    quota_share = None
+    if quota is not None:
+        # Consumo de shards de uma execução anterior que caiu antes de contabilizá-lo
+        recuperadas = collect_shard_usage(settings, quota)
+        if recuperadas:
+            logger.warning(f"{recuperadas} pesquisas de shards de uma execução anterior somadas à cota")
+        quota_share = {
+            "daily_limit": quota.remaining(),
+            "stores": len(lojas),
+            "qps": settings.get("quota.qps", 1.0) / runner.shards
+        }
+    
+    try:
+        merged = runner.run(lojas, worker_args=(settings, quota_share, dict(phone_registry.items()), dict(url_index.items())))
+    finally:
+        if quota is not None:
+            searches_used = collect_shard_usage(settings, quota)
+    
+    for registry, items in ((phone_registry, merged["phones"]), (url_index, merged["urls"])):
+        for key, value in items.items():
+            registry[key] = value
+    if quota is not None:
+        merged["searches_used"] = searches_used
+    if journal is not None and merged["phone_conflicts"]:
+        for resultado in merged["results"]:
+            journal.append(resultado)
+    
+    report = merged["report"]
+    report["phone_conflicts"] = merged["phone_conflicts"]
+    report["searches_used"] = merged["searches_used"]
+    return merged["results"], merged["deferred"], report
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Executa o Scraper Service para a lista de lojas")
+    parser.add_argument(
+        '--deadline',
+        help="Prazo da execução: duração ('90m', '2h', '3600') ou horário ('06:30'). "
+             "As lojas que não couberem no prazo são adiadas para a próxima execução"
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Executa o Scraper Service diretamente para uma lista de lojas"""
+    args = parse_args(argv)
+    logger.info("=== Inicializando Scraper Service ===")
+    
+    # 1. Carregar configurações
+    settings = Settings()
+    if args.deadline:
+        settings.set("deadline.at", parse_deadline(args.deadline))
+        prazo = datetime.datetime.fromtimestamp(settings.get("deadline.at"))
+        logger.info(f"Execução com prazo até {prazo:%Y-%m-%d %H:%M:%S}")
+    
+    # 2. Criar repositório
+    store_repository = StoreRepository()
+    
+    # 3. Registro global para evitar duplicatas, com filtro de Bloom na frente
+    phone_registry = create_seen_index(settings, "telefones")
+    url_index = create_seen_index(settings, "urls")
+    
+    # 4. Criar o Scraper Service (pesquisa, busca de páginas e extração de contatos)
+    scraping_service = create_scraping_service(
+        settings, store_repository, create_quota_scheduler(settings), phone_registry, url_index
+    )
+    google_search = scraping_service.search_service
+    
+    # 5. Carregar lista de lojas
     lojas_para_processar = []
+    links_lojas = {}
     try:
         # Tentar carregar de arquivo JSON
         if os.path.exists("lojas_oficiais_parcial.json"):
             lojas_data = store_repository.load_stores("lojas_oficiais_parcial.json")
             lojas_para_processar = [item.get("nome") for item in lojas_data if "nome" in item]
+            links_lojas = {item.get("nome"): item.get("link") for item in lojas_data if "nome" in item}
         else:
             # Lista manual para testes
             lojas_para_processar = [
@@ -68,28 +700,117 @@ def main():
         logger.error(f"Erro ao carregar lista de lojas: {e}")
         return
     
-    # 7. Processar cada loja
-    resultados = []
+    # 6. Retomar a partir do journal de checkpoint: lojas já concluídas não são processadas de novo
+    ordem_lojas = list(lojas_para_processar)
+    checkpoint_path = settings.get("checkpoint.path", "resultados/checkpoint/contatos.ndjson")
+    journal = create_checkpoint_journal(settings)
+    concluidas = {}
+    if journal is not None:
+        concluidas = CheckpointJournal.read(checkpoint_path)
+        if concluidas:
+            lojas_para_processar = [nome for nome in lojas_para_processar if nome not in concluidas]
+            logger.info(
+                f"Retomando do journal {checkpoint_path}: {len(concluidas)} lojas já concluídas, "
+                f"{len(lojas_para_processar)} restantes"
+            )
+    on_result = result_handler(journal)
     
-    for i, nome_loja in enumerate(lojas_para_processar):
-        logger.info(f"Processando loja {i+1}/{len(lojas_para_processar)}: {nome_loja}")
-        
-        # Executar scraping para a loja
-        resultado = scraping_service.scrape_store(nome_loja)
-        resultados.append(resultado)
+    # 7. Execução incremental: reaproveitar os resultados anteriores ainda válidos
+    arquivo_resultados = "resultados/scraper_service_results.json"
+    anteriores = {}
+    if settings.get("incremental.enabled", False) or settings.get("scheduling.enabled", True):
+        anteriores = load_previous_results(store_repository, arquivo_resultados)
+    if settings.get("incremental.enabled", False):
+        lojas_para_processar = plan_incremental(settings, anteriores, lojas_para_processar)
+    
+    # 8. Incluir as lojas adiadas pela execução anterior (por cota ou prazo, com ou sem
+    # controle de cota) e processar primeiro as lojas de maior rendimento esperado
+    pendentes = [nome for nome in load_deferred_stores(settings, store_repository) if nome not in concluidas]
+    if pendentes:
+        lojas_para_processar = list(dict.fromkeys(pendentes + lojas_para_processar))
+        logger.info(f"{len(pendentes)} lojas adiadas na execução anterior incluídas")
+    
+    prazo = settings.get("deadline.at")
+    estimativas = {}
+    if settings.get("scheduling.enabled", True) or prazo is not None:
+        estimativas = estimate_store_yields(settings, scraping_service, lojas_para_processar, links_lojas, anteriores)
+        lojas_para_processar = prioritize_stores(estimativas)
+    
+    # 9. Ajustar a lista à cota de pesquisas do dia (a ordem acima é mantida dentro de cada prioridade)
+    lojas_adiadas = []
+    if google_search.quota is not None:
+        lojas_para_processar, lojas_adiadas = plan_quota(
+            settings, google_search, lojas_para_processar, pendentes
+        )
+    
+    # 10. Processar cada loja (em sequência, pelo pipeline em etapas, em vários processos ou pela fila compartilhada)
+    lojas = [(nome, links_lojas.get(nome)) for nome in lojas_para_processar]
+    batch_size = max(1, settings.get("search.batch_size", 10))
+    relatorio = None
+    
+    agendamento_prazo = None
+    
+    # Nos modos em vários processos e na fila compartilhada, o prazo só encerra as lojas em andamento
+    if settings.get("sharding.enabled", False):
+        resultados, adiadas_execucao, relatorio = run_sharded(
+            settings, lojas, google_search.quota, phone_registry, url_index, journal
+        )
+    elif settings.get("work_queue.enabled", False):
+        resultados, adiadas_execucao = run_queue_worker(settings, scraping_service, lojas, batch_size, on_result)
+    else:
+        if settings.get("pipeline.enabled", False):
+            run = lambda rodada: run_pipeline(settings, scraping_service, rodada, batch_size, on_result)
+        else:
+            run = lambda rodada: run_sequential(scraping_service, rodada, batch_size, on_result)
         
-        # Opcional: Salvar resultado individual
-        if resultado.get('success', False):
-            logger.info(f"✓ Obtidos dados de contato para '{nome_loja}'")
+        if prazo is not None:
+            resultados, adiadas_execucao, agendamento_prazo = run_with_deadline(
+                settings, scraping_service, lojas, run, estimativas
+            )
         else:
-            logger.warning(f"✗ Falha ao processar '{nome_loja}': {resultado.get('error', 'Erro desconhecido')}")
+            resultados, adiadas_execucao = run(lojas)
+    lojas_adiadas = adiadas_execucao + lojas_adiadas
     
-    # 8. Salvar todos os resultados
+    # 11. Salvar todos os resultados (com journal, compactando-o no arquivo final;
+    # na fila compartilhada, os resultados de todos os workers vêm da própria fila)
     os.makedirs("resultados", exist_ok=True)
-    store_repository.save_stores(resultados, "resultados/scraper_service_results.json")
+    base = anteriores if settings.get("incremental.enabled", False) else {}
+    if journal is not None:
+        journal.close()
+    if journal is not None and not settings.get("work_queue.enabled", False):
+        processados = list(CheckpointJournal.read(checkpoint_path).values())
+        total = CheckpointJournal.compact(checkpoint_path, arquivo_resultados, order=ordem_lojas, base=base)
+        logger.info(f"{total} lojas no arquivo final ({len(resultados)} processadas nesta execução)")
+        
+        # Execução completa: o próximo ciclo começa com um journal novo
+        if not lojas_adiadas and not settings.get("checkpoint.keep_after_completion", False):
+            os.remove(checkpoint_path)
+    else:
+        processados = resultados
+        store_repository.save_stores(merge_results(base, resultados, ordem_lojas), arquivo_resultados)
+    save_deferred_stores(settings, store_repository, lojas_adiadas)
+    
+    # Delta da execução incremental: lojas novas ou com desfecho/contatos diferentes
+    if settings.get("incremental.enabled", False):
+        delta_path = settings.get("incremental.delta_path", "resultados/scraper_service_results.delta.json")
+        delta = IncrementalPlanner.delta(anteriores, processados)
+        store_repository.save_stores(delta, delta_path)
+        logger.info(f"Delta: {len(delta)} lojas novas ou alteradas salvas em '{delta_path}'")
+    
+    # 12. Persistir índices (se configurado)
+    logger.info(f"Índices: {len(phone_registry)} telefones, {len(url_index)} URLs")
+    for index in (phone_registry, url_index):
+        index.close()
+    close_scraping_service(scraping_service)
+    if google_search.cache is not None:
+        logger.info(f"Cache de pesquisas: {google_search.cache.stats}")
+    relatorio = relatorio if relatorio is not None else scraping_service.get_run_report()
+    if agendamento_prazo is not None:
+        relatorio["deadline"] = agendamento_prazo
+    log_run_report(relatorio)
     
     logger.info(f"=== Processamento concluído. {len(resultados)} lojas processadas ===")
-    logger.info("Resultados salvos em 'resultados/scraper_service_results.json'")
+    logger.info(f"Resultados salvos em '{arquivo_resultados}'")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,44 @@
+from benchmarks.bench_extraction import legacy_extract_contact_info
+from domain.services.contact_extraction_core import ContactExtractionCore
+
+TEXT = "Central de atendimento: (11) 3456-7890"
+
+def test_telefone_de_outra_loja_e_descartado():
+    registry = {'1134567890': 'Loja A'}
+
+    result = ContactExtractionCore(registry).extract(TEXT, 'Loja B').to_dict()
+
+    assert result['phones'] == []
+    assert registry == {'1134567890': 'Loja A'}
+
+def test_telefone_ja_registrado_para_a_mesma_loja_e_mantido():
+    """
+    Com o índice persistido (index.persist), o registro sobrevive entre
+    execuções: ao reprocessar uma loja, os telefones dela já estão lá. A
+    regra anterior descartava qualquer número registrado e a loja voltava
+    sem telefones; o núcleo só descarta números atribuídos a outra loja.
+    """
+    registry = {'1134567890': 'Loja A'}
+
+    result = ContactExtractionCore(registry).extract(TEXT, 'Loja A').to_dict()
+    legacy = legacy_extract_contact_info(TEXT, 'Loja A', dict(registry))
+
+    assert result['phones'] == ['(11) 3456-7890']
+    assert legacy['phones'] == []
+
+def test_reprocessar_loja_com_o_mesmo_registro_preserva_telefones():
+    registry = {}
+    core = ContactExtractionCore(registry)
+
+    first = core.extract(TEXT, 'Loja A').to_dict()
+    second = core.extract(TEXT, 'Loja A').to_dict()
+
+    assert first['phones'] == second['phones'] == ['(11) 3456-7890']
+
+def test_documentos_so_aceitam_digitos_ascii():
+    text = "CNPJ ١١.٢٢٢.٣٣٣/٠٠٠١-٨١ e １１２２２３３３０００１８１; CNPJ 11.222.333/0001-81, CEP ０１３１０-１００"
+
+    result = ContactExtractionCore({}).extract(text, 'Loja A').to_dict()
+
+    assert result['cnpjs'] == ['11.222.333/0001-81']
+    assert result['ceps'] == []
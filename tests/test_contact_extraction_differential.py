@@ -0,0 +1,37 @@
+"""
+Teste diferencial do núcleo de extração de contatos.
+
+Compara a implementação de referência de benchmarks/bench_extraction.py com
+o núcleo e seus dois adaptadores sobre o corpus de `resultados/` (quando
+existir) mais os documentos sintéticos de CNPJ e CEP.
+"""
+import os
+
+import pytest
+
+from benchmarks.bench_extraction import (
+    SYNTHETIC_DOCUMENTS, load_corpus, run_core, run_legacy, run_usecase, run_utils
+)
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'resultados')
+
+@pytest.fixture(scope='module')
+def documents():
+    return load_corpus(CORPUS_DIR)
+
+@pytest.fixture(scope='module')
+def expected(documents):
+    return run_legacy(documents)
+
+@pytest.mark.parametrize('runner', [run_core, run_usecase, run_utils], ids=['nucleo', 'usecase', 'utils'])
+def test_saida_identica_a_referencia(runner, documents, expected):
+    actual = runner(documents)
+
+    mismatches = [name for (name, _), old, new in zip(documents, expected, actual) if old != new]
+    assert mismatches == []
+
+def test_documentos_sinteticos_exercitam_cnpj_e_cep():
+    output = run_legacy(SYNTHETIC_DOCUMENTS)
+
+    assert any(result['cnpjs'] for result in output)
+    assert any(result['ceps'] for result in output)